@@ -0,0 +1,102 @@
+"""
+Memory benchmark for the compact ColumnBatch representation of src/loader/DataGenerator.py.
+
+Generates real Operations and Work Orders for enough of a fleet to yield about --records Maintenance Records, then
+measures with tracemalloc:
+
+    1. the peak memory of generating all Maintenance Record shards as ColumnBatches and the size of the batches held,
+    2. the peak memory of materializing the same records as upsert dicts (with --compare-dicts).
+
+Both are reported per million Maintenance Records. No C3 server is needed; only the shard generators are exercised.
+
+Usage:
+    python benchmark/column_batch_memory_benchmark.py [--records 1000000] [--compare-dicts]
+"""
+import argparse
+import importlib.util
+import os
+import time
+import tracemalloc
+
+DATA_GENERATOR_PATH = os.path.join(os.path.dirname(__file__), "..", "src", "loader", "DataGenerator.py")
+
+def load_data_generator():
+    spec = importlib.util.spec_from_file_location("DataGenerator", DATA_GENERATOR_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def generate_work_order_batches(data_generator, scale):
+    """Runs the Operation and vectorized Work Order shards for a scale factor and returns the Work Order ColumnBatches."""
+    import numpy as np
+
+    # The Operations of a load started today; there is no stored start date to resolve without a C3 server
+    start_date = data_generator.START_DATE
+    end_date = data_generator._end_date(start_date)
+
+    operation_alerts = []
+    for shard_args in data_generator._operation_shards(scale, start_date, end_date):
+        for operation in data_generator._generate_operation_shard(*shard_args):
+            if operation["alerts"]:
+                operation_alerts.append((operation["aircraft"], operation["alerts"], operation["startDate"]))
+
+    batches = []
+    num_work_orders = 0
+    for shard_index, shard_alerts in enumerate(data_generator._chunks(operation_alerts, data_generator.WORK_ORDER_SHARD_SIZE)):
+        batch = data_generator._generate_work_order_shard(shard_index, shard_alerts, True, end_date)
+        ids = np.arange(num_work_orders + 1, num_work_orders + len(batch) + 1, dtype=np.uint32)
+        num_work_orders += ids.size
+        batches.append(batch.with_column("id", ids, first=True, id_prefix="WORK-ORDER-"))
+
+    return batches
+
+def mb(num_bytes):
+    return num_bytes / (1024 * 1024)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=1000000, help="Approximate number of Maintenance Records")
+    parser.add_argument("--compare-dicts", action="store_true", help="Also materialize the records as dicts")
+    args = parser.parse_args()
+
+    data_generator = load_data_generator()
+    scale = args.records / data_generator.NUM_MAINTENANCE_RECORDS
+
+    start = time.perf_counter()
+    work_order_batches = generate_work_order_batches(data_generator, scale)
+    print(f"Generated {sum(len(batch) for batch in work_order_batches)} Work Orders at scale {scale:.2f} "
+          f"in {time.perf_counter() - start:.1f}s")
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    start = time.perf_counter()
+    chunks = data_generator._column_batch_chunks(work_order_batches, data_generator.MAINTENANCE_RECORD_SHARD_SIZE)
+    batches = [data_generator._generate_maintenance_record_shard(shard_index, chunk, True) for shard_index, chunk in enumerate(chunks)]
+    elapsed = time.perf_counter() - start
+
+    num_records = sum(len(batch) for batch in batches)
+    held = sum(batch.nbytes() for batch in batches)
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    per_million = 1e6 / num_records
+
+    print(f"{'representation':>20} {'records':>9} {'seconds':>8} {'held MB':>9} {'peak MB':>9} {'held MB/1M':>11} {'peak MB/1M':>11}")
+    print(f"{'ColumnBatch':>20} {num_records:>9} {elapsed:>8.2f} {mb(held):>9.1f} {mb(peak):>9.1f} "
+          f"{mb(held) * per_million:>11.1f} {mb(peak) * per_million:>11.1f}")
+
+    if args.compare_dicts:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+
+        start = time.perf_counter()
+        records = list(data_generator._records_from_column_batches(batches))
+        elapsed = time.perf_counter() - start
+
+        held = tracemalloc.get_traced_memory()[0] - baseline
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+
+        print(f"{'dicts':>20} {len(records):>9} {elapsed:>8.2f} {mb(held):>9.1f} {mb(peak):>9.1f} "
+              f"{mb(held) * per_million:>11.1f} {mb(peak) * per_million:>11.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Benchmark for DataGenerator.createAllData against an in-memory fake of the c3 Type API (see fake_c3.py).
+
+Runs every stage of createAllData for several scale factors and prints, per stage, the records generated, the
+throughput in records per second, the peak RSS of the process and the allocations made by the stage: the change in
+allocated memory blocks and the number of generation 0 garbage collections it triggered. With --latency the fake
+Types sleep on every call, so the concurrency of the upsert engine shows up in the numbers like it would against a
+server.
+
+The fake keeps only a count of the Aircraft, Operations, Work Orders and Maintenance Records (COUNT_ONLY_TYPES), so
+the peak RSS is that of the generator rather than of an in-memory copy of the dataset. --keep-records keeps them, e.g.
+to inspect the generated data.
+
+With --pipeline the benchmark also times whole createAllData runs per scale, once with the stages in sequence and
+once pipelined along the stage DAG. A pipelined run cannot generate shards on a process pool, so both runs generate
+in this process whatever --processes is.
+
+Usage:
+    python benchmark/data_generator_benchmark.py [--scales 0.5,1,2] [--vectorized] [--processes 4]
+                                                 [--latency-ms 0] [--latency-per-record-us 0] [--tracemalloc]
+                                                 [--pipeline] [--keep-records]
+"""
+import argparse
+import gc
+import importlib.util
+import os
+import resource
+import sys
+import time
+
+from fake_c3 import FakeC3
+
+# Types the fake only counts: the generated collections, which no stage of a fresh load reads back
+COUNT_ONLY_TYPES = ("Aircraft", "Operation", "WorkOrder", "MaintenanceRecord")
+
+DATA_GENERATOR_PATH = os.path.join(os.path.dirname(__file__), "..", "src", "loader", "DataGenerator.py")
+
+def load_data_generator():
+    spec = importlib.util.spec_from_file_location("DataGenerator", DATA_GENERATOR_PATH)
+    module = importlib.util.module_from_spec(spec)
+    # Registered so that the shard functions can be pickled for the process pool with --processes
+    sys.modules["DataGenerator"] = module
+    spec.loader.exec_module(module)
+    return module
+
+def peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def run_stages(data_generator, scale, vectorized, processes):
+    """Runs the stages of createAllData in order, sharing a GenerationContext like createAllData does."""
+    context = data_generator.GenerationContext()
+    c3 = data_generator.c3
+
+    stages = [
+        ("Base", c3.Base, lambda: data_generator.createBaseData(None)),
+        ("Operation", c3.Operation, lambda: data_generator.createOperationData(None, scale, processes, context=context)),
+        ("Aircraft", c3.Aircraft, lambda: data_generator.createAircraftData(None, scale, processes, context=context)),
+        ("WorkOrder", c3.WorkOrder, lambda: data_generator.createWorkOrderData(None, scale, vectorized, processes, context=context)),
+        ("MaintenanceRecord", c3.MaintenanceRecord,
+         lambda: data_generator.createMaintenanceRecordData(None, scale, vectorized, processes, context=context)),
+    ]
+
+    for name, Type, stage in stages:
+        gc.collect()
+        gen0_collections = gc.get_stats()[0]["collections"]
+        allocated_blocks = sys.getallocatedblocks()
+        num_calls = Type.num_calls
+
+        start = time.perf_counter()
+        message = stage()
+        elapsed = time.perf_counter() - start
+
+        yield {
+            "stage": name,
+            "records": Type.size(),
+            "seconds": elapsed,
+            "calls": Type.num_calls - num_calls,
+            "peak_rss_mb": peak_rss_mb(),
+            "allocated_blocks": sys.getallocatedblocks() - allocated_blocks,
+            "gen0_collections": gc.get_stats()[0]["collections"] - gen0_collections,
+            "message": message
+        }
+
+def time_create_all_data(data_generator, scale, vectorized, processes, sequential):
+    """Returns the wall time of one createAllData run."""
+    start = time.perf_counter()
+    data_generator.createAllData(None, scale, vectorized, processes, sequential=sequential)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", default="0.5,1,2", help="Comma-separated scale factors")
+    parser.add_argument("--vectorized", action="store_true", help="Generate Work Orders and Maintenance Records with NumPy")
+    parser.add_argument("--processes", type=int, default=None, help="Worker processes for shard generation")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Latency added to every fake Type call")
+    parser.add_argument("--latency-per-record-us", type=float, default=0.0, help="Latency added per record of a call")
+    parser.add_argument("--tracemalloc", action="store_true", help="Also report the peak traced Python memory (slow)")
+    parser.add_argument("--pipeline", action="store_true", help="Also compare sequential and pipelined createAllData runs")
+    parser.add_argument("--keep-records", action="store_true", help="Keep the records of every Type in the fake")
+    args = parser.parse_args()
+
+    count_only = () if args.keep_records else COUNT_ONLY_TYPES
+
+    data_generator = load_data_generator()
+
+    if args.tracemalloc:
+        import tracemalloc
+        tracemalloc.start()
+
+    print(f"{'scale':>6} {'stage':>18} {'records':>9} {'seconds':>8} {'records/sec':>12} {'calls':>6} "
+          f"{'peak RSS MB':>12} {'alloc blocks':>13} {'gen0 GCs':>9}" + (f" {'traced MB':>10}" if args.tracemalloc else ""))
+
+    for scale in (float(s) for s in args.scales.split(",")):
+        data_generator.c3 = FakeC3(latency=args.latency_ms / 1000, latency_per_record=args.latency_per_record_us / 1e6,
+                                   count_only=count_only)
+
+        for result in run_stages(data_generator, scale, args.vectorized, args.processes):
+            line = (f"{scale:>6g} {result['stage']:>18} {result['records']:>9} {result['seconds']:>8.2f} "
+                    f"{result['records'] / result['seconds']:>12.0f} {result['calls']:>6} {result['peak_rss_mb']:>12.1f} "
+                    f"{result['allocated_blocks']:>13} {result['gen0_collections']:>9}")
+
+            if args.tracemalloc:
+                line += f" {tracemalloc.get_traced_memory()[1] / (1024 * 1024):>10.1f}"
+                tracemalloc.reset_peak()
+
+            print(line)
+
+            if result["message"].startswith("Warning"):
+                print(f"{'':>6} {result['message']}")
+
+    if args.pipeline:
+        print(f"\n{'scale':>6} {'sequential s':>13} {'pipelined s':>12} {'speedup':>8}")
+
+        for scale in (float(s) for s in args.scales.split(",")):
+            seconds = {}
+            for sequential in (True, False):
+                data_generator.c3 = FakeC3(latency=args.latency_ms / 1000, latency_per_record=args.latency_per_record_us / 1e6,
+                                           count_only=count_only)
+                seconds[sequential] = time_create_all_data(data_generator, scale, args.vectorized, None, sequential)
+
+            print(f"{scale:>6g} {seconds[True]:>13.2f} {seconds[False]:>12.2f} {seconds[True] / seconds[False]:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+"""
+In-memory stand-in for the c3 Type API used by src/loader/DataGenerator.py.
+
+FakeC3 exposes one FakeType per entity of the data model as an attribute, like the global c3 object of the py-server
+runtime. A FakeType keeps its records in a dict keyed by id and implements the subset of the Type API the
+generator calls: fetchCount, fetch, upsert, upsertBatch, removeBatch and clearCollection, along with the grouped
+counts of evaluate that FleetMetrics.countBy makes ("<field>, count()" grouped by the field).
+Filters support the expressions the generator builds: comparisons joined by &&, dateTime('...') literals, dotted
+reference paths and intersects(field, [...]), along with the quoted dates and multi-field orders of the UI's
+queries.
+
+The Types named in count_only keep only a count of their records, so that a benchmark's memory figures show the
+generator rather than the fake store. Upserts add to the count (every upserted id is taken to be new) and removes
+subtract from it; only an unfiltered fetchCount can be answered, any other read raises NotImplementedError.
+
+Every call can be slowed down by a fixed latency plus a per-record latency, to stand in for a remote server. The
+latency is a sleep, so it releases the GIL like a network call would.
+
+Usage:
+    data_generator.c3 = FakeC3(latency=0.005, latency_per_record=0.00001, count_only=("MaintenanceRecord",))
+"""
+import json
+import re
+import threading
+import time
+from types import SimpleNamespace
+
+TYPE_NAMES = ["Base", "Aircraft", "Operation", "WorkOrder", "MaintenanceRecord", "DataGeneratorBatch",
+              "AircraftStatusRollup", "OperationStatusRollup"]
+
+# Field name -> name of the referenced Type, for every reference field of the data model
+REFERENCE_FIELDS = {
+    "aircraft": "Aircraft",
+    "base": "Base",
+    "location": "Base",
+    "origin": "Base",
+    "destination": "Base",
+    "workOrder": "WorkOrder"
+}
+
+_COMPARISON = re.compile(r"([\w.]+) (==|!=|>=|<=|<|>) (.*)$")
+_INTERSECTS = re.compile(r"intersects\(([\w.]+), (\[.*\])\)$")
+_ORDER = re.compile(r"(ascending|descending)\((\w+)\)")
+
+def _unwrap(clause):
+    """Strips parentheses enclosing a whole clause, e.g. "(status == 'OPEN')"."""
+    while clause.startswith("("):
+        depth = 0
+        for index, char in enumerate(clause):
+            depth += {"(": 1, ")": -1}.get(char, 0)
+            if depth == 0:
+                break
+
+        if index != len(clause) - 1:
+            return clause
+
+        clause = clause[1:-1].strip()
+
+    return clause
+
+def _cell(value):
+    """Wraps a value in an evaluate result cell, under the field of its type."""
+    if value is None:
+        return SimpleNamespace()
+    if isinstance(value, bool):
+        return SimpleNamespace(bool=value)
+    if isinstance(value, int):
+        return SimpleNamespace(long=value)
+    if isinstance(value, float):
+        return SimpleNamespace(dbl=value)
+    if isinstance(value, str):
+        return SimpleNamespace(str=value)
+
+    return SimpleNamespace(date=value)
+
+class FakeType:
+    def __init__(self, c3, name, latency=0.0, latency_per_record=0.0, count_only=False):
+        self._c3 = c3
+        self._name = name
+        self.latency = latency
+        self.latency_per_record = latency_per_record
+        self.count_only = count_only
+        self.data = {}
+        self._count = 0
+        self.num_calls = 0
+        self._num_auto_ids = 0
+        self._lock = threading.Lock()
+
+    def name(self):
+        return self._name
+
+    def size(self):
+        """Returns the number of records held, without counting as a call."""
+        return self._count if self.count_only else len(self.data)
+
+    def fetchCount(self, spec=None):
+        self._wait(0)
+        if self.count_only:
+            if (spec or {}).get("filter"):
+                self._count_only_read()
+            return self._count
+
+        return sum(1 for record in self.data.values() if self._matches(record, (spec or {}).get("filter")))
+
+    def fetch(self, spec=None):
+        if self.count_only:
+            self._count_only_read()
+
+        spec = spec or {}
+        rows = [record for record in self.data.values() if self._matches(record, spec.get("filter"))]
+
+        # Orders like "ascending(startDate), ascending(endDate)" sort by the last key first
+        for direction, field in reversed(_ORDER.findall(spec.get("order") or "")):
+            rows.sort(key=lambda record: record.get(field), reverse=direction == "descending")
+
+        limit = spec.get("limit", 2000)
+        if limit not in (None, -1):
+            offset = spec.get("offset", 0)
+            rows = rows[offset:offset + limit]
+
+        self._wait(len(rows))
+        return SimpleNamespace(objs=[self._to_obj(record) for record in rows], count=len(rows))
+
+    def evaluate(self, spec):
+        if self.count_only:
+            self._count_only_read()
+
+        field = spec["group"]
+        if spec["projection"].replace(" ", "") != f"{field},count()":
+            raise NotImplementedError(f"The fake only evaluates grouped counts, not {spec['projection']!r}.")
+
+        counts = {}
+        for record in self.data.values():
+            if self._matches(record, spec.get("filter")):
+                value = self._resolve(record, field)
+                counts[value] = counts.get(value, 0) + 1
+
+        self._wait(len(counts))
+        return SimpleNamespace(tuples=[SimpleNamespace(cells=[_cell(value), SimpleNamespace(long=count)])
+                                       for value, count in counts.items()])
+
+    def upsert(self, record):
+        return self.upsertBatch([record])[0]
+
+    def upsertBatch(self, records):
+        self._wait(len(records))
+
+        with self._lock:
+            if self.count_only:
+                self._count += len(records)
+                return records
+
+            for record in records:
+                if record.get("id") is None:
+                    self._num_auto_ids += 1
+                    record = dict(record, id=f"{self._name}-{self._num_auto_ids}")
+                self.data[record["id"]] = record
+
+        return records
+
+    def removeBatch(self, records):
+        self._wait(len(records))
+
+        with self._lock:
+            if self.count_only:
+                self._count = max(0, self._count - len(records))
+                return
+
+            for record in records:
+                self.data.pop(record["id"], None)
+
+    def removeAll(self, filter=None):
+        if self.count_only and filter:
+            self._count_only_read()
+
+        with self._lock:
+            self._count = 0
+            for record_id in [record_id for record_id, record in self.data.items() if self._matches(record, filter)]:
+                del self.data[record_id]
+
+    def clearCollection(self, *args):
+        self._wait(0)
+        self.data.clear()
+        self._count = 0
+
+    def _count_only_read(self):
+        raise NotImplementedError(f"The fake {self._name} Type only keeps a count of its records. Keep its records "
+                                  "(count_only) to read them.")
+
+    def _wait(self, num_records):
+        with self._lock:
+            self.num_calls += 1
+
+        delay = self.latency + self.latency_per_record * num_records
+        if delay:
+            time.sleep(delay)
+
+    def _to_obj(self, record):
+        fields = {}
+        for field, value in record.items():
+            if field in REFERENCE_FIELDS and isinstance(value, str):
+                value = SimpleNamespace(id=value)
+            elif field in REFERENCE_FIELDS and isinstance(value, dict):
+                value = SimpleNamespace(id=value.get("id"))
+            fields[field] = value
+
+        return SimpleNamespace(**fields)
+
+    def _resolve(self, record, path):
+        *references, field = path.split(".")
+
+        for reference in references:
+            value = record.get(reference)
+            reference_id = value.get("id") if isinstance(value, dict) else value
+            record = getattr(self._c3, REFERENCE_FIELDS[reference]).data.get(reference_id, {})
+
+        value = record.get(field)
+        return value.get("id") if isinstance(value, dict) else value
+
+    def _matches(self, record, filter):
+        if not filter:
+            return True
+
+        import pandas as pd
+
+        for clause in filter.split("&&"):
+            clause = _unwrap(clause.strip())
+
+            match = _INTERSECTS.match(clause)
+            if match:
+                if self._resolve(record, match.group(1)) not in json.loads(match.group(2)):
+                    return False
+                continue
+
+            field, operator, literal = _COMPARISON.match(clause).groups()
+            value = self._resolve(record, field)
+
+            if literal.startswith("dateTime("):
+                literal = pd.Timestamp(literal[len("dateTime('"):-2])
+                value = pd.Timestamp(value) if value is not None else None
+            elif literal.startswith(("'", '"')):
+                literal = literal[1:-1]
+                # Dates compared with a quoted day, e.g. "startDate >= '2024-01-01'"
+                if hasattr(value, "year"):
+                    literal = pd.Timestamp(literal)
+                    value = pd.Timestamp(value)
+            elif literal in ("true", "false"):
+                literal = literal == "true"
+            else:
+                literal = float(literal)
+
+            if value is None:
+                return False
+
+            if not {
+                "==": value == literal, "!=": value != literal,
+                ">=": value >= literal, "<=": value <= literal,
+                ">": value > literal, "<": value < literal
+            }[operator]:
+                return False
+
+        return True
+
+class FakeC3:
+    def __init__(self, latency=0.0, latency_per_record=0.0, type_names=TYPE_NAMES, count_only=()):
+        for name in type_names:
+            setattr(self, name, FakeType(self, name, latency, latency_per_record, name in count_only))
+
+    def types(self):
+        return [value for value in vars(self).values() if isinstance(value, FakeType)]
@@ -0,0 +1,55 @@
+"""
+Benchmark for the Operation simulation loop in src/loader/DataGenerator.py.
+
+Runs _simulate_operations with a FleetScheduler for several fleet sizes and horizons and prints the simulated
+operations per second. No C3 server is needed; only the simulation is exercised.
+
+Usage:
+    python benchmark/fleet_scheduler_benchmark.py [--fleets 500,10000,100000] [--years 1,3]
+"""
+import argparse
+import importlib.util
+import os
+import random
+import time
+from datetime import date
+
+DATA_GENERATOR_PATH = os.path.join(os.path.dirname(__file__), "..", "src", "loader", "DataGenerator.py")
+
+def load_data_generator():
+    spec = importlib.util.spec_from_file_location("DataGenerator", DATA_GENERATOR_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def run_simulation(data_generator, num_aircrafts, years):
+    scale = num_aircrafts / data_generator.NUM_AIRCRAFTS
+    max_daily_operations = data_generator._scaled_count(data_generator.MAX_DAILY_OPERATIONS, scale)
+    start_date = date(2025, 1, 1)
+    end_date = date(start_date.year + years, 1, 1)
+
+    scheduler = data_generator.FleetScheduler(f"AIRCRAFT-{i}" for i in range(1, num_aircrafts + 1))
+    rng = random.Random(data_generator.SEED)
+
+    start = time.perf_counter()
+    num_operations = sum(1 for _ in data_generator._simulate_operations(scheduler, start_date, end_date, max_daily_operations, rng))
+    elapsed = time.perf_counter() - start
+
+    return num_operations, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fleets", default="500,10000,100000", help="Comma-separated fleet sizes")
+    parser.add_argument("--years", default="1,3", help="Comma-separated simulation horizons in years")
+    args = parser.parse_args()
+
+    data_generator = load_data_generator()
+
+    print(f"{'aircraft':>10} {'years':>6} {'operations':>12} {'seconds':>9} {'ops/sec':>12}")
+    for num_aircrafts in (int(n) for n in args.fleets.split(",")):
+        for years in (int(y) for y in args.years.split(",")):
+            num_operations, elapsed = run_simulation(data_generator, num_aircrafts, years)
+            print(f"{num_aircrafts:>10} {years:>6} {num_operations:>12} {elapsed:>9.2f} {num_operations / elapsed:>12.0f}")
+
+if __name__ == "__main__":
+    main()
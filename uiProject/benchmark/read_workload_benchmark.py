@@ -0,0 +1,66 @@
+"""
+Benchmark for DataGenerator.replayReadWorkload against an in-memory fake of the c3 Type API (see fake_c3.py).
+
+Generates the data of createAllData at a scale factor, then replays the UI's read queries against it at every target
+rate and prints, per rate and query shape, the latency percentiles, along with the achieved rate and the lag between
+the scheduled and actual start of the queries. With --latency the fake Types sleep on every call, so the concurrency
+of the replay shows up in the numbers like it would against a server.
+
+The fake scans every record for every query, so its latencies grow with the scale like a store without indexes would.
+FleetMetrics.countBy runs in process (src/metrics/FleetMetrics.py) against the same fake.
+
+Usage:
+    python benchmark/read_workload_benchmark.py [--scale 1] [--queries 1000] [--rates 25,50,100] [--concurrency 8]
+                                                [--seed 0] [--latency-ms 0] [--latency-per-record-us 0]
+"""
+import argparse
+import importlib.util
+import os
+from types import SimpleNamespace
+
+from data_generator_benchmark import load_data_generator
+from fake_c3 import FakeC3
+
+FLEET_METRICS_PATH = os.path.join(os.path.dirname(__file__), "..", "src", "metrics", "FleetMetrics.py")
+
+def attach_fleet_metrics(c3):
+    """Exposes FleetMetrics.countBy on the fake c3, running against the fake's Types."""
+    spec = importlib.util.spec_from_file_location("FleetMetrics", FLEET_METRICS_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.c3 = c3
+    c3.FleetMetrics = SimpleNamespace(countBy=lambda *args: module.countBy(None, *args))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1.0, help="Scale factor of the generated data")
+    parser.add_argument("--queries", type=int, default=1000, help="Queries per replay")
+    parser.add_argument("--rates", default="25,50,100", help="Comma-separated target rates in queries per second, 0 for unpaced")
+    parser.add_argument("--concurrency", type=int, default=8, help="Queries in flight at most")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the query mix")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Latency added to every fake Type call")
+    parser.add_argument("--latency-per-record-us", type=float, default=0.0, help="Latency added per record of a call")
+    args = parser.parse_args()
+
+    data_generator = load_data_generator()
+    data_generator.c3 = FakeC3()
+    attach_fleet_metrics(data_generator.c3)
+    data_generator.createAllData(None, args.scale, sequential=True)
+
+    for Type in data_generator.c3.types():
+        Type.latency = args.latency_ms / 1000
+        Type.latency_per_record = args.latency_per_record_us / 1e6
+
+    print(f"{'rate':>6} {'achieved':>9} {'lag p95':>8} {'shape':>18} {'queries':>8} {'errors':>7} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+
+    for rate in (float(r) for r in args.rates.split(",")):
+        report = data_generator.replayReadWorkload(None, args.queries, rate, args.concurrency, args.seed)
+
+        for shape in report["shapes"]:
+            print(f"{rate:>6g} {report['achieved_rate']:>9} {report['lag']['p95'] * 1000:>8.1f} {shape['shape']:>18} "
+                  f"{shape['queries']:>8} {shape['errors']:>7} {shape['p50'] * 1000:>8.1f} {shape['p95'] * 1000:>8.1f} "
+                  f"{shape['p99'] * 1000:>8.1f} {shape['max'] * 1000:>8.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -1,56 +1,1906 @@
+import json
+import logging
+import pickle
 import random
-from datetime import date
+import tempfile
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import date, timedelta
 from dateutil.relativedelta import relativedelta
 import string
-from collections import deque
-import bisect
+import heapq
+from itertools import islice
+
+_logger = logging.getLogger("DataGenerator")
 
 
 '''
-    Seeded Random Object for Pseudo-Random Data Generation
+    Seeded Random Streams for Pseudo-Random Data Generation
+
+    Every shard of every stage draws from its own stream, derived from SEED, the stream name (e.g. "WorkOrder") and
+    the shard index. The output therefore does not depend on the order in which stages or shards are run, which lets
+    shards be generated in parallel with the same result as a single-process run.
 '''
 SEED = 42
-_random = random.Random(SEED)
+
+def _shard_rng(stream, shard_index):
+    """Returns the random.Random for one shard of a stage."""
+    return random.Random(f"{SEED}:{stream}:{shard_index}")
+
+def _numpy_rng(stream, shard_index):
+    """Returns the NumPy Generator for one shard of a stage in the vectorized generation mode."""
+    import numpy as np
+
+    return np.random.default_rng([SEED, zlib.crc32(stream.encode()), shard_index])
 
 '''
-    Utility Functions
+    Upsert Engine Settings
+'''
+UPSERT_BATCH_SIZE = 1000
+UPSERT_MAX_IN_FLIGHT = 4
+UPSERT_MAX_RETRIES = 3
+UPSERT_BACKOFF_SECONDS = 0.5
+
+# Batch sizes pinned per Type name (e.g. {"MaintenanceRecord": 750}). Types not listed use UPSERT_BATCH_SIZE.
+UPSERT_BATCH_SIZES = {}
+
+# Adaptive batch sizing: grow or shrink each Type's batch size to hit a target upsertBatch latency. This is the
+# default of the adaptive argument of the Type methods.
+UPSERT_ADAPTIVE_BATCHING = False
+UPSERT_TARGET_LATENCY_SECONDS = 2.0
+UPSERT_MIN_BATCH_SIZE = 50
+UPSERT_MAX_BATCH_SIZE = 10000
+UPSERT_MAX_PAYLOAD_BYTES = 8 * 1024 * 1024
+# Records JSON-encoded to estimate the payload bytes of an upsertBatch call
+PAYLOAD_SAMPLE_SIZE = 16
+# upsertBatch calls an adaptive run must observe before it reports the size it settled on
+UPSERT_ADAPTIVE_MIN_CALLS = 5
+
+# Page size for reading the stored records back in the diff mode
+DIFF_PAGE_SIZE = 2000
+
+# Page size for reading stored collections when a stage runs on its own
+READ_PAGE_SIZE = 2000
+
+# Load verification: "count" compares the stored count with the generated one, "sample" and "full" compare the
+# checksums of sampled or all id ranges (see LoadChecksum)
+VERIFY_MODES = ("count", "sample", "full")
+VERIFY_BUCKET_SIZE = 1000
+VERIFY_SAMPLE_BUCKETS = 8
+
+'''
+    UpsertResult Class
+    Summary of a single UpsertEngine run, used by the Type methods to report on an ingest.
+'''
+class UpsertResult:
+    def __init__(self, type_name):
+        self.type_name = type_name
+        self.num_records = 0
+        self.num_upserted = 0
+        self.num_batches = 0
+        self.num_retries = 0
+        self.num_skipped = 0
+        self.failed_batches = []
+        self.batch_sizer = None
+
+    def annotate(self, message):
+        """
+        Append run details to a Type method's message: the records skipped by a resumed load, and the batch size an
+        adaptive run settled on, so it can be pinned in UPSERT_BATCH_SIZES.
+        """
+        if self.num_skipped:
+            message = f"{message} (resumed: {self.num_skipped} records were already loaded)"
+
+        if self.batch_sizer is None:
+            return message
+
+        sizer = self.batch_sizer
+        if sizer.num_calls < UPSERT_ADAPTIVE_MIN_CALLS:
+            return f"{message} (adaptive batch size not settled after {sizer.num_calls} upsertBatch calls)"
+
+        return (f"{message} (adaptive batch size settled at {sizer.size}, "
+                f"mean latency {sizer.mean_latency():.2f}s, error rate {sizer.error_rate():.1%})")
+
+    def failure_message(self):
+        """Describe the batches that failed permanently, or return None if every batch was upserted."""
+        if not self.failed_batches:
+            return None
+
+        details = "; ".join(
+            f"batch {b['batch_index']} ({b['num_records']} records, ids {b['first_id']}..{b['last_id']}): {b['error']}"
+            for b in self.failed_batches
+        )
+        return f"Warning: {len(self.failed_batches)} of {self.num_batches} {self.type_name} batches failed permanently. {details}"
+
+'''
+    LoadReport Class
+    Instrumentation of a createAllData run, filled in by the stages, the sinks and the UpsertEngine.
+
+    Every stage is reported under the name of its Type, with the time spent in each phase:
+
+        generate    producing the records: the generator, shard workers included, as seen by the thread cutting batches
+        serialize   writing the records out in a file sink
+        upsert      upsertBatch round-trips, summed over the batches in flight, the encoding of the payload included
+        wait        the thread cutting batches blocked on a full pipeline
+        verify      the count check once the stage is loaded
+
+    along with a histogram of the upsertBatch latencies, retries, estimated payload bytes (see
+    _estimate_payload_bytes), throughput and the peak RSS of the process at the end of the stage. The writes of a
+    stage's rollup are reported under the stage, so its records include the rollup records. upsert runs on the
+    engine's worker threads, so phases can add up to more than the stage's wall time.
 '''
+class LoadReport:
+    LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    PHASES = ("generate", "serialize", "upsert", "wait", "verify")
+
+    def __init__(self):
+        self.stages = {}
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+
+    def stage(self, name):
+        """Returns the stats of a stage, creating them on first use."""
+        with self._lock:
+            if name not in self.stages:
+                self.stages[name] = {
+                    "stage": name,
+                    "records": 0,
+                    "seconds": 0.0,
+                    "phases": {phase: 0.0 for phase in self.PHASES},
+                    "batches": 0,
+                    "retries": 0,
+                    "failed_batches": 0,
+                    "estimated_payload_bytes": 0,
+                    "latencies": []
+                }
+
+            return self.stages[name]
+
+    def add_phase(self, name, phase, seconds):
+        stats = self.stage(name)
+        with self._lock:
+            stats["phases"][phase] += seconds
+
+    def add_batch(self, name, latency, payload_bytes):
+        stats = self.stage(name)
+        with self._lock:
+            stats["latencies"].append(latency)
+            stats["estimated_payload_bytes"] += payload_bytes
+
+    def add_result(self, name, upsert_result):
+        stats = self.stage(name)
+        with self._lock:
+            stats["records"] += upsert_result.num_records
+            stats["batches"] += upsert_result.num_batches
+            stats["retries"] += upsert_result.num_retries
+            stats["failed_batches"] += len(upsert_result.failed_batches)
+
+    def timed_stage(self, name, stage_fn):
+        """Runs a stage, recording its wall time and the peak RSS of the process once it is done."""
+        start = time.perf_counter()
+        try:
+            return stage_fn()
+        finally:
+            stats = self.stage(name)
+            stats["seconds"] += time.perf_counter() - start
+            stats["peak_rss_mb"] = _peak_rss_mb()
+
+    def to_dict(self, message=None):
+        stages = []
+        for stats in self.stages.values():
+            latencies = sorted(stats["latencies"])
+            stage = {key: value for key, value in stats.items() if key != "latencies"}
+            stage["seconds"] = round(stats["seconds"], 3)
+            stage["phases"] = {phase: round(seconds, 3) for phase, seconds in stats["phases"].items()}
+            stage["records_per_second"] = round(stats["records"] / stats["seconds"], 1) if stats["seconds"] else None
+            stage["latency"] = {
+                "p50": _percentile(latencies, 0.5),
+                "p95": _percentile(latencies, 0.95),
+                "max": round(latencies[-1], 4) if latencies else None,
+                "histogram": self._histogram(latencies)
+            }
+            stages.append(stage)
+
+        return {
+            "message": message,
+            "seconds": round(time.perf_counter() - self._start, 3),
+            "peak_rss_mb": _peak_rss_mb(),
+            "stages": stages
+        }
+
+    def log_lines(self):
+        """Yields one line per stage, for the py-server log."""
+        for stage in self.to_dict()["stages"]:
+            phases = " ".join(f"{phase}={seconds:.2f}s" for phase, seconds in stage["phases"].items())
+            yield (f"{stage['stage']}: {stage['records']} records in {stage['seconds']:.2f}s "
+                   f"({stage['records_per_second'] or 0:.0f}/s), {phases}, {stage['batches']} batches, "
+                   f"{stage['retries']} retries, p50={stage['latency']['p50']}s p95={stage['latency']['p95']}s, "
+                   f"peak RSS {stage.get('peak_rss_mb')} MB")
+
+    def _histogram(self, latencies):
+        import bisect
+
+        counts = [0] * (len(self.LATENCY_BUCKETS) + 1)
+        for latency in latencies:
+            counts[bisect.bisect_left(self.LATENCY_BUCKETS, latency)] += 1
+
+        labels = [f"<={bound}s" for bound in self.LATENCY_BUCKETS] + [f">{self.LATENCY_BUCKETS[-1]}s"]
+        return {label: count for label, count in zip(labels, counts) if count}
 
-def _upsert_helper(array, Type, batch_size=1000):
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+
+    return round(sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))], 4)
+
+def _peak_rss_mb():
+    """Returns the peak resident set size of the process in MB, or None where the resource module is unavailable."""
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    import sys
+
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+
+'''
+    LoadManifest Class
+    Checkpoints of a resumable load, stored as DataGeneratorBatch records.
+
+    A load is identified by its run key: the stage, SEED, scale, start date, generation mode and batch size. Generation
+    is deterministic for a given run key (and, for the stages that read an upstream Type back from the store, the same
+    upstream records), so batch N of a rerun contains the same records as batch N of the run that died, even when the
+    rerun is on a later day. Every batch acknowledged by upsertBatch is recorded with its index and id range, and once every batch of a
+    stage is in, a completion record is added. On restart, acknowledged batches are skipped and only the missing ones
+    are upserted.
+'''
+class LoadManifest:
+    def __init__(self, stage, scale, start_date, vectorized=False, batch_size=None):
+        self.stage = stage
+        self.scale = scale
+        self.batch_size = batch_size or UPSERT_BATCH_SIZES.get(stage, UPSERT_BATCH_SIZE)
+        self.run_key = (f"{stage}:seed={SEED}:scale={scale}:start={start_date.isoformat()}:vectorized={bool(vectorized)}"
+                        f":batch={self.batch_size}")
+        self._lock = threading.Lock()
+
+        entries = c3.DataGeneratorBatch.fetch({"filter": f"runKey == '{self.run_key}'", "limit": -1}).objs or []
+        self._acknowledged = {entry.batchIndex for entry in entries if not entry.complete}
+        self._complete = any(entry.complete for entry in entries)
+
+    def is_complete(self):
+        return self._complete
+
+    def is_partial(self):
+        return not self._complete and len(self._acknowledged) > 0
+
+    def num_acknowledged(self):
+        return len(self._acknowledged)
+
+    def is_acknowledged(self, batch_index):
+        return batch_index in self._acknowledged
+
+    def acknowledge(self, batch_index, mini_batch):
+        """Record a batch that upsertBatch accepted. Called from the upsert worker threads."""
+        c3.DataGeneratorBatch.upsert(self._entry(batch_index, len(mini_batch), mini_batch[0].get("id"), mini_batch[-1].get("id")))
+
+        with self._lock:
+            self._acknowledged.add(batch_index)
+
+    def complete(self, upsert_result):
+        """Mark the stage as fully loaded, after every batch of upsert_result was acknowledged."""
+        entry = self._entry(upsert_result.num_batches, upsert_result.num_records, None, None)
+        entry["id"] = f"{self.run_key}:complete"
+        entry["complete"] = True
+        c3.DataGeneratorBatch.upsert(entry)
+        self._complete = True
+
+    def _entry(self, batch_index, num_records, first_id, last_id):
+        return {
+            "id": f"{self.run_key}:{batch_index}",
+            "runKey": self.run_key,
+            "stage": self.stage,
+            "seed": SEED,
+            "scale": self.scale,
+            "batchIndex": batch_index,
+            "numRecords": num_records,
+            "firstId": first_id,
+            "lastId": last_id,
+            "complete": False
+        }
+
+'''
+    DatasetState Class
+    What the generator last loaded into a Type, stored as the DataGeneratorBatch record "dataset:<Type>".
+
+    A stage records its generation key (SEED, scale, generation mode and start date), the number of records the store
+    held once the stage checked out and the last id it generated. A later run with the same key skips the stage only
+    if the store still holds exactly that number of records. advanceSimulation numbers the records it appends after
+    the last id, so ids are never reused even when a date-range clear left gaps, and adds them to the count. Simulated counts vary with the scale and the generation mode,
+    so no count is derived from the constants, except for data loaded before states were recorded.
+'''
+class DatasetState:
+    def __init__(self, Type, prefix=None, scale=1, vectorized=False, start_date=None):
+        self.Type = Type
+        self.prefix = prefix
+        self.scale = scale
+        self.run_key = f"dataset:seed={SEED}:scale={scale}:vectorized={bool(vectorized)}"
+        if start_date is not None:
+            self.run_key += f":start={start_date.isoformat()}"
+        self.id = f"dataset:{Type.name()}"
+
+        entries = c3.DataGeneratorBatch.fetch({"filter": f"id == '{self.id}'", "limit": 1}).objs or []
+        entry = entries[0] if entries else None
+        self.recorded_key = entry.runKey if entry is not None else None
+        self.recorded_scale = entry.scale if entry is not None else None
+        self.num_records = entry.numRecords if entry is not None else None
+        self.last_id = entry.lastId if entry is not None else None
+
+    def is_loaded(self, num_default):
+        """
+        Returns whether the store holds the dataset of this key. num_default is the exact count of the dataset, used
+        for data loaded before states were recorded, or None where the count is only known once generated.
+        """
+        num_stored = self.Type.fetchCount()
+
+        if self.recorded_key is None:
+            return num_default is not None and num_stored == num_default
+
+        return self.recorded_key == self.run_key and num_stored == self.num_records
+
+    def last_number(self):
+        """
+        Returns the highest id number generated for the Type, 0 if none. For data loaded before states were recorded,
+        it is read from the stored ids.
+        """
+        if self.last_id:
+            return _id_number(self.last_id)
+
+        return max((_id_number(obj.id) for obj in _read_records(self.Type, [])), default=0)
+
+    def record(self, num_records, last_number):
+        """Records the dataset of this key: num_records stored records, with ids numbered up to last_number."""
+        self.recorded_key = self.run_key
+        self.recorded_scale = self.scale
+        self._save(num_records, last_number)
+
+    def advance(self, num_added, last_number):
+        """Records num_added records appended to the dataset, with ids numbered up to last_number."""
+        num_records = self.num_records + num_added if self.num_records is not None else None
+        self._save(num_records, last_number)
+
+    def invalidate(self):
+        """
+        Marks the stored records as no longer the recorded dataset, once a clear removed some of them. The last id is
+        kept, so that the ids of the records that are left are not reused.
+        """
+        if self.recorded_key is not None or self.last_id:
+            self.num_records = None
+            self._upsert()
+
+    def _save(self, num_records, last_number):
+        if self.last_id:
+            # Numbers above the generated ones (e.g. records of a longer earlier load kept by the diff) stay taken
+            last_number = max(last_number, _id_number(self.last_id))
+
+        self.num_records = num_records
+        self.last_id = f"{self.prefix}{last_number}"
+        self._upsert()
+
+    def _upsert(self):
+        c3.DataGeneratorBatch.upsert({
+            "id": self.id,
+            "runKey": self.recorded_key,
+            "stage": self.Type.name(),
+            "seed": SEED,
+            "scale": self.recorded_scale,
+            "numRecords": self.num_records,
+            "lastId": self.last_id,
+            "complete": True
+        })
+
+'''
+    RecordDiff Class
+    Filters a stage's generated records down to the ones that are new or differ from the stored records.
+
+    Every record is reduced to a content hash over its generated fields, with references compared by id and dates by
+    their timestamp, so a record read back from the store hashes the same as the record that was upserted.
+
+    The stages generate their records in id number order, so the stored records are read alongside them in the same
+    order, as a projection on the generated fields, one page of DIFF_PAGE_SIZE generated ids at a time. Only the
+    hashes of the current page are held, and a page is dropped once the generated records have moved past it.
+
+    Stored records that the generator no longer produces are orphans and can be removed afterwards: the ones within
+    the compared pages are the ids left over in them, and the count of the others (ids past the last page, or not in
+    the numbering of the stage) follows from the count of stored records taken before the first upsert. Removing
+    those is a single id-cursor scan of the collection.
+'''
+class RecordDiff:
+    def __init__(self, Type, prefix, page_size=None):
+        self.Type = Type
+        self.prefix = prefix
+        self.page_size = page_size or DIFF_PAGE_SIZE
+        self.num_generated = 0
+        self.num_new = 0
+        self.num_changed = 0
+        self.num_unchanged = 0
+        self.num_orphans_removed = 0
+        self.num_orphans_kept = 0
+        self._fields = None
+        self._num_stored = None
+        self._num_stored_in_pages = 0
+        self._page_hashes = {}
+        self._next_number = 1
+        self._orphan_ids = []
+
+    @staticmethod
+    def content_hash(record, fields):
+        """Returns a stable hash of the given fields of a generated record or a fetched obj."""
+        import hashlib
+
+        get = record.get if isinstance(record, dict) else lambda field: getattr(record, field, None)
+        values = [RecordDiff._normalize(get(field)) for field in fields]
+
+        return hashlib.blake2b(json.dumps(values, separators=(",", ":")).encode(), digest_size=12).hexdigest()
+
+    @staticmethod
+    def _normalize(value):
+        import pandas as pd
+
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+
+        if isinstance(value, dict):
+            return value.get("id")
+
+        if hasattr(value, "id"):
+            return value.id
+
+        if isinstance(value, (list, tuple)):
+            return [RecordDiff._normalize(item) for item in value]
+
+        timestamp = pd.Timestamp(value)
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.tz_convert(None)
+
+        return timestamp.isoformat()
+
+    def changed(self, records):
+        """Yields the records of a generated stream, in id number order, that are not stored with the same content."""
+        for record in records:
+            if self._fields is None:
+                self._fields = [field for field in record if field != "id"]
+                # Counted before any generated record is upserted
+                self._num_stored = self.Type.fetchCount()
+
+            while _id_number(record["id"]) >= self._next_number:
+                self._next_page()
+
+            self.num_generated += 1
+
+            stored_hash = self._page_hashes.pop(record["id"], None)
+            if stored_hash is None:
+                self.num_new += 1
+            elif stored_hash != self.content_hash(record, self._fields):
+                self.num_changed += 1
+            else:
+                self.num_unchanged += 1
+                continue
+
+            yield record
+
+    def settle_orphans(self, remove):
+        """
+        Counts the stored records that were not generated in this run, and removes them if remove is set. Call once
+        the generated stream is consumed. Returns the number of orphans left in the store.
+        """
+        if self._num_stored is None:
+            self._num_stored = self.Type.fetchCount()
+
+        self._orphan_ids.extend(self._page_hashes)
+        self._page_hashes = {}
+        num_outside = self._num_stored - self._num_stored_in_pages
+        num_orphans = len(self._orphan_ids) + num_outside
+
+        if not remove:
+            self.num_orphans_kept = num_orphans
+            return self.num_orphans_kept
+
+        for ids in _chunks(self._orphan_ids, self.page_size):
+            self.Type.removeBatch([{"id": record_id} for record_id in ids])
+
+        if num_outside:
+            # The records behind the cursor can be removed while the scan goes on
+            outside_ids = (obj.id for obj in _read_records(self.Type, [], page_size=self.page_size) if not self._in_pages(obj.id))
+            for ids in _chunks(outside_ids, self.page_size):
+                self.Type.removeBatch([{"id": record_id} for record_id in ids])
+
+        self.num_orphans_removed = num_orphans
+        return 0
+
+    def annotate(self, message):
+        """Append how the generated records compared to the stored ones."""
+        message = f"{message} (diff: {self.num_new} new, {self.num_changed} changed, {self.num_unchanged} unchanged"
+        if self.num_orphans_removed:
+            message += f", {self.num_orphans_removed} orphans removed"
+        if self.num_orphans_kept:
+            message += f", {self.num_orphans_kept} orphans kept"
+
+        return message + ")"
+
+    def _next_page(self):
+        # The stored ids of the previous page that were not generated are orphans
+        self._orphan_ids.extend(self._page_hashes)
+
+        objs = _read_generated_page(self.Type, self.prefix, self._fields, self._next_number, self.page_size)
+        self._page_hashes = {obj.id: self.content_hash(obj, self._fields) for obj in objs}
+        self._num_stored_in_pages += len(self._page_hashes)
+        self._next_number += self.page_size
+
+    def _in_pages(self, record_id):
+        """Returns whether record_id is a generated id of the stage within the compared pages."""
+        record_id = str(record_id)
+        number = record_id[len(self.prefix):]
+        return record_id.startswith(self.prefix) and number.isdigit() and int(number) < self._next_number
+
+'''
+    LoadChecksum Class
+    Order-independent checksums of a stage's generated records, used to verify a load without counting or reading
+    the whole collection.
+
+    The generated ids are cut into buckets of VERIFY_BUCKET_SIZE consecutive id numbers, and every bucket keeps the
+    number of its records and the sum of their RecordDiff content hashes, so the checksum does not depend on the
+    order the records were generated or upserted in. Verifying reads buckets back as a projection on the generated
+    fields and compares them: in the "sample" mode the first and last bucket and VERIFY_SAMPLE_BUCKETS seeded random
+    ones, in the "full" mode every bucket. A bucket with a missing, extra or corrupted record does not match.
+'''
+class LoadChecksum:
+    MODULUS = 2 ** 96
+
+    def __init__(self, Type, prefix, mode, bucket_size=None, sample_buckets=None):
+        self.Type = Type
+        self.prefix = prefix
+        self.mode = mode
+        self.bucket_size = bucket_size or VERIFY_BUCKET_SIZE
+        self.sample_buckets = sample_buckets or VERIFY_SAMPLE_BUCKETS
+        self.fields = None
+        self.buckets = {}
+        self.num_checked = 0
+        self.mismatches = []
+
+    def track(self, records):
+        """Passes a generated record stream through, adding every record to the checksum of its bucket."""
+        for record in records:
+            if self.fields is None:
+                self.fields = [field for field in record if field != "id"]
+
+            self._add(self.buckets, record["id"], RecordDiff.content_hash(record, self.fields))
+            yield record
+
+    def verify(self):
+        """Reads the chosen buckets back from the store and returns whether they all match the generated ones."""
+        stored_buckets = {}
+        include = ", ".join(["id"] + self.fields) if self.fields else "id"
+
+        for bucket in self._chosen_buckets():
+            first_number = bucket * self.bucket_size + 1
+            ids = [f"{self.prefix}{number}" for number in range(first_number, first_number + self.bucket_size)]
+
+            for page_ids in _chunks(ids, READ_PAGE_SIZE):
+                objs = self.Type.fetch({"filter": _in_filter("id", page_ids), "include": include, "limit": -1}).objs or []
+                for obj in objs:
+                    self._add(stored_buckets, obj.id, RecordDiff.content_hash(obj, self.fields))
+
+            self.num_checked += 1
+            if stored_buckets.get(bucket) != self.buckets[bucket]:
+                self.mismatches.append(bucket)
+
+        return not self.mismatches
+
+    def annotate(self, message):
+        """Append how many id ranges were verified."""
+        return f"{message} (verified {self.num_checked} of {len(self.buckets)} id ranges)"
+
+    def failure_message(self, label):
+        ranges = ", ".join(f"{self.prefix}{bucket * self.bucket_size + 1}..{self.prefix}{(bucket + 1) * self.bucket_size}"
+                           for bucket in self.mismatches)
+        return (f"Warning: {len(self.mismatches)} of {self.num_checked} verified id ranges of the {label} do not match "
+                f"the generated records: {ranges}")
+
+    def _add(self, buckets, record_id, content_hash):
+        bucket = (_id_number(record_id) - 1) // self.bucket_size
+        count, checksum = buckets.get(bucket, (0, 0))
+        buckets[bucket] = (count + 1, (checksum + int(content_hash, 16)) % self.MODULUS)
+
+    def _chosen_buckets(self):
+        buckets = sorted(self.buckets)
+        if self.mode == "full" or len(buckets) <= self.sample_buckets + 2:
+            return buckets
+
+        rng = random.Random(f"{SEED}:verify:{self.Type.name()}")
+        return [buckets[0]] + sorted(rng.sample(buckets[1:-1], self.sample_buckets)) + [buckets[-1]]
+
+def _stage_checksum(Type, prefix, verify, sink):
+    """Returns the LoadChecksum of a stage in the "sample" and "full" verify modes, or None."""
+    if verify is None or verify == "count":
+        return None
+
+    if verify not in VERIFY_MODES:
+        raise ValueError(f"Unknown verify mode {verify}. Use one of {', '.join(VERIFY_MODES)}.")
+
+    if not sink.writes_to_store:
+        return None
+
+    return LoadChecksum(Type, prefix, verify)
+
+'''
+    AdaptiveBatchSizer Class
+    Picks the size of the next upsertBatch call from the latency, payload size and errors of the previous ones.
+
+    Latency and payload bytes are tracked per record as exponentially weighted averages. The next size is the one
+    that would take target_latency seconds at the current per-record latency, bounded by max_payload_bytes and
+    limited to half or double the observed batch so that a single slow call does not swing the size. A failed call
+    (error or timeout) halves the size.
+'''
+class AdaptiveBatchSizer:
+    SMOOTHING = 0.3
+
+    def __init__(self, initial_size, target_latency=None, min_size=None, max_size=None, max_payload_bytes=None):
+        self.size = initial_size
+        self.target_latency = target_latency or UPSERT_TARGET_LATENCY_SECONDS
+        self.min_size = min_size or UPSERT_MIN_BATCH_SIZE
+        self.max_size = max_size or UPSERT_MAX_BATCH_SIZE
+        self.max_payload_bytes = max_payload_bytes or UPSERT_MAX_PAYLOAD_BYTES
+        self.latency_per_record = None
+        self.bytes_per_record = None
+        self.num_calls = 0
+        self.num_errors = 0
+        self.total_latency = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, num_records, latency, payload_bytes, failed):
+        """Record one upsertBatch call and update the batch size."""
+        with self._lock:
+            self.num_calls += 1
+            self.total_latency += latency
+
+            if failed:
+                self.num_errors += 1
+                self.size = max(self.min_size, self.size // 2)
+                return
+
+            self.latency_per_record = self._smooth(self.latency_per_record, latency / num_records)
+            self.bytes_per_record = self._smooth(self.bytes_per_record, payload_bytes / num_records)
+
+            ideal_size = self.target_latency / max(self.latency_per_record, 1e-9)
+            ideal_size = min(ideal_size, self.max_payload_bytes / max(self.bytes_per_record, 1))
+            # Step relative to the observed batch, so that concurrent batches cut at the same size do not compound
+            ideal_size = max(num_records / 2, min(num_records * 2, ideal_size))
+
+            self.size = int(max(self.min_size, min(self.max_size, ideal_size)))
+
+    def mean_latency(self):
+        return self.total_latency / self.num_calls if self.num_calls else 0.0
+
+    def error_rate(self):
+        return self.num_errors / self.num_calls if self.num_calls else 0.0
+
+    def _smooth(self, average, value):
+        if average is None:
+            return value
+        return average + self.SMOOTHING * (value - average)
+
+'''
+    UpsertEngine Class
+    Pipelines mini-batches into Type.upsertBatch on a thread pool.
+
+    Batches are cut from the record stream on the calling thread while up to max_in_flight earlier batches are
+    still being upserted, so ingest time tracks the server round-trip time instead of the sum of all round-trips.
+    Each batch is retried with exponential backoff, and batches that still fail are reported on the UpsertResult.
+
+    Batches of one run are independent: every stream the generator upserts holds distinct ids, so no batch can
+    overwrite a record of another. Ordering between Types (e.g. Work Orders after the Operations they come from) is
+    kept by the callers, since run returns only once every batch of the stream is in.
+
+    With adaptive=True, an AdaptiveBatchSizer starting at batch_size chooses the size of every following batch.
+
+    With a LoadManifest, batch boundaries are fixed to the manifest's batch size, batches the manifest has already
+    acknowledged are skipped, and every newly upserted batch is acknowledged in it.
+
+    With a LoadReport, the run is recorded under report_name, which defaults to the name of the Type.
+'''
+class UpsertEngine:
+    def __init__(self, Type, batch_size=UPSERT_BATCH_SIZE, max_in_flight=UPSERT_MAX_IN_FLIGHT,
+                 max_retries=UPSERT_MAX_RETRIES, backoff_seconds=UPSERT_BACKOFF_SECONDS, adaptive=False, manifest=None,
+                 report=None, report_name=None):
+        self.Type = Type
+        self.batch_size = manifest.batch_size if manifest else batch_size
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        # Adaptive sizes would move the batch boundaries between runs, so they are not used with a manifest
+        self.batch_sizer = AdaptiveBatchSizer(batch_size) if adaptive and not manifest else None
+        self.manifest = manifest
+        self.report = report
+        self.report_name = report_name or Type.name()
+
+    def run(self, records):
+        """Upsert every record of the iterable and return an UpsertResult."""
+        result = UpsertResult(self.Type.name())
+        result.batch_sizer = self.batch_sizer
+        records = iter(records)
+        in_flight = set()
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            while True:
+                # Cut the next batch while the previous ones are still on the wire
+                batch_size = self.batch_sizer.size if self.batch_sizer else self.batch_size
+                start = time.perf_counter()
+                mini_batch = list(islice(records, batch_size))
+                if self.report:
+                    self.report.add_phase(self.report_name, "generate", time.perf_counter() - start)
+                if not mini_batch:
+                    break
+
+                if self.manifest and self.manifest.is_acknowledged(result.num_batches):
+                    result.num_batches += 1
+                    result.num_records += len(mini_batch)
+                    result.num_skipped += len(mini_batch)
+                    continue
+
+                if len(in_flight) >= self.max_in_flight:
+                    start = time.perf_counter()
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    if self.report:
+                        self.report.add_phase(self.report_name, "wait", time.perf_counter() - start)
+                    self._collect(done, result)
+
+                in_flight.add(executor.submit(self._upsert_with_retry, result.num_batches, mini_batch))
+                result.num_batches += 1
+                result.num_records += len(mini_batch)
+
+            start = time.perf_counter()
+            done, _ = wait(in_flight)
+            if self.report:
+                self.report.add_phase(self.report_name, "wait", time.perf_counter() - start)
+            self._collect(done, result)
+
+        result.failed_batches.sort(key=lambda b: b["batch_index"])
+        if self.report:
+            self.report.add_result(self.report_name, result)
+        return result
+
+    def _collect(self, futures, result):
+        for future in futures:
+            num_upserted, num_retries, failure = future.result()
+            result.num_upserted += num_upserted
+            result.num_retries += num_retries
+            if failure is not None:
+                result.failed_batches.append(failure)
+
+    def _upsert_with_retry(self, batch_index, mini_batch):
+        payload_bytes = _estimate_payload_bytes(mini_batch) if self.batch_sizer or self.report else 0
+
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                self.Type.upsertBatch(mini_batch)
+                if self.report:
+                    latency = time.perf_counter() - start
+                    self.report.add_phase(self.report_name, "upsert", latency)
+                    self.report.add_batch(self.report_name, latency, payload_bytes)
+                if self.batch_sizer:
+                    self.batch_sizer.observe(len(mini_batch), time.perf_counter() - start, payload_bytes, False)
+                if self.manifest:
+                    self.manifest.acknowledge(batch_index, mini_batch)
+                return len(mini_batch), attempt, None
+            except Exception as e:
+                if self.report:
+                    self.report.add_phase(self.report_name, "upsert", time.perf_counter() - start)
+                if self.batch_sizer:
+                    self.batch_sizer.observe(len(mini_batch), time.perf_counter() - start, payload_bytes, True)
+                if attempt >= self.max_retries:
+                    return 0, attempt, {
+                        "batch_index": batch_index,
+                        "num_records": len(mini_batch),
+                        "first_id": mini_batch[0].get("id"),
+                        "last_id": mini_batch[-1].get("id"),
+                        "error": str(e),
+                    }
+                time.sleep(self.backoff_seconds * (2 ** attempt))
+                attempt += 1
+
+def _estimate_payload_bytes(mini_batch):
+    """
+    Estimates the JSON size of an upsertBatch payload from up to PAYLOAD_SAMPLE_SIZE records spread over the batch.
+    upsertBatch encodes the payload itself, so encoding all of it a second time only to measure it would cost about as
+    much as the encoding being measured.
+    """
+    step = max(1, len(mini_batch) // PAYLOAD_SAMPLE_SIZE)
+    sample = mini_batch[::step][:PAYLOAD_SAMPLE_SIZE]
+    sample_bytes = sum(len(json.dumps(record, default=str)) for record in sample)
+
+    return int(sample_bytes * len(mini_batch) / len(sample))
+
+def _upsert_helper(records, Type, batch_size=None, adaptive=None, manifest=None, report=None, report_name=None):
     """
     Utility function to upsert mini-batches of data. This puts less pressure on the server and makes the data faster to ingest.
 
+    The records are consumed lazily, so a generator can be passed in and only the batches in flight are held in memory.
+
     Args:
+        records: An iterable (list or generator) of objects to upsert.
         Type: An object representing a C3 Type.
-        batch_size: The number of data points to ingest with each batch.
+        batch_size: The number of data points to ingest with each batch (the starting size in adaptive mode).
+            Defaults to the size pinned for the Type in UPSERT_BATCH_SIZES, or UPSERT_BATCH_SIZE.
+        adaptive: Whether to adapt the batch size to the observed latency. Defaults to UPSERT_ADAPTIVE_BATCHING.
+        manifest: A LoadManifest to resume from and checkpoint to. Overrides batch_size and adaptive.
+        report: A LoadReport to record the phases and batch latencies of the ingest in.
+        report_name: The stage to record the ingest under in the report. Defaults to the name of the Type.
         
     Returns:
-        None
+        An UpsertResult describing the ingest.
+    """
+    if batch_size is None:
+        batch_size = UPSERT_BATCH_SIZES.get(Type.name(), UPSERT_BATCH_SIZE)
+
+    if adaptive is None:
+        adaptive = UPSERT_ADAPTIVE_BATCHING
+
+    return UpsertEngine(Type, batch_size=batch_size, adaptive=adaptive, manifest=manifest, report=report,
+                        report_name=report_name).run(records)
+
+'''
+    Sinks
+    Where a stage's generated records go. Every stage hands its record stream to a sink, chosen by the output argument
+    of the Type methods:
+
+        None or "upsert"     upsertBatch into the C3 Type through the UpsertEngine (the default)
+        "ndjson:<dir>"       one JSON object per line
+        "csv:<dir>"          a header row, then one row per record; list fields are JSON-encoded
+        "parquet:<dir>"      Parquet row groups (requires pyarrow)
+
+    File sinks write one directory per Type (e.g. <dir>/WorkOrder/) and roll over to a new part file every
+    SINK_PART_SIZE records, so the output can be bulk-imported or kept as a fixed benchmark fixture. Records are
+    written SINK_BATCH_SIZE at a time as they stream out of the generator; the full dataset is never held in memory.
+'''
+SINK_PART_SIZE = 1000000
+SINK_BATCH_SIZE = 10000
+
+class UpsertSink:
+    writes_to_store = True
+    report = None
+
+    def __init__(self, adaptive=None):
+        self.adaptive = adaptive
+
+    def write(self, records, Type, manifest=None, stage=None):
+        return _upsert_helper(records, Type, adaptive=self.adaptive, manifest=manifest, report=self.report,
+                              report_name=stage)
+
+    def describe(self, Type, upsert_result):
+        return None
+
+class FileSink:
+    writes_to_store = False
+    extension = None
+    report = None
+
+    def __init__(self, directory, part_size=None, batch_size=None):
+        self.directory = directory
+        self.part_size = part_size or SINK_PART_SIZE
+        self.batch_size = batch_size or SINK_BATCH_SIZE
+        self.files = {}
+
+    def write(self, records, Type, manifest=None, stage=None):
+        """
+        Writes a record stream to the part files of Type. Returns an UpsertResult counting the written records. The
+        write is reported under stage, which defaults to the name of the Type.
+        """
+        import os
+
+        stage = stage or Type.name()
+
+        type_directory = os.path.join(self.directory, Type.name())
+        os.makedirs(type_directory, exist_ok=True)
+
+        result = UpsertResult(Type.name())
+        files = self.files[Type.name()] = []
+        part = None
+        num_part_records = 0
+
+        batches = _chunks(records, self.batch_size)
+        start = time.perf_counter()
+
+        try:
+            for batch in batches:
+                if self.report:
+                    self.report.add_phase(stage, "generate", time.perf_counter() - start)
+                    start = time.perf_counter()
+
+                offset = 0
+
+                while offset < len(batch):
+                    if part is None or num_part_records == self.part_size:
+                        if part is not None:
+                            self._close_part(part)
+
+                        files.append(os.path.join(type_directory, f"part-{len(files):05d}.{self.extension}"))
+                        part = self._open_part(files[-1], batch[offset])
+                        num_part_records = 0
+
+                    chunk = batch[offset:offset + self.part_size - num_part_records]
+                    self._write_batch(part, chunk)
+
+                    offset += len(chunk)
+                    num_part_records += len(chunk)
+                    result.num_batches += 1
+                    result.num_records += len(chunk)
+                    result.num_upserted += len(chunk)
+
+                if self.report:
+                    self.report.add_phase(stage, "serialize", time.perf_counter() - start)
+                    start = time.perf_counter()
+        finally:
+            if part is not None:
+                self._close_part(part)
+
+        if self.report:
+            self.report.add_result(stage, result)
+
+        return result
+
+    def describe(self, Type, upsert_result):
+        import os
+
+        return f"written to {len(self.files.get(Type.name(), []))} part files in {os.path.join(self.directory, Type.name())}"
+
+    def _open_part(self, path, first_record):
+        raise NotImplementedError
+
+    def _write_batch(self, part, batch):
+        raise NotImplementedError
+
+    def _close_part(self, part):
+        part.close()
+
+    @staticmethod
+    def _to_json_value(value):
+        if isinstance(value, date):
+            return value.isoformat()
+
+        return value
+
+class NdjsonSink(FileSink):
+    extension = "ndjson"
+
+    def _open_part(self, path, first_record):
+        return open(path, "w", encoding="utf-8")
+
+    def _write_batch(self, part, batch):
+        part.write("".join(json.dumps(record, default=self._to_json_value) + "\n" for record in batch))
+
+class CsvSink(FileSink):
+    extension = "csv"
+
+    def _open_part(self, path, first_record):
+        import csv
+
+        handle = open(path, "w", encoding="utf-8", newline="")
+        writer = csv.DictWriter(handle, fieldnames=list(first_record))
+        writer.writeheader()
+
+        return handle, writer
+
+    def _write_batch(self, part, batch):
+        _, writer = part
+        writer.writerows(
+            {field: json.dumps(value) if isinstance(value, list) else self._to_json_value(value) for field, value in record.items()}
+            for record in batch
+        )
+
+    def _close_part(self, part):
+        part[0].close()
+
+class ParquetSink(FileSink):
+    extension = "parquet"
+
+    def _open_part(self, path, first_record):
+        # The schema is inferred from the first batch written to the part
+        return {"path": path, "writer": None}
+
+    def _write_batch(self, part, batch):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if part["writer"] is None:
+            table = pa.Table.from_pylist(batch)
+            part["writer"] = pq.ParquetWriter(part["path"], table.schema)
+        else:
+            table = pa.Table.from_pylist(batch, schema=part["writer"].schema)
+
+        part["writer"].write_table(table)
+
+    def _close_part(self, part):
+        if part["writer"] is not None:
+            part["writer"].close()
+
+SINKS = {
+    "upsert": UpsertSink,
+    "ndjson": NdjsonSink,
+    "csv": CsvSink,
+    "parquet": ParquetSink
+}
+
+def _stage_sink(output, resume=False, diff=False, context=None, adaptive=None):
+    """
+    Returns the sink for the output argument of a Type method.
+
+    Args:
+        output: None or "upsert" to upsert into the C3 Types, or "<format>:<directory>" for a file sink.
+        resume: Whether the stage runs a resumable load, which only the upsert sink supports.
+        diff: Whether the stage runs in the diff mode, which only the upsert sink supports.
+        context: The GenerationContext of the run. The sink records into its LoadReport, if it has one.
+        adaptive: Whether the upsert sink adapts its batch sizes (see AdaptiveBatchSizer). Defaults to
+            UPSERT_ADAPTIVE_BATCHING.
+    """
+    sink = _new_sink(output, resume, diff, adaptive)
+    sink.report = context.report if context is not None else None
+
+    return sink
+
+def _new_sink(output, resume, diff, adaptive=None):
+    if not output or output == "upsert":
+        return UpsertSink(adaptive)
+
+    sink_name, _, directory = output.partition(":")
+
+    if sink_name not in SINKS or sink_name == "upsert" or not directory:
+        raise ValueError(f"Unknown output {output!r}. Expected 'upsert' or one of {', '.join(f'{name}:<directory>' for name in SINKS if name != 'upsert')}.")
+
+    if resume or diff:
+        raise ValueError("resume and diff compare against the stored records, so they require the upsert output.")
+
+    return SINKS[sink_name](directory)
+
+'''
+    StatusRollup Class
+    Counts of a Type's records by a key and status, stored as one rollup record per key so that a dashboard KPI
+    panel is a single lookup by id instead of one fetchCount per status.
+
+        AircraftStatusRollup: Aircraft by Base (location) and status, with the Base id as id
+        OperationStatusRollup: Operations by startDate day and status, with the day (e.g. "2025-01-31") as id
+
+    Records without a key are not counted, so the totals of a rollup can fall short of the count of its Type.
+
+    The stages count their records in the same pass that generates them and write the rollup once the records are
+    in. advanceSimulation adds the changes it makes as deltas, and clearAllData rebuilds the rollups of the Types it
+    removed records from out of a projected read of the records that are left.
+'''
+AIRCRAFT_STATUS_FIELDS = {"Ready": "ready", "In Maintenance": "inMaintenance", "Grounded": "grounded", "Deployed": "deployed"}
+OPERATION_STATUS_FIELDS = {"Planned": "planned", "In Progress": "inProgress", "Completed": "completed"}
+
+# Type name -> name of its rollup Type
+ROLLUP_TYPES = {
+    "Aircraft": "AircraftStatusRollup",
+    "Operation": "OperationStatusRollup"
+}
+
+class StatusRollup:
+    def __init__(self, Type, key_field, status_fields):
+        self.Type = Type
+        self.key_field = key_field
+        self.status_fields = status_fields
+        self.counts = {}
+
+    @classmethod
+    def aircraft(cls):
+        """Returns an empty Aircraft rollup with a row for every Base, so that Bases without Aircraft count zero."""
+        rollup = cls(c3.AircraftStatusRollup, "base", AIRCRAFT_STATUS_FIELDS)
+        for i in range(1, NUM_BASES + 1):
+            rollup.add(f"BASE-{i}", None)
+
+        return rollup
+
+    @classmethod
+    def operations(cls):
+        return cls(c3.OperationStatusRollup, "date", OPERATION_STATUS_FIELDS)
+
+    def add(self, key, status, delta=1):
+        """
+        Counts delta records with status under key (a Base id or a date). A None status only adds the key. Records
+        without a key (e.g. an Aircraft with no location) have no rollup record to count under and are skipped.
+        """
+        if key is None:
+            return
+
+        counts = self.counts.get(key)
+        if counts is None:
+            counts = self.counts[key] = dict.fromkeys(self.status_fields, 0)
+
+        if status in counts:
+            counts[status] += delta
+
+    def count(self, records, key_fn):
+        """Passes a generated record stream through, counting every record by key_fn(record) and its status."""
+        for record in records:
+            self.add(key_fn(record), record["status"])
+            yield record
+
+    def to_records(self):
+        for key in sorted(self.counts, key=str):
+            counts = self.counts[key]
+            record = {"id": str(key), self.key_field: key}
+            record.update({self.status_fields[status]: num for status, num in counts.items()})
+            record["total"] = sum(counts.values())
+            yield record
+
+    def write(self, sink, stage=None):
+        """
+        Writes the rollup through a stage's sink, reported under stage. In the store it replaces the stored rollup:
+        records of keys that were not counted (e.g. days of an earlier load) are removed. Returns the UpsertResult of
+        the write.
+        """
+        upsert_result = sink.write(self.to_records(), self.Type, stage=stage)
+
+        if sink.writes_to_store and not upsert_result.failed_batches:
+            ids = set(str(key) for key in self.counts)
+            stale_ids = [obj.id for obj in _read_records(self.Type, []) if obj.id not in ids]
+
+            for chunk in _chunks(stale_ids, READ_PAGE_SIZE):
+                self.Type.removeBatch([{"id": record_id} for record_id in chunk])
+
+        return upsert_result
+
+    def apply(self):
+        """Adds the counts to the stored rollup records as deltas. Returns the UpsertResult of the upsert."""
+        stored = {}
+        for ids in _chunks([str(key) for key in self.counts], READ_PAGE_SIZE):
+            for obj in self.Type.fetch({"filter": _in_filter("id", ids), "limit": -1}).objs or []:
+                stored[obj.id] = obj
+
+        for key, counts in self.counts.items():
+            obj = stored.get(str(key))
+            if obj is not None:
+                for status, field in self.status_fields.items():
+                    counts[status] += getattr(obj, field, None) or 0
+
+        return _upsert_helper(list(self.to_records()), self.Type)
+
+def _rebuild_rollup(type_name):
+    """Recounts the rollup of a Type from the stored records and replaces the stored rollup with it."""
+    if type_name == "Aircraft":
+        rollup = StatusRollup.aircraft()
+        for aircraft in _read_records(c3.Aircraft, ["location", "status"]):
+            rollup.add(aircraft.location.id if aircraft.location else None, aircraft.status)
+    else:
+        rollup = StatusRollup.operations()
+        for operation in _read_records(c3.Operation, ["startDate", "status"]):
+            rollup.add(_to_date(operation.startDate), operation.status)
+
+    return rollup.write(UpsertSink())
+
+def _write_rollup(rollup, sink, upsert_result, message, type_name, diff=None):
+    """Writes a stage's rollup once its records are in, and returns the stage message with any rollup failure."""
+    if upsert_result.failed_batches:
+        # The rollup would count records that are not in the store; a rerun of the stage writes it
+        return message
+
+    if diff is not None and diff.num_orphans_kept:
+        # The store holds records besides the generated ones, so only a recount matches it
+        rollup_result = _rebuild_rollup(type_name)
+    else:
+        rollup_result = rollup.write(sink, type_name)
+
+    if rollup_result.failed_batches:
+        message = f"{message}\n{rollup_result.failure_message()}"
+
+    return message
+
+'''
+    ColumnBatch Class
+    Compact, column-wise representation of a batch of generated records, used by the vectorized generation mode.
+
+    Every field is one NumPy array. Categorical fields (statuses, priorities, maintenance types, descriptions,
+    suppliers, technicians) hold small integer codes into a shared table of labels, and id and reference fields hold
+    the integer part of the id (e.g. 12 for "WORK-ORDER-12") with the prefix kept once per column. Label strings are
+    therefore stored once per table rather than once per record, and id strings are only formatted when the records
+    are materialized at the sink boundary, RECORD_SLICE_SIZE records at a time.
+
+    A generated Maintenance Record takes 28 bytes in this form (two 4-byte references, four 1-byte codes, two 8-byte
+    dates), plus 4 bytes once its id is assigned. Measured with benchmark/column_batch_memory_benchmark.py, per
+    million Maintenance Records generated from real Work Orders:
+
+        representation          held        peak while generating
+        ColumnBatch             ~27 MB      ~31 MB
+        upsert dicts            ~450 MB     ~450 MB
+'''
+RECORD_SLICE_SIZE = 4096
+
+class ColumnBatch:
+    def __init__(self, columns, categories=None, id_prefixes=None):
+        self.columns = columns                  # field name -> array, in record field order
+        self.categories = categories or {}      # field name -> object array of labels; the column holds codes
+        self.id_prefixes = id_prefixes or {}    # field name -> id prefix; the column holds id numbers
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def nbytes(self):
+        return sum(column.nbytes for column in self.columns.values())
+
+    def take(self, index):
+        """Returns the rows selected by a slice or an index array as a new ColumnBatch sharing the label tables."""
+        return ColumnBatch({name: column[index] for name, column in self.columns.items()}, self.categories, self.id_prefixes)
+
+    def with_column(self, name, column, first=False, categories=None, id_prefix=None):
+        """Returns a ColumnBatch with one more column, at the front of the record if first is set."""
+        columns = {name: column, **self.columns} if first else {**self.columns, name: column}
+        batch = ColumnBatch(columns, dict(self.categories), dict(self.id_prefixes))
+
+        if categories is not None:
+            batch.categories[name] = categories
+        if id_prefix is not None:
+            batch.id_prefixes[name] = id_prefix
+
+        return batch
+
+    def decoded(self, name):
+        """Returns a column as the values of the records: labels for codes, id strings for id numbers."""
+        import numpy as np
+
+        column = self.columns[name]
+
+        if name in self.categories:
+            return self.categories[name][column]
+
+        if name in self.id_prefixes:
+            return np.char.add(self.id_prefixes[name], column.astype(str)).astype(object)
+
+        return column
+
+    def to_records(self):
+        """Yields the rows as upsert records, materializing RECORD_SLICE_SIZE rows at a time."""
+        names = list(self.columns)
+
+        for start in range(0, len(self), RECORD_SLICE_SIZE):
+            batch = self.take(slice(start, start + RECORD_SLICE_SIZE))
+            for values in zip(*(batch.decoded(name).tolist() for name in names)):
+                yield dict(zip(names, values))
+
+    @staticmethod
+    def concat(batches):
+        import numpy as np
+
+        first = batches[0]
+        return ColumnBatch({name: np.concatenate([batch.columns[name] for batch in batches]) for name in first.columns},
+                           first.categories, first.id_prefixes)
+
+def _code_dtype(num_labels):
+    """Returns the smallest unsigned integer dtype that can code num_labels labels."""
+    import numpy as np
+
+    return np.uint8 if num_labels <= 256 else np.uint16 if num_labels <= 65536 else np.uint32
+
+def _id_numbers(record_ids):
+    """Returns the sequence numbers of generated ids (e.g. "AIRCRAFT-12") as a compact NumPy array."""
+    import numpy as np
+
+    return np.fromiter((_id_number(record_id) for record_id in record_ids), dtype=np.uint32, count=len(record_ids))
+
+def _column_batch_chunks(batches, size):
+    """Re-cuts a stream of ColumnBatches into ColumnBatches of exactly size rows (the last one may be shorter)."""
+    pending = []
+    num_pending = 0
+
+    for batch in batches:
+        while len(batch):
+            take = min(size - num_pending, len(batch))
+            pending.append(batch.take(slice(0, take)))
+            num_pending += take
+            batch = batch.take(slice(take, None))
+
+            if num_pending == size:
+                yield ColumnBatch.concat(pending)
+                pending, num_pending = [], 0
+
+    if pending:
+        yield ColumnBatch.concat(pending)
+
+def _work_order_batch(work_orders):
+    """Packs (id, aircraft id, description, createdDate, dueDate) work order tuples into a ColumnBatch."""
+    import numpy as np
+
+    work_order_ids, aircraft_ids, descriptions, created_dates, due_dates = zip(*work_orders)
+    labels, codes = np.unique(np.array(descriptions, dtype=object), return_inverse=True)
+
+    return ColumnBatch({
+        "id": _id_numbers(work_order_ids),
+        "aircraft": _id_numbers(aircraft_ids),
+        "description": codes.astype(_code_dtype(len(labels))),
+        "createdDate": _to_datetime64_days(created_dates),
+        "dueDate": _to_datetime64_days(due_dates)
+    }, categories={"description": labels}, id_prefixes={"id": "WORK-ORDER-", "aircraft": "AIRCRAFT-"})
+
+def _records_from_column_batches(column_batches):
+    """
+    Turns ColumnBatches into upsert records.
+
+    The vectorized generators keep their data column-wise, so this is the only place where per-record dicts are
+    built, a slice at a time, right before the records go to the sink.
+    """
+    for batch in column_batches:
+        yield from batch.to_records()
+
+def _to_datetime64_days(values):
+    """Converts a sequence of dates or timestamps (as read from the store or the context) to datetime64[D]."""
+    import pandas as pd
+
+    dates = pd.to_datetime(pd.Series(values))
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_localize(None)
+
+    return dates.to_numpy().astype("datetime64[D]")
+
+def _chunks(iterable, size):
+    """Splits an iterable into lists of at most size items."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def _id_number(record_id):
+    """Returns the sequence number of a generated id, e.g. 12 for "WORK-ORDER-12"."""
+    return int(str(record_id).rsplit("-", 1)[1])
+
+def _read_records(Type, fields, filter_expr=None, page_size=None):
+    """
+    Streams the stored records of a Type in id order, one page at a time, with only id and the given fields fetched.
+
+    Pages are cut with an id cursor instead of an offset, so a page deep into a large collection costs the same to
+    fetch as the first one, and only one page is held in memory.
+
+    Args:
+        Type: The C3 Type to read.
+        fields: The fields to fetch besides id.
+        filter_expr: An optional filter expression on the records.
+        page_size: The number of records per fetch. Defaults to READ_PAGE_SIZE.
+
+    Returns:
+        A generator over the fetched objs.
+    """
+    page_size = page_size or READ_PAGE_SIZE
+    include = ", ".join(["id"] + list(fields))
+    cursor = None
+
+    while True:
+        filters = [expr for expr in (filter_expr, f"id > '{cursor}'" if cursor is not None else None) if expr]
+        spec = {"include": include, "order": "ascending(id)", "limit": page_size}
+        if filters:
+            spec["filter"] = " && ".join(f"({expr})" for expr in filters)
+
+        objs = Type.fetch(spec).objs or []
+        yield from objs
+
+        if len(objs) < page_size:
+            return
+
+        cursor = objs[-1].id
+
+def _read_generated_records(Type, prefix, fields, page_size=None):
+    """
+    Streams the stored records of a stage in the order the stage generated them, i.e. by the number of their
+    generated id (prefix + number), with only id and the given fields fetched.
+
+    An id cursor would return the ids in string order ("-10" before "-2"), so every page is fetched by its list of
+    generated ids instead. A clear can leave gaps in the numbering, so empty pages up to the last id recorded for the
+    Type (see DatasetState) are skipped; past it, e.g. after a load that failed before recording its state, the read
+    ends at the first empty page.
+
+    Args:
+        Type: The C3 Type to read.
+        prefix: The prefix of the generated ids, e.g. "WORK-ORDER-".
+        fields: The fields to fetch besides id.
+        page_size: The number of ids per fetch. Defaults to READ_PAGE_SIZE.
+
+    Returns:
+        A generator over the fetched objs.
+    """
+    page_size = page_size or READ_PAGE_SIZE
+    last_number = DatasetState(Type, prefix).last_number()
+    first_number = 1
+
+    while True:
+        objs = _read_generated_page(Type, prefix, fields, first_number, page_size)
+        if not objs and first_number > last_number:
+            return
+
+        yield from objs
+        first_number += page_size
+
+def _read_generated_page(Type, prefix, fields, first_number, page_size):
+    """Fetches the stored records with the generated ids first_number to first_number + page_size - 1, in number order."""
+    ids = [f"{prefix}{number}" for number in range(first_number, first_number + page_size)]
+    include = ", ".join(["id"] + list(fields))
+    objs = Type.fetch({"filter": _in_filter("id", ids), "include": include, "limit": page_size}).objs or []
+
+    return sorted(objs, key=lambda obj: _id_number(obj.id))
+
+def _run_shards(shard_fn, shard_args, processes=None):
+    """
+    Runs shard_fn over every tuple of arguments in shard_args and yields the results in shard order.
+
+    With processes > 1 the shards are generated on a process pool, with at most two shards per process queued ahead
+    of the consumer. Because every shard seeds its own random stream, the results are identical to a single-process
+    run. shard_fn must be a module-level function and must not call the C3 server.
+
+    Args:
+        shard_fn: The module-level function generating one shard.
+        shard_args: An iterable of argument tuples, one per shard.
+        processes: The number of worker processes. None or 1 generates the shards in this process.
+
+    Returns:
+        A generator over the shard results.
+    """
+    if not processes or processes <= 1:
+        for args in shard_args:
+            yield shard_fn(*args)
+        return
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Forked workers inherit the loaded module, so they do not need to import it by path. Forking is only safe while
+    # no other thread holds a lock, which is why a pipelined createAllData refuses processes > 1
+    mp_context = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+
+    with ProcessPoolExecutor(max_workers=processes, mp_context=mp_context) as executor:
+        pending = deque()
+        for args in shard_args:
+            pending.append(executor.submit(shard_fn, *args))
+            if len(pending) >= 2 * processes:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+def _finish_stage(upsert_result, manifest, Type, label, diff=None, prune=False, sink=None, checksum=None, dataset=None):
+    """
+    Checks an ingest once the records of a stage were upserted and returns the Type method's message.
+
+    Args:
+        upsert_result: The UpsertResult of the stage.
+        manifest: The stage's LoadManifest in a resumable load, or None. Marked complete when the stage checks out.
+        Type: The C3 Type the stage loaded.
+        label: Plural name of the records for the message, e.g. "Work Orders".
+        diff: The stage's RecordDiff in the diff mode, or None. Only the changed records went to upsert_result.
+        prune: Whether to remove the stored records the diff did not generate.
+        sink: The sink the records went to. File sinks are checked against the number of records written.
+        checksum: The stage's LoadChecksum in the "sample" and "full" verify modes, or None to compare counts.
+        dataset: The stage's DatasetState, recorded when the stage checks out.
+    """
+    if upsert_result.failed_batches:
+        message = upsert_result.failure_message()
+        if manifest is not None:
+            message += ". Rerun with resume=True to upsert only the missing batches."
+        return message
+
+    num_generated = upsert_result.num_records
+    num_expected = num_generated
+
+    if sink is not None and not sink.writes_to_store:
+        return f"Generated {num_generated} {label}, {sink.describe(Type, upsert_result)}"
+
+    if diff is not None:
+        num_generated = diff.num_generated
+        num_expected = num_generated + diff.settle_orphans(prune)
+
+    start = time.perf_counter()
+    if checksum is not None:
+        verified = checksum.verify()
+    else:
+        post_upsert_ct = Type.fetchCount()
+        verified = post_upsert_ct == num_expected
+
+    if sink is not None and sink.report is not None:
+        sink.report.add_phase(Type.name(), "verify", time.perf_counter() - start)
+
+    if not verified:
+        if checksum is not None:
+            return checksum.failure_message(label)
+        return f"Warning: Expected to generate {num_expected} {label}, but generated {post_upsert_ct}."
+
+    if manifest is not None:
+        manifest.complete(upsert_result)
+
+    if dataset is not None:
+        dataset.record(num_expected, num_generated)
+
+    message = upsert_result.annotate(f"Generated {num_generated} {label}")
+
+    if diff is not None:
+        message = diff.annotate(message)
+
+    if checksum is not None:
+        message = checksum.annotate(message)
+
+    return message
+
+def _stage_diff(Type, prefix, diff, resume):
+    """Returns the RecordDiff of a stage in the diff mode, or None."""
+    if not diff:
+        return None
+
+    if resume:
+        raise ValueError("The diff mode cannot be combined with resume, since it changes the batches that are upserted.")
+
+    return RecordDiff(Type, prefix)
+
+def _resolve_scale(scale):
+    """
+    Validates the scale factor passed to the data generation methods.
+
+    Args:
+        scale: Multiplier applied to the data volume. None means the default volume (1).
+
+    Returns:
+        The scale factor as a number.
     """
+    if scale is None:
+        return 1
 
-    start = 0
+    if scale <= 0:
+        raise ValueError(f"Scale factor must be positive, got {scale}.")
+
+    return scale
+
+def _scaled_count(num, scale):
+    """
+    Returns the number of records of a Type for a given scale factor.
 
-    # Loop through data unto all of it has been upserted
-    while start < len(array):
-        # Choose a mini-batch of the data containing batch_size number of examples
-        mini_batch = array[start:start + batch_size]
-        # Ingest the mini-batch onto that Type
-        Type.upsertBatch(mini_batch)
-        # Increase the index by batch_size amount and continue
-        start += batch_size
+    Aircraft counts are exact. Operation, Work Order and Maintenance Record counts come out of the
+    simulation, so they are exact at scale 1 and an estimate at any other scale: a stage checks what it
+    loaded against the DatasetState it recorded instead.
+    """
+    return max(1, int(round(num * scale)))
 
 '''
     Constants
 '''
 NUM_AIRCRAFTS = 500
 NUM_BASES = 10
-NUM_OPERATIONS = 5769
-NUM_WORK_ORDERS = 14495
-NUM_MAINTENANCE_RECORDS = 43552
+NUM_OPERATIONS = 5865
+NUM_WORK_ORDERS = 14561
+NUM_MAINTENANCE_RECORDS = 43714
+
+# Upper bound on the number of operations started per simulated day (at scale 1)
+MAX_DAILY_OPERATIONS = 30
 
+# Shard sizes. Each shard is generated from its own random stream, in this process or on a worker process.
+OPERATION_SHARD_AIRCRAFTS = NUM_AIRCRAFTS   # aircraft per independently simulated sub-fleet
+AIRCRAFT_SHARD_SIZE = 10000                 # aircraft per shard
+WORK_ORDER_SHARD_SIZE = 20000               # operations with alerts per shard
+MAINTENANCE_RECORD_SHARD_SIZE = 20000       # work orders per shard
+
+# Default window of the simulation, for a dataset generated without a start date and none stored (see _resolve_start)
 START_DATE = date.today()
 END_DATE = START_DATE + relativedelta(years=1)
 
+# DataGeneratorBatch record holding the first day of the stored dataset
+DATASET_START_ID = "dataset:start"
+
+def _resolve_start(start=None):
+    """
+    Returns the first day the simulation starts on: start if given, else the first day of the stored dataset, else
+    today. Anchoring a rerun to the stored start date keeps the generated dates, and so the diff and resume modes, the
+    same on every day the dataset is regenerated.
+    """
+    if start:
+        return _to_date(start)
+
+    entries = c3.DataGeneratorBatch.fetch({"filter": f"id == '{DATASET_START_ID}'", "limit": 1}).objs or []
+    if entries and entries[0].startDate:
+        return _to_date(entries[0].startDate)
+
+    return START_DATE
+
+def _end_date(start_date):
+    """Returns the day after the last day of a simulation that starts on start_date."""
+    return start_date + relativedelta(years=1)
+
+def _record_start(start_date, sink):
+    """Stores start_date as the first day of the dataset, before a stage writes records generated from it."""
+    if sink.writes_to_store:
+        c3.DataGeneratorBatch.upsert({"id": DATASET_START_ID, "runKey": DATASET_START_ID, "startDate": start_date})
+
+'''
+    StageStream Class
+    A bounded queue that one stage writes and the stage downstream reads while it is being written.
+
+    Iterating over a StageStream yields the items appended so far, dropping each one as it is read, and then blocks for
+    more until the writing stage closes it. At most max_records records (STAGE_STREAM_MAX_RECORDS by default) are
+    buffered: append blocks the writing stage while the reader is that far behind, so a pipelined run holds a window
+    of the upstream stage's output rather than all of it. An item larger than the bound is let through once the buffer
+    is empty. Closing with an error makes the reader raise it instead of ending silently with partial data.
+
+    Every stream has a single reader. Once the reading stage returns, whether it read the stream or not (e.g. its data
+    already existed), the stream is detached: the buffer is dropped and further appends are discarded, so the writing
+    stage never blocks on a reader that is gone.
+'''
+STAGE_STREAM_MAX_RECORDS = 100000
+
+class StageStream:
+    def __init__(self, max_records=None):
+        self.max_records = max_records or STAGE_STREAM_MAX_RECORDS
+        self._items = deque()
+        self._num_records = 0
+        self._closed = False
+        self._detached = False
+        self._error = None
+        self._condition = threading.Condition()
+
+    def append(self, item):
+        """Appends an item, blocking while the buffer is full. A ColumnBatch counts as the records it holds."""
+        size = len(item) if isinstance(item, ColumnBatch) else 1
+
+        with self._condition:
+            self._condition.wait_for(lambda: self._detached or not self._items or self._num_records + size <= self.max_records)
+            if self._detached:
+                return
+
+            self._items.append((item, size))
+            self._num_records += size
+            self._condition.notify_all()
+
+    def close(self, error=None):
+        with self._condition:
+            self._closed = True
+            self._error = error
+            self._condition.notify_all()
+
+    def detach(self):
+        """Drops the buffered items and discards further appends, once the reading stage is done."""
+        with self._condition:
+            self._detached = True
+            self._items.clear()
+            self._num_records = 0
+            self._condition.notify_all()
+
+    def __iter__(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._items or self._closed or self._detached)
+                if not self._items:
+                    if self._error is not None:
+                        raise RuntimeError(f"The upstream stage failed: {self._error}")
+                    return
+
+                item, size = self._items.popleft()
+                self._num_records -= size
+                self._condition.notify_all()
+
+            yield item
+
+'''
+    SpillStream Class
+    The stream that one stage writes for a stage that runs after it, when the stages run one after the other.
+
+    The appended items are pickled to a temporary file in chunks of SPILL_CHUNK_RECORDS records, and iterating reads
+    them back one chunk at a time, so neither stage holds the whole output of the writing stage in memory. Like a
+    StageStream it has a single reader and is closed by the writing stage, with the error if it failed; detaching
+    deletes the file.
+'''
+SPILL_CHUNK_RECORDS = 10000
+
+class SpillStream:
+    def __init__(self, chunk_records=None):
+        self.chunk_records = chunk_records or SPILL_CHUNK_RECORDS
+        self._file = tempfile.TemporaryFile()
+        self._chunk = []
+        self._num_chunk_records = 0
+        self._detached = False
+        self._error = None
+
+    def append(self, item):
+        """Appends an item, spilling the pending chunk once it is full. A ColumnBatch counts as the records it holds."""
+        if self._detached:
+            return
+
+        self._chunk.append(item)
+        self._num_chunk_records += len(item) if isinstance(item, ColumnBatch) else 1
+        if self._num_chunk_records >= self.chunk_records:
+            self._spill()
+
+    def close(self, error=None):
+        self._error = error
+        if not self._detached:
+            self._spill()
+
+    def detach(self):
+        """Deletes the spilled items and discards further appends, once the reading stage is done."""
+        self._detached = True
+        self._chunk = []
+        self._file.close()
+
+    def __iter__(self):
+        if self._error is not None:
+            raise RuntimeError(f"The upstream stage failed: {self._error}")
+        if self._detached:
+            return
+
+        self._file.seek(0)
+        while True:
+            try:
+                chunk = pickle.load(self._file)
+            except EOFError:
+                return
+            yield from chunk
+
+    def _spill(self):
+        if self._chunk:
+            pickle.dump(self._chunk, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+            self._chunk = []
+            self._num_chunk_records = 0
+
+'''
+    GenerationContext Class
+    Carries the results of one stage over to the stages that depend on it within one createAllData run.
+
+    Each field is filled in by the stage that generates the data and is None when that stage did not run in this
+    process (e.g. the data already existed). Dependent stages read from the context when it is filled in and fall
+    back to reading the collection from the store otherwise.
+
+        last_aircraft_locations: aircraft id -> destination Base id of its latest Operation
+        operation_alerts: (aircraft id, alerts, startDate) for every Operation with alerts, in Operation id order
+        work_orders: (id, aircraft id, description, createdDate, dueDate) for every Work Order, in id order, or the
+            Work Orders as ColumnBatches in the vectorized mode
+
+    Stages hand over their fields with publish and finish, and read the fields of their upstream stages with subscribe.
+    When the stages run one after the other, these are plain attribute accesses and the list fields become
+    SpillStreams, read back from disk by the downstream stage. In a pipelined context the stages run at the same time:
+    the list fields become bounded StageStreams that the downstream stage consumes while they are generated, subscribe
+    blocks until the upstream stage has either started publishing the field or returned without it, and with
+    complete=True until the field is finished. Once a stage returns, detach releases the streams it read
+    (STAGE_READS), including the ones its upstream stage has yet to publish.
+
+    report is the LoadReport of an instrumented run (createAllDataReport), or None.
+'''
+class GenerationContext:
+    FIELDS = ("last_aircraft_locations", "operation_alerts", "work_orders")
+
+    def __init__(self, report=None, pipelined=False):
+        self.last_aircraft_locations = None
+        self.operation_alerts = None
+        self.work_orders = None
+        self.report = report
+        self.pipelined = pipelined
+
+        # field -> "pending", "open", "closed", "abandoned" or "detached"; None when the stages run in sequence
+        self._states = {field: "pending" for field in self.FIELDS} if pipelined else None
+        self._errors = {}
+        self._condition = threading.Condition()
+
+    def publish(self, field, value):
+        """Starts handing over field and returns the object the producing stage fills in."""
+        if self._states is None:
+            if isinstance(value, list):
+                value = SpillStream()
+            setattr(self, field, value)
+            return value
+
+        with self._condition:
+            if isinstance(value, list):
+                value = StageStream()
+                # The reading stage already returned: hand the producer a stream that discards what it appends
+                if self._states[field] == "detached":
+                    value.detach()
+
+            setattr(self, field, value)
+            if self._states[field] != "detached":
+                self._states[field] = "open"
+            self._condition.notify_all()
+
+        return value
+
+    def finish(self, field):
+        """Marks field as completely generated."""
+        self.release([field])
+
+    def release(self, fields, error=None):
+        """
+        Settles the fields of a stage that returned or failed: fields it never published are abandoned (the readers
+        fall back to the store) and fields it left open are closed, with the error if the stage failed.
+        """
+        if self._states is None:
+            for field in fields:
+                value = getattr(self, field)
+                if isinstance(value, SpillStream):
+                    value.close(error)
+            return
+
+        with self._condition:
+            for field in fields:
+                if self._states[field] == "pending":
+                    self._states[field] = "abandoned"
+                elif self._states[field] == "open":
+                    self._states[field] = "closed"
+                    value = getattr(self, field)
+                    if error is not None:
+                        self._errors[field] = error
+                    if isinstance(value, StageStream):
+                        value.close(error)
+            self._condition.notify_all()
+
+    def detach(self, fields):
+        """Detaches the streams of fields once the stage reading them returned or failed (see StageStream)."""
+        if self._states is None:
+            for field in fields:
+                value = getattr(self, field)
+                if isinstance(value, SpillStream):
+                    value.detach()
+            return
+
+        with self._condition:
+            streams = [getattr(self, field) for field in fields]
+            # Also covers the fields not published yet, e.g. when the reading stage returned before its upstream stage
+            # started (its data already existed): publish hands those out detached
+            for field in fields:
+                self._states[field] = "detached"
+            self._condition.notify_all()
+
+        for stream in streams:
+            if isinstance(stream, StageStream):
+                stream.detach()
+
+    def subscribe(self, field, complete=False):
+        """Returns field as published by the upstream stage, or None if it was not generated in this run."""
+        if self._states is None:
+            return getattr(self, field)
+
+        with self._condition:
+            self._condition.wait_for(lambda: self._states[field] != "pending" and not (complete and self._states[field] == "open"))
+            if field in self._errors:
+                raise RuntimeError(f"The upstream stage failed: {self._errors[field]}")
+            if self._states[field] == "abandoned":
+                return None
+            return getattr(self, field)
+
+'''
+    Stage DAG
+    The stages of createAllData and the data that flows between them.
+
+        stage: (upstream stages it reads from, GenerationContext fields it publishes)
+
+    Base data is reference data: Operations and Aircraft carry Base ids, but no stage reads Bases, so it runs on its
+    own. Aircraft needs the latest location of every aircraft and so waits until all Operations are generated (not
+    upserted). Work Orders are cut from the stream of Operations with alerts and Maintenance Records from the stream
+    of Work Orders, so both start on the first shards of their upstream stage. Pipelined, the wall time of a load
+    approaches that of its slowest stage rather than the sum of all stages.
+
+    The stages are listed in a topological order, which is also the order they run in with sequential=True.
+'''
+STAGE_DAG = {
+    "Base": ((), ()),
+    "Operation": ((), ("last_aircraft_locations", "operation_alerts")),
+    "Aircraft": (("Operation",), ()),
+    "WorkOrder": (("Operation",), ("work_orders",)),
+    "MaintenanceRecord": (("WorkOrder",), ())
+}
+
+# Stage -> the StageStream fields it reads, detached once it returns
+STAGE_READS = {
+    "WorkOrder": ("operation_alerts",),
+    "MaintenanceRecord": ("work_orders",)
+}
+
 '''
     Type Methods:
 
@@ -59,23 +1909,119 @@ END_DATE = START_DATE + relativedelta(years=1)
         3. Generate Aircraft Data
 
         ** Generation must be done in this order to ensure that Bases and Aircrafts exist before Operations are generated.
-        ** The data generation functions will not generate data if the data already exists.
+        ** The data generation functions will not generate data if the data already exists: a stage is skipped when the
+           store holds exactly the number of records it recorded for the same seed, scale and mode (see DatasetState).
+        ** The scale factor multiplies the fleet size and the daily operation volume. Work Orders and Maintenance Records
+           follow from the Operations, so they grow with it. Bases are reference data and are not scaled.
+        ** The vectorized mode generates Work Orders and Maintenance Records with NumPy arrays. It draws from the same
+           distributions as the default mode, but from its own seeded streams, so the records differ from the default mode.
+        ** Every stage is generated in shards with their own random streams. With processes > 1 the shards run on a
+           process pool; the data is the same as with a single process for the same seed and scale. createAllData
+           only accepts processes > 1 with sequential=True, since the pool forks its workers.
+        ** With resume=True, each stage checkpoints its acknowledged batches in DataGeneratorBatch. A rerun with the same
+           arguments skips completed stages and upserts only the batches that are missing.
+        ** With diff=True, each stage regenerates its records even when the collection is already filled, compares them
+           with the stored records by content hash and upserts only the new and changed ones. prune=True also
+           removes the stored records that are no longer generated.
+        ** The output argument picks the sink the records go to: upsertBatch (the default), or NDJSON, CSV or Parquet
+           part files for a bulk import (see Sinks).
+        ** The Aircraft and Operation stages also write the AircraftStatusRollup and OperationStatusRollup counts of
+           the records they generate (see StatusRollup).
+        ** verify picks how a stage checks its records once they are in: "count" (the default) compares the stored
+           count with the number generated, "sample" and "full" compare checksums of sampled or all id ranges, read
+           back as projections (see LoadChecksum).
+        ** adaptive=True sizes every stage's upsertBatch calls with an AdaptiveBatchSizer, and the stage messages give
+           the size each Type settled on, to pin in UPSERT_BATCH_SIZES.
+        ** The simulated year starts on start, or on the start date stored with the dataset (see _resolve_start), so
+           regenerating it on a later day, e.g. with diff=True, produces the same dates. The first load starts today.
+        ** createAllData runs the stages as a pipeline along the Stage DAG: every stage runs in its own thread and
+           starts on the data of its upstream stage as it is generated. The data is the same as with sequential=True,
+           which runs the stages one after the other.
 '''
-def createAllData(cls):
-    ''' Generates all data for the project in the correct order '''
-    res = []
-
-    res.append(cls.createBaseData())
-    res.append(cls.createOperationData())
-    res.append(cls.createAircraftData())
-    res.append(cls.createWorkOrderData())
-    res.append(cls.createMaintenanceRecordData())
-
-    return "\n".join(res)
-
-def createBaseData(cls):
+def createAllData(cls, scale=None, vectorized=False, processes=None, resume=False, diff=False, prune=False, output=None,
+                  sequential=False, verify=None, adaptive=None, start=None):
+    ''' Generates all data for the project, running the stages as a pipeline unless sequential is set '''
+    context = GenerationContext(pipelined=not sequential)
+    return _create_all_data(cls, context, scale, vectorized, processes, resume, diff, prune, output, verify, adaptive,
+                            start)
+
+def createAllDataReport(cls, scale=None, vectorized=False, processes=None, resume=False, diff=False, prune=False,
+                        output=None, log=False, sequential=False, verify=None, adaptive=None, start=None):
+    '''
+        Generates all data like createAllData and returns a LoadReport of the run: the message of every stage, and per
+        stage the time spent generating, upserting (or writing to files) and verifying, the upsertBatch latencies,
+        retries, estimated payload bytes, throughput and peak memory, rollup writes included. With log=True, the report
+        is also logged one line per stage.
+
+        In a pipelined run the stages overlap, so their times add up to more than the wall time of the run, and the
+        generate phase of a downstream stage includes the time it waited for its upstream stage.
+    '''
+    report = LoadReport()
+    context = GenerationContext(report, pipelined=not sequential)
+    message = _create_all_data(cls, context, scale, vectorized, processes, resume, diff, prune, output, verify, adaptive,
+                               start)
+
+    if log:
+        for line in report.log_lines():
+            _logger.info(line)
+
+    return report.to_dict(message)
+
+def _create_all_data(cls, context, scale, vectorized, processes, resume, diff, prune, output, verify, adaptive, start):
+    if context.pipelined and processes and processes > 1:
+        # The process pool forks its workers, and forking a process whose other threads hold locks (the stage
+        # threads, the upsert workers) can deadlock the children. A spawned worker cannot import this module by path.
+        raise ValueError("Shards can only be generated on a process pool when the stages run one after the other. "
+                         "Pass sequential=True with processes > 1.")
+
+    # Resolved once, so that every stage generates from the same start date
+    start = _resolve_start(start)
+
+    # Stages are called directly (not through cls) so that they can share the in-memory context
+    stage_fns = {
+        "Base": lambda: createBaseData(cls, output, verify, adaptive, context),
+        "Operation": lambda: createOperationData(cls, scale, processes, resume, diff, prune, output, verify, adaptive, start,
+                                                 context),
+        "Aircraft": lambda: createAircraftData(cls, scale, processes, resume, diff, prune, output, verify, adaptive, start,
+                                               context),
+        "WorkOrder": lambda: createWorkOrderData(cls, scale, vectorized, processes, resume, diff, prune, output, verify,
+                                                 adaptive, start, context),
+        "MaintenanceRecord": lambda: createMaintenanceRecordData(cls, scale, vectorized, processes, resume, diff, prune, output,
+                                                                 verify, adaptive, start, context)
+    }
+
+    def _run_stage(name):
+        published = STAGE_DAG[name][1]
+        try:
+            if context.report is None:
+                message = stage_fns[name]()
+            else:
+                message = context.report.timed_stage(name, stage_fns[name])
+        except Exception as e:
+            # Do not leave the downstream stages waiting for data that will not come
+            context.release(published, e)
+            raise
+        finally:
+            # Nor the upstream stages waiting for a reader that is gone
+            context.detach(STAGE_READS.get(name, ()))
+
+        context.release(published)
+        return message
+
+    if not context.pipelined:
+        return "\n".join(_run_stage(name) for name in STAGE_DAG)
+
+    # Every stage gets its own thread; the context blocks each one until the data it reads is available
+    with ThreadPoolExecutor(max_workers=len(STAGE_DAG)) as executor:
+        futures = [executor.submit(_run_stage, name) for name in STAGE_DAG]
+        return "\n".join(future.result() for future in futures)
+
+def createBaseData(cls, output=None, verify=None, adaptive=None, context=None):
     ''' Generates data for NUM_BASES bases '''
-    if c3.Base.fetchCount() == NUM_BASES:
+    sink = _stage_sink(output, context=context, adaptive=adaptive)
+    checksum = _stage_checksum(c3.Base, "BASE-", verify, sink)
+
+    if sink.writes_to_store and c3.Base.fetchCount() == NUM_BASES:
         return "Base data already exists. Skipping data generation."
 
     def _generate_random_base_name(index):
@@ -121,449 +2067,1582 @@ def createBaseData(cls):
     if NUM_BASES > len(us_city_coords):
         raise ValueError(f"{NUM_BASES} exceeds the amount of hard-coded locations in DataGenerator.createBaseData(). Please add more coordinate pairs or decrease NUM_BASES.")
 
-    base_objs = []
-    for i in range(1, NUM_BASES + 1):
-        latitude, longitude = us_city_coords[i]
+    def _generate_base_objs():
+        for i in range(1, NUM_BASES + 1):
+            latitude, longitude = us_city_coords[i]
 
-        base_objs.append({
-            "id": f"BASE-{i}",
-            "name": _generate_random_base_name(i),
-            "latitude": latitude,
-            "longitude": longitude,
-        })
-
-    _upsert_helper(base_objs, c3.Base)
+            yield {
+                "id": f"BASE-{i}",
+                "name": _generate_random_base_name(i),
+                "latitude": latitude,
+                "longitude": longitude,
+            }
 
-    post_upsert_ct = c3.Base.fetchCount()
+    records = _generate_base_objs()
+    if checksum is not None:
+        records = checksum.track(records)
 
-    if post_upsert_ct != NUM_BASES:
-        return f"Warning: Expected to generate {NUM_BASES} Bases, but generated {post_upsert_ct}."
+    upsert_result = sink.write(records, c3.Base)
 
-    return f"Generated {post_upsert_ct} Bases"
+    return _finish_stage(upsert_result, None, c3.Base, "Bases", sink=sink, checksum=checksum)
 
 '''
-    SortedList Class 
-    A simple sorted list implementation using bisect for insertion.
+    FleetScheduler Class
+    Discrete-event state of the fleet for the Operation simulation.
 
-    This class is used to manage a sorted list of aircrafts that are currently in use during operations.
-    I wrote it manually to avoid having to modify the runtime to include an external library (sortedcontainers).
-    It provides methods to add, remove, and access elements while maintaining order.
+    Idle aircraft sit in a plain list and are picked uniformly at random by swapping the chosen entry with the last
+    one and popping it, which is O(1). Busy aircraft sit in a min-heap keyed by the end date of their operation, so
+    releasing every aircraft whose operation has ended by a given day costs O(log n) per aircraft, in end date order.
+    Ties on the end date are released in the order the aircraft were dispatched.
 '''
-class SortedList:
-    def __init__(self, iterable=None):
-        self._list = []
-        if iterable is not None:
-            for item in iterable:
-                self.add(item)
+class FleetScheduler:
+    def __init__(self, idle_aircraft_ids, busy_aircrafts=()):
+        self._idle = list(idle_aircraft_ids)
+        self._busy = []
+        self._num_dispatched = 0
+
+        for aircraft_id, end_date in busy_aircrafts:
+            self.dispatch(aircraft_id, end_date)
+
+    def release_until(self, curr_date):
+        """Move every aircraft whose operation ends on or before curr_date back to the idle pool."""
+        while self._busy and self._busy[0][0] <= curr_date:
+            _, _, aircraft_id = heapq.heappop(self._busy)
+            self._idle.append(aircraft_id)
+
+    def acquire(self, rng):
+        """Remove and return a uniformly random idle aircraft."""
+        index = rng.randint(0, len(self._idle) - 1)
+        self._idle[index], self._idle[-1] = self._idle[-1], self._idle[index]
+        return self._idle.pop()
+
+    def dispatch(self, aircraft_id, end_date):
+        """Mark an aircraft as busy until end_date."""
+        heapq.heappush(self._busy, (end_date, self._num_dispatched, aircraft_id))
+        self._num_dispatched += 1
+
+    def num_idle(self):
+        return len(self._idle)
+
+    def busy_aircrafts(self):
+        """Return (aircraft id, end date) for every busy aircraft, in release order."""
+        return [(aircraft_id, end_date) for end_date, _, aircraft_id in sorted(self._busy)]
+
+def _simulate_operations(scheduler, start_date, end_date, max_daily_operations, rng):
+    """
+    Runs the fleet simulation one day at a time from start_date (inclusive) to end_date (exclusive).
 
-    def add(self, value):
-        """Insert value into the sorted list."""
-        bisect.insort(self._list, value)
+    Each day, aircraft whose operations have ended are released, then between 1 and max_daily_operations operations
+    are started on randomly chosen idle aircraft, each lasting 0 to 15 days.
 
-    def pop(self, index=-1):
-        """Remove and return item at index."""
-        return self._list.pop(index)
+    Yields:
+        (aircraft id, operation start, operation end) for every operation, in start date order. The caller may draw
+        from rng between items; the draws stay in the same order as long as the generator is consumed lazily.
+    """
+    curr_date = start_date
 
-    def __len__(self):
-        return len(self._list)
+    while curr_date < end_date:
+        # Free aircrafts whose operations have ended
+        scheduler.release_until(curr_date)
 
-def createOperationData(cls):
-    ''' Generates data for the num_operations operations '''
+        num_objs_to_generate = rng.randint(1, max_daily_operations)
 
-    if c3.Operation.fetchCount() == NUM_OPERATIONS:
-        return "Operation data already exists. Skipping data generation."
+        for _ in range(num_objs_to_generate):
+            if scheduler.num_idle() == 0:
+                break
+
+            operation_end = curr_date + timedelta(days=rng.randint(0, 15))
+
+            # Randomly select an aircraft from the available aircrafts
+            aircraft_id = scheduler.acquire(rng)
+            scheduler.dispatch(aircraft_id, operation_end)
+
+            yield aircraft_id, curr_date, operation_end
+
+        # Move the simulation to the next day
+        curr_date += timedelta(days=1)
+
+def _generate_operation_shard(shard_index, first_aircraft_number, num_aircrafts, max_daily_operations,
+                              start_date=None, end_date=None, busy_aircrafts=(), stream="Operation"):
+    '''
+        Simulates the operations of one fleet shard: aircraft first_aircraft_number to first_aircraft_number + num_aircrafts - 1
+
+        The simulation covers start_date to end_date (START_DATE to END_DATE by default) with the whole shard idle,
+        unless the (aircraft id, end date) pairs of the aircraft still busy at its start are given, as advanceSimulation
+        does for a later window.
+    '''
+    rng = _shard_rng(stream, shard_index)
 
     def _generate_random_description():
         description_map = ["Mission", "Training", "Test"]
-            
-        return _random.choice(description_map)
 
-    def _generate_random_end_date(operation_start):
-        return operation_start + relativedelta(days=_random.randint(0,15))
-    
+        return rng.choice(description_map)
+
     def _generate_random_alerts():
         alerts = ["Engine Check", "Fuel Low", "Navigation System Fault", "Communication Error",
             "Landing Gear Issue", "Hydraulic System Warning", "Weather Alert", "Air Traffic Control Delay",
             "Security Alert", "Maintenance Required"]
-        
-        sample_size = _random.randint(0,5)
+
+        sample_size = rng.randint(0,5)
 
         if sample_size == 0:
             return []
-        
-        alerts = _random.sample(alerts, sample_size)
+
+        alerts = rng.sample(alerts, sample_size)
 
         return alerts
-    
+
     def _generate_random_status():
         statuses = ["Planned", "In Progress", "Completed"]
-        return _random.choice(statuses)
-    
+        return rng.choice(statuses)
+
     def _generate_random_base():
-        return f"BASE-{_random.randint(1, NUM_BASES)}"
-    
-    available_aircrafts = SortedList([f"AIRCRAFT-{i}" for i in range(1, NUM_AIRCRAFTS + 1)])
+        return f"BASE-{rng.randint(1, NUM_BASES)}"
 
-    aircrafts_in_use = deque()
+    busy_aircraft_ids = {aircraft_id for aircraft_id, _ in busy_aircrafts}
+    scheduler = FleetScheduler((f"AIRCRAFT-{i}" for i in range(first_aircraft_number, first_aircraft_number + num_aircrafts)
+                                if f"AIRCRAFT-{i}" not in busy_aircraft_ids), busy_aircrafts)
 
-    curr_date = START_DATE
+    start_date = start_date or START_DATE
+    end_date = end_date or END_DATE
 
     operation_objs = []
-    while curr_date < END_DATE:
-        # Free aircrafts whose operations have ended
-        while aircrafts_in_use and aircrafts_in_use[0][1] <= curr_date:
-            finished_aircraft_id, _ = aircrafts_in_use.popleft()
-            available_aircrafts.add(finished_aircraft_id)
-        
-        num_objs_to_generate = _random.randint(1, 30)
-        
-        for _ in range(num_objs_to_generate):
-            if len(available_aircrafts) == 0:
-                break
-            
-            # Use sim_start as the operation start date
-            operation_start = curr_date
-            operation_end = _generate_random_end_date(operation_start)
+    for aircraft_id, operation_start, operation_end in _simulate_operations(scheduler, start_date, end_date, max_daily_operations, rng):
+        operation_objs.append({
+            "id": None,  # Numbered by createOperationData once the shards are merged
+            "aircraft": aircraft_id,
+            "description": _generate_random_description(),
+            "startDate": operation_start,
+            "endDate": operation_end,
+            "alerts": _generate_random_alerts(),
+            "status": _generate_random_status(),
+            "origin": _generate_random_base(),
+            "destination": _generate_random_base()
+        })
 
-            # Randomly select an aircraft from the available aircrafts
-            aircraft_id = available_aircrafts.pop(_random.randint(0, len(available_aircrafts) - 1))
-            
-            aircrafts_in_use.append((aircraft_id, operation_end))
-
-            operation_objs.append({
-                "id": f"OPERATION-{len(operation_objs) + 1}",
-                "aircraft": aircraft_id,
-                "description": _generate_random_description(),
-                "startDate": operation_start,
-                "endDate": operation_end,
-                "alerts": _generate_random_alerts(),
-                "status": _generate_random_status(),
-                "origin": _generate_random_base(),
-                "destination": _generate_random_base()
-            })
-
-        # Move the simulation start date to the next day
-        curr_date += relativedelta(days=1)
-
-    _upsert_helper(operation_objs, c3.Operation)
-
-    post_upsert_ct = c3.Operation.fetchCount()
-
-    if post_upsert_ct != NUM_OPERATIONS:
-        return f"Warning: Expected to generate {NUM_OPERATIONS} Operations, but generated {post_upsert_ct}."
-    
-    return f"Generated {post_upsert_ct} Operations"
-
-def createAircraftData(cls):
-    ''' Generates data for NUM_AIRCRAFTS aircrafts '''
-    if c3.Aircraft.fetchCount() == NUM_AIRCRAFTS:
-        return "Aircraft data already exists. Skipping data generation."
-    
-    if c3.Operation.fetchCount() != NUM_OPERATIONS:
-        return "Operation data must be generated before Aircraft data. Please generate Operation data first."
+    return operation_objs
+
+def _operation_shards(scale, start_date, end_date):
+    '''
+        Yields the arguments of _generate_operation_shard for every fleet shard, simulated from start_date to end_date.
+
+        The fleet is split into independent sub-fleets of OPERATION_SHARD_AIRCRAFTS aircraft, each with a share of the
+        daily operation cap proportional to its size.
+    '''
+    num_aircrafts = _scaled_count(NUM_AIRCRAFTS, scale)
+
+    for shard_index, first_aircraft_number in enumerate(range(1, num_aircrafts + 1, OPERATION_SHARD_AIRCRAFTS)):
+        num_shard_aircrafts = min(OPERATION_SHARD_AIRCRAFTS, num_aircrafts - first_aircraft_number + 1)
+        max_daily_operations = _scaled_count(MAX_DAILY_OPERATIONS, num_shard_aircrafts / NUM_AIRCRAFTS)
+
+        yield shard_index, first_aircraft_number, num_shard_aircrafts, max_daily_operations, start_date, end_date
+
+def createOperationData(cls, scale=None, processes=None, resume=False, diff=False, prune=False, output=None, verify=None,
+                        adaptive=None, start=None, context=None):
+    ''' Generates data for the num_operations operations '''
+    scale = _resolve_scale(scale)
+    start_date = _resolve_start(start)
+    manifest = LoadManifest("Operation", scale, start_date) if resume else None
+    record_diff = _stage_diff(c3.Operation, "OPERATION-", diff, resume)
+    sink = _stage_sink(output, resume, diff, context, adaptive)
+    checksum = _stage_checksum(c3.Operation, "OPERATION-", verify, sink)
+    dataset = DatasetState(c3.Operation, "OPERATION-", scale, start_date=start_date) if sink.writes_to_store else None
+
+    if manifest is not None and manifest.is_complete():
+        return "Operation data was already loaded. Skipping data generation."
+
+    if manifest is None and record_diff is None and dataset is not None and dataset.is_loaded(NUM_OPERATIONS if scale == 1 else None):
+        return "Operation data already exists. Skipping data generation."
+
+    last_aircraft_locations = context.publish("last_aircraft_locations", {}) if context is not None else None
+    operation_alerts = context.publish("operation_alerts", []) if context is not None else None
+
+    def _generate_operation_objs():
+        num_operations = 0
+
+        for operation_objs in _run_shards(_generate_operation_shard, _operation_shards(scale, start_date, _end_date(start_date)),
+                                            processes):
+            for operation_obj in operation_objs:
+                num_operations += 1
+                operation_obj["id"] = f"OPERATION-{num_operations}"
+
+                if context is not None:
+                    # Operations of an aircraft are generated in startDate order, so the last one seen is its latest
+                    last_aircraft_locations[operation_obj["aircraft"]] = operation_obj["destination"]
+                    if operation_obj["alerts"]:
+                        operation_alerts.append((operation_obj["aircraft"], operation_obj["alerts"], operation_obj["startDate"]))
+
+                yield operation_obj
+
+        if context is not None:
+            # The downstream stages can go on while the Operations are still being upserted
+            context.finish("last_aircraft_locations")
+            context.finish("operation_alerts")
+
+    rollup = StatusRollup.operations()
+    records = rollup.count(_generate_operation_objs(), lambda record: record["startDate"])
+    if checksum is not None:
+        records = checksum.track(records)
+    if record_diff is not None:
+        records = record_diff.changed(records)
+
+    _record_start(start_date, sink)
+    upsert_result = sink.write(records, c3.Operation, manifest)
+
+    message = _finish_stage(upsert_result, manifest, c3.Operation, "Operations", record_diff, prune, sink, checksum,
+                            dataset)
+    return _write_rollup(rollup, sink, upsert_result, message, "Operation", record_diff)
+
+def _generate_aircraft_shard(shard_index, first_aircraft_number, num_aircrafts, last_aircraft_locs, start_date, end_date):
+    ''' Generates aircraft first_aircraft_number to first_aircraft_number + num_aircrafts - 1, inspected between start_date and end_date '''
+    rng = _shard_rng("Aircraft", shard_index)
 
     def _generate_random_registration_number():
         prefix = ["N"]
-        numbers = [str(_random.randint(0,9)) for _ in range(3)]
-        suffix = [_random.choice(string.ascii_uppercase) for _ in range(2)]
+        numbers = [str(rng.randint(0,9)) for _ in range(3)]
+        suffix = [rng.choice(string.ascii_uppercase) for _ in range(2)]
 
         reg_num = prefix + numbers + suffix
         reg_num_str = "".join(reg_num)
         return reg_num_str
-    
+
     def _generate_random_model():
         models = ["F-16C", "F-16D", "C17-A", "C130-H", "C130-J", "KC135-R", "KC135-T"]
 
-        return _random.choice(models)
+        return rng.choice(models)
 
     def _generate_random_date_within_range(start, end):
         delta = end - start
-        random_days = _random.randint(0, delta.days)
+        random_days = rng.randint(0, delta.days)
         return start + relativedelta(days=random_days)
-    
+
     def _get_last_aircraft_location(aircraft_id, last_aircraft_locs):
-        if aircraft_id in last_aircraft_locs.index:
-            return last_aircraft_locs.loc[aircraft_id]["destination"].id
-        
+        if aircraft_id in last_aircraft_locs:
+            return last_aircraft_locs[aircraft_id]
+
         # Handle case where aircraft has no operations yet
-        return f"BASE-{_random.randint(1, NUM_BASES)}"
-    
+        return f"BASE-{rng.randint(1, NUM_BASES)}"
+
     def _generate_random_status():
         statuses = ["Ready", "In Maintenance", "Grounded", "Deployed"]
-        
-        probabilites = [0.50, 0.15, 0.05, 0.30]
-
-        return _random.choices(statuses, probabilites)[0]
-
-    def _get_last_aircraft_destinations():
-        # Retrieve all operations data
-        operations_data = c3.Operation.eval(limit=-1).to_pandas()
-
-        operations_data['aircraft'] = operations_data['aircraft'].astype(str)
 
-        # Get the last operation for each aircraft based on startDate
-        last_ops = operations_data.loc[operations_data.groupby('aircraft')['startDate'].idxmax()]
-        last_ops = last_ops[['aircraft', 'destination']]
-
-        # Set 'aircraft' as the index for fast lookups
-        last_locs = last_ops.set_index("aircraft").sort_index()
-
-        return last_locs
+        probabilites = [0.50, 0.15, 0.05, 0.30]
 
-    last_aircraft_locs = _get_last_aircraft_destinations()
+        return rng.choices(statuses, probabilites)[0]
 
     aircraft_objs = []
-    for i in range(1, NUM_AIRCRAFTS + 1):
+    for i in range(first_aircraft_number, first_aircraft_number + num_aircrafts):
         aircraft_id = f"AIRCRAFT-{i}"
         aircraft_objs.append({
             "id": aircraft_id,
             "registrationNumber": _generate_random_registration_number(),
             "model": _generate_random_model(),
             "status": _generate_random_status(),
-            "lastInspectionDate": _generate_random_date_within_range(START_DATE, END_DATE),
+            "lastInspectionDate": _generate_random_date_within_range(start_date, end_date),
             "location": _get_last_aircraft_location(aircraft_id, last_aircraft_locs)
         })
 
-    _upsert_helper(aircraft_objs, c3.Aircraft)
-
-    post_upsert_ct = c3.Aircraft.fetchCount()
+    return aircraft_objs
 
-    if post_upsert_ct != NUM_AIRCRAFTS:
-        return f"Warning: Expected to generate {NUM_AIRCRAFTS} Aircrafts, but generated {post_upsert_ct}."
-
-    return f"Generated {post_upsert_ct} Aircrafts"
+def createAircraftData(cls, scale=None, processes=None, resume=False, diff=False, prune=False, output=None, verify=None,
+                       adaptive=None, start=None, context=None):
+    ''' Generates data for NUM_AIRCRAFTS aircrafts '''
+    scale = _resolve_scale(scale)
+    start_date = _resolve_start(start)
+    num_aircrafts = _scaled_count(NUM_AIRCRAFTS, scale)
+    manifest = LoadManifest("Aircraft", scale, start_date) if resume else None
+    record_diff = _stage_diff(c3.Aircraft, "AIRCRAFT-", diff, resume)
+    sink = _stage_sink(output, resume, diff, context, adaptive)
+    checksum = _stage_checksum(c3.Aircraft, "AIRCRAFT-", verify, sink)
+    dataset = DatasetState(c3.Aircraft, "AIRCRAFT-", scale, start_date=start_date) if sink.writes_to_store else None
+
+    if manifest is not None and manifest.is_complete():
+        return "Aircraft data was already loaded. Skipping data generation."
+
+    if manifest is None and record_diff is None and dataset is not None and dataset.is_loaded(num_aircrafts):
+        return "Aircraft data already exists. Skipping data generation."
 
-def createWorkOrderData(cls):
-    import pandas as pd
+    published_locations = context.subscribe("last_aircraft_locations", complete=True) if context is not None else None
 
-    ''' Generates data for NUM_WORK_ORDERS work orders '''
-    if c3.WorkOrder.fetchCount() == NUM_WORK_ORDERS:
-        return "Work Order data already exists. Skipping data generation."
-    
-    if c3.Operation.fetchCount() != NUM_OPERATIONS:
+    if published_locations is None and c3.Operation.fetchCount() == 0:
         return "Operation data must be generated before Aircraft data. Please generate Operation data first."
 
+    def _get_last_aircraft_destinations():
+        # Stream the operations and keep the latest one of each aircraft by startDate, ties going to the later
+        # operation like in the in-memory path
+        last_ops = {}
+        for operation in _read_records(c3.Operation, ["aircraft", "destination", "startDate"]):
+            key = (operation.startDate, _id_number(operation.id))
+            last_op = last_ops.get(operation.aircraft.id)
+            if last_op is None or key > last_op[0]:
+                last_ops[operation.aircraft.id] = (key, operation.destination.id)
+
+        # Map each aircraft to the id of its last destination for fast lookups
+        return {aircraft_id: destination_id for aircraft_id, (_, destination_id) in last_ops.items()}
+
+    if published_locations is not None:
+        last_aircraft_locs = published_locations
+    else:
+        last_aircraft_locs = _get_last_aircraft_destinations()
+
+    def _aircraft_shards():
+        for shard_index, first_aircraft_number in enumerate(range(1, num_aircrafts + 1, AIRCRAFT_SHARD_SIZE)):
+            num_shard_aircrafts = min(AIRCRAFT_SHARD_SIZE, num_aircrafts - first_aircraft_number + 1)
+
+            # Only ship the locations of the shard's own aircraft to the worker
+            shard_locs = {}
+            for i in range(first_aircraft_number, first_aircraft_number + num_shard_aircrafts):
+                aircraft_id = f"AIRCRAFT-{i}"
+                if aircraft_id in last_aircraft_locs:
+                    shard_locs[aircraft_id] = last_aircraft_locs[aircraft_id]
+
+            yield shard_index, first_aircraft_number, num_shard_aircrafts, shard_locs, start_date, _end_date(start_date)
+
+    def _generate_aircraft_objs():
+        for aircraft_objs in _run_shards(_generate_aircraft_shard, _aircraft_shards(), processes):
+            yield from aircraft_objs
+
+    rollup = StatusRollup.aircraft()
+    records = rollup.count(_generate_aircraft_objs(), lambda record: record["location"])
+    if checksum is not None:
+        records = checksum.track(records)
+    if record_diff is not None:
+        records = record_diff.changed(records)
+
+    _record_start(start_date, sink)
+    upsert_result = sink.write(records, c3.Aircraft, manifest)
+
+    message = _finish_stage(upsert_result, manifest, c3.Aircraft, "Aircrafts", record_diff, prune, sink, checksum,
+                            dataset)
+    return _write_rollup(rollup, sink, upsert_result, message, "Aircraft", record_diff)
+
+def _generate_work_order_shard(shard_index, operation_alerts, vectorized, end_date=None, stream="WorkOrder"):
+    '''
+        Generates the work orders for a shard of (aircraft id, alerts, startDate) operation tuples. Work orders due
+        before end_date (END_DATE by default) are closed.
+
+        Returns a list of work order objects, or a ColumnBatch in the vectorized mode. Ids are left for
+        createWorkOrderData to assign once the shards are merged.
+    '''
+    alert_to_description = {
+        "Engine Check": "Perform engine inspection and maintenance",
+        "Fuel Low": "Refuel aircraft to operational capacity",
+        "Navigation System Fault": "Repair navigation system components",
+        "Communication Error": "Fix communication equipment and systems",
+        "Landing Gear Issue": "Inspect and repair landing gear assembly",
+        "Hydraulic System Warning": "Service hydraulic systems and check for leaks",
+        "Weather Alert": "Perform weather-related damage inspection",
+        "Air Traffic Control Delay": "Complete delayed maintenance procedures",
+        "Security Alert": "Conduct security inspection and clearance",
+        "Maintenance Required": "Perform scheduled maintenance tasks"
+    }
+
     def _get_alert_work_order_description(alert):
-        alert_to_description = {
-            "Engine Check": "Perform engine inspection and maintenance",
-            "Fuel Low": "Refuel aircraft to operational capacity",
-            "Navigation System Fault": "Repair navigation system components",
-            "Communication Error": "Fix communication equipment and systems",
-            "Landing Gear Issue": "Inspect and repair landing gear assembly",
-            "Hydraulic System Warning": "Service hydraulic systems and check for leaks",
-            "Weather Alert": "Perform weather-related damage inspection",
-            "Air Traffic Control Delay": "Complete delayed maintenance procedures",
-            "Security Alert": "Conduct security inspection and clearance",
-            "Maintenance Required": "Perform scheduled maintenance tasks"
-        }
-        
         return alert_to_description[alert]
 
-    def _get_alert_priority(alert):
-        priority_map = {
-            "Engine Check": "HIGH",
-            "Fuel Low": "HIGH",
-            "Navigation System Fault": "HIGH",
-            "Communication Error": "MEDIUM",
-            "Landing Gear Issue": "HIGH",
-            "Hydraulic System Warning": "HIGH",
-            "Weather Alert": "MEDIUM",
-            "Air Traffic Control Delay": "LOW",
-            "Security Alert": "HIGH",
-            "Maintenance Required": "MEDIUM"
-        }
+    priority_map = {
+        "Engine Check": "HIGH",
+        "Fuel Low": "HIGH",
+        "Navigation System Fault": "HIGH",
+        "Communication Error": "MEDIUM",
+        "Landing Gear Issue": "HIGH",
+        "Hydraulic System Warning": "HIGH",
+        "Weather Alert": "MEDIUM",
+        "Air Traffic Control Delay": "LOW",
+        "Security Alert": "HIGH",
+        "Maintenance Required": "MEDIUM"
+    }
 
+    def _get_alert_priority(alert):
         return priority_map[alert]
-        
-    operations_data = c3.Operation.eval(limit=-1).to_pandas()
 
-    work_order_objs = []
+    def _generate_work_order_objs():
+        import pandas as pd
+
+        rng = _shard_rng(stream, shard_index)
+        closed_before = pd.Timestamp(end_date or END_DATE)
+
+        work_order_objs = []
+        for aircraft_id, alerts, startDate in operation_alerts:
+            for alert in alerts:
+                dueDate = startDate + relativedelta(days=rng.randint(1,5))
+
+                status = "CLOSED" if pd.Timestamp(dueDate) < closed_before else "OPEN"
+
+                work_order_objs.append({
+                    "id": None,
+                    "aircraft": aircraft_id,
+                    "description": _get_alert_work_order_description(alert),
+                    "priority": _get_alert_priority(alert),
+                    "status": status,
+                    "createdDate": startDate,
+                    "dueDate": dueDate
+                })
+
+        return work_order_objs
+
+    def _generate_work_order_columns():
+        import numpy as np
+
+        rng = _numpy_rng(stream, shard_index)
+
+        # Alerts are integer-coded, and the alert code doubles as the code of the description and the priority
+        alerts = list(alert_to_description)
+        alert_codes = {alert: code for code, alert in enumerate(alerts)}
+        descriptions = np.array([alert_to_description[alert] for alert in alerts], dtype=object)
+        priorities = np.array([priority_map[alert] for alert in alerts], dtype=object)
+        statuses = np.array(["OPEN", "IN PROGRESS", "CLOSED"], dtype=object)
+        closed_before = np.datetime64(end_date or END_DATE, "D")
+
+        aircraft_ids, operation_alerts_list, start_dates = zip(*operation_alerts)
+        num_alerts = np.fromiter((len(a) for a in operation_alerts_list), dtype=np.int64, count=len(operation_alerts))
+        codes = np.fromiter((alert_codes[alert] for a in operation_alerts_list for alert in a),
+                            dtype=_code_dtype(len(alerts)), count=int(num_alerts.sum()))
+
+        createdDate = np.repeat(_to_datetime64_days(start_dates), num_alerts)
+        dueDate = createdDate + rng.integers(1, 6, size=codes.size).astype("timedelta64[D]")
+
+        return ColumnBatch({
+            "aircraft": np.repeat(_id_numbers(aircraft_ids), num_alerts),
+            "description": codes,
+            "priority": codes,
+            "status": np.where(dueDate < closed_before, 2, 0).astype(_code_dtype(len(statuses))),
+            "createdDate": createdDate,
+            "dueDate": dueDate
+        }, categories={"description": descriptions, "priority": priorities, "status": statuses},
+           id_prefixes={"aircraft": "AIRCRAFT-"})
+
+    if vectorized:
+        return _generate_work_order_columns()
+
+    return _generate_work_order_objs()
+
+def createWorkOrderData(cls, scale=None, vectorized=False, processes=None, resume=False, diff=False, prune=False, output=None, verify=None,
+                        adaptive=None, start=None, context=None):
+    ''' Generates data for NUM_WORK_ORDERS work orders '''
+    import numpy as np
 
-    for row in operations_data.itertuples():
-        alerts = row.alerts
-        startDate = row.startDate
+    scale = _resolve_scale(scale)
+    start_date = _resolve_start(start)
+    manifest = LoadManifest("WorkOrder", scale, start_date, vectorized) if resume else None
+    record_diff = _stage_diff(c3.WorkOrder, "WORK-ORDER-", diff, resume)
+    sink = _stage_sink(output, resume, diff, context, adaptive)
+    checksum = _stage_checksum(c3.WorkOrder, "WORK-ORDER-", verify, sink)
+    dataset = DatasetState(c3.WorkOrder, "WORK-ORDER-", scale, vectorized, start_date) if sink.writes_to_store else None
 
-        if not alerts:
-            continue
+    if manifest is not None and manifest.is_complete():
+        return "Work Order data was already loaded. Skipping data generation."
 
-        for alert in alerts:
-            dueDate = startDate + relativedelta(days=_random.randint(1,5))
+    if manifest is None and record_diff is None and dataset is not None and dataset.is_loaded(NUM_WORK_ORDERS if scale == 1 and not vectorized else None):
+        return "Work Order data already exists. Skipping data generation."
 
-            status = "CLOSED" if dueDate < pd.Timestamp(END_DATE) else "OPEN"
+    published_alerts = context.subscribe("operation_alerts") if context is not None else None
+
+    if published_alerts is None and c3.Operation.fetchCount() == 0:
+        return "Operation data must be generated before Work Order data. Please generate Operation data first."
+
+    def _get_operation_alerts():
+        if published_alerts is not None:
+            return published_alerts
+
+        # Same order as the in-memory path (by operation number), so both paths shard the operations identically
+        operations = _read_generated_records(c3.Operation, "OPERATION-", ["aircraft", "alerts", "startDate"])
+        return ((operation.aircraft.id, operation.alerts, operation.startDate) for operation in operations if operation.alerts)
+
+    work_orders = context.publish("work_orders", []) if context is not None else None
+
+    def _work_order_shards():
+        for shard_index, operation_alerts in enumerate(_chunks(_get_operation_alerts(), WORK_ORDER_SHARD_SIZE)):
+            yield shard_index, operation_alerts, vectorized, _end_date(start_date)
+
+    def _generate_work_order_objs():
+        num_work_orders = 0
+
+        for shard_output in _run_shards(_generate_work_order_shard, _work_order_shards(), processes):
+            if vectorized:
+                ids = np.arange(num_work_orders + 1, num_work_orders + len(shard_output) + 1, dtype=np.uint32)
+                num_work_orders += ids.size
+                batch = shard_output.with_column("id", ids, first=True, id_prefix="WORK-ORDER-")
+
+                if context is not None:
+                    # Kept column-wise for the vectorized Maintenance Record stage
+                    work_orders.append(batch)
+
+                yield from batch.to_records()
+                continue
+
+            for work_order_obj in shard_output:
+                num_work_orders += 1
+                work_order_obj["id"] = f"WORK-ORDER-{num_work_orders}"
+
+                if context is not None:
+                    work_orders.append((work_order_obj["id"], work_order_obj["aircraft"], work_order_obj["description"],
+                                        work_order_obj["createdDate"], work_order_obj["dueDate"]))
+
+                yield work_order_obj
+
+        if context is not None:
+            context.finish("work_orders")
+
+    records = _generate_work_order_objs()
+    if checksum is not None:
+        records = checksum.track(records)
+    if record_diff is not None:
+        records = record_diff.changed(records)
+
+    _record_start(start_date, sink)
+    upsert_result = sink.write(records, c3.WorkOrder, manifest)
+
+    return _finish_stage(upsert_result, manifest, c3.WorkOrder, "Work Orders", record_diff, prune, sink, checksum,
+                            dataset)
+
+def _generate_maintenance_record_shard(shard_index, work_orders, vectorized, stream="MaintenanceRecord"):
+    '''
+        Generates the maintenance records for a shard of (id, aircraft id, description, createdDate, dueDate) work order tuples.
+
+        Returns a list of maintenance record objects, or a ColumnBatch in the vectorized mode. Ids are left for
+        createMaintenanceRecordData to assign once the shards are merged. In the vectorized mode, the work orders can
+        also be given as a ColumnBatch.
+    '''
+    maintenance_types = ["SCHEDULED", "UNSCHEDULED", "EMERGENCY"]
+
+    work_order_desc_to_maintenance_record_desc = {
+        "Perform engine inspection and maintenance": [
+            "Replaced worn turbine blades",
+            "Cleaned fuel injectors and filters",
+            "Recalibrated engine sensors",
+            "Replaced engine oil and filter",
+            "Inspected combustion chamber for cracks"
+        ],
+        "Refuel aircraft to operational capacity": [
+            "Filled main fuel tanks to capacity",
+            "Inspected fuel lines for leaks",
+            "Verified fuel quality and contamination check",
+            "Topped off auxiliary fuel tanks",
+            "Calibrated fuel quantity indicators"
+        ],
+        "Repair navigation system components": [
+            "Replaced faulty GPS module",
+            "Recalibrated inertial navigation system",
+            "Updated navigation software to latest version",
+            "Repaired antenna connection",
+            "Replaced navigation display unit"
+        ],
+        "Fix communication equipment and systems": [
+            "Replaced radio transceiver unit",
+            "Repaired antenna cable connection",
+            "Updated communication software",
+            "Cleaned and tested headset jacks",
+            "Replaced intercom system amplifier"
+        ],
+        "Inspect and repair landing gear assembly": [
+            "Replaced worn brake pads",
+            "Serviced and greased landing gear struts",
+            "Replaced damaged tire",
+            "Inspected and adjusted wheel alignment",
+            "Replaced landing gear actuator seal"
+        ],
+        "Service hydraulic systems and check for leaks": [
+            "Replaced leaking hydraulic line",
+            "Topped off hydraulic fluid reservoir",
+            "Replaced worn hydraulic pump seals",
+            "Cleaned hydraulic filter and replaced element",
+            "Tested system pressure and flow rates"
+        ],
+        "Perform weather-related damage inspection": [
+            "Inspected exterior for hail damage",
+            "Checked wing surfaces for lightning strike marks",
+            "Examined control surfaces for wind damage",
+            "Inspected windshield for crack propagation",
+            "Assessed corrosion from moisture exposure"
+        ],
+        "Complete delayed maintenance procedures": [
+            "Completed 100-hour inspection checklist",
+            "Performed overdue avionics system test",
+            "Executed deferred structural inspection",
+            "Completed postponed engine run-up test",
+            "Finished pending electrical system checks"
+        ],
+        "Conduct security inspection and clearance": [
+            "Performed thorough cabin security sweep",
+            "Inspected cargo hold for unauthorized items",
+            "Verified integrity of access panels and doors",
+            "Checked security seals on sensitive equipment",
+            "Conducted pre-flight security screening"
+        ],
+        "Perform scheduled maintenance tasks": [
+            "Completed routine pre-flight inspection",
+            "Performed scheduled lubrication service",
+            "Executed 50-hour maintenance checklist",
+            "Conducted periodic system functional tests",
+            "Performed routine safety equipment inspection"
+        ]
+    }
+
+    suppliers = ["AeroTech Solutions", "Precision Aviation Services", "SkyMaster Maintenance Corp",
+        "Apex Aircraft Support", "Horizon Aviation Systems", "TitanAir Logistics",
+        "Premier Flight Services"]
+
+    technicians = ["James Rodriguez", "Sarah Chen", "Michael Thompson", "Emily Davis",
+        "Robert Martinez", "Jennifer Kim", "David Anderson"]
+
+    def _generate_maintenance_record_objs():
+        rng = _shard_rng(stream, shard_index)
+
+        def _generate_random_maintenance_type():
+            return rng.choice(maintenance_types)
+
+        def _generate_random_maintenance_record_description(description):
+            return rng.choice(work_order_desc_to_maintenance_record_desc[description])
+
+        def _generate_random_supplier_name():
+            return rng.choice(suppliers)
+
+        def _generate_random_technician_name():
+            return rng.choice(technicians)
+
+        maintenance_record_objs = []
+        for work_order_id, aircraft_id, description, createdDate, dueDate in work_orders:
+            num_maintenance_records = rng.randint(2,4)
+            for _ in range(num_maintenance_records):
+                total_duration_in_days = (dueDate - createdDate).days
+
+                # Generate start date within the work order timeframe
+                num_days_from_start = rng.randint(0, total_duration_in_days)
+                startDate = createdDate + relativedelta(days=num_days_from_start)
+
+                # Generate maintenance duration (how many days the work takes)
+                remaining_days = total_duration_in_days - num_days_from_start
+                maintenance_duration = rng.randint(0, max(1, remaining_days))  # At least 0 days
+                endDate = startDate + relativedelta(days=maintenance_duration)
+
+                maintenance_record_objs.append({
+                    "id": None,  # Numbered by createMaintenanceRecordData once the shards are merged
+                    "aircraft": aircraft_id,
+                    "maintenanceType": _generate_random_maintenance_type(),
+                    "startDate": startDate,
+                    "endDate": endDate,
+                    "description": _generate_random_maintenance_record_description(description),
+                    "workOrder": work_order_id,
+                    "supplierName": _generate_random_supplier_name(),
+                    "technician": _generate_random_technician_name()
+                })
+
+        return maintenance_record_objs
+
+    def _generate_maintenance_record_columns():
+        import numpy as np
+
+        rng = _numpy_rng(stream, shard_index)
+
+        # Flatten the description options into one table; each work order description owns a slice of it
+        work_order_descs = list(work_order_desc_to_maintenance_record_desc)
+        work_order_desc_codes = {desc: code for code, desc in enumerate(work_order_descs)}
+        num_options = np.array([len(work_order_desc_to_maintenance_record_desc[desc]) for desc in work_order_descs])
+        option_offsets = np.concatenate(([0], np.cumsum(num_options)[:-1]))
+        options = np.array([option for desc in work_order_descs for option in work_order_desc_to_maintenance_record_desc[desc]], dtype=object)
+
+        maintenance_type_table = np.array(maintenance_types, dtype=object)
+        supplier_table = np.array(suppliers, dtype=object)
+        technician_table = np.array(technicians, dtype=object)
+
+        shard = work_orders if isinstance(work_orders, ColumnBatch) else _work_order_batch(work_orders)
+        # Maps the codes of the shard's description labels to the codes of this table
+        shard_desc_codes = np.array([work_order_desc_codes[desc] for desc in shard.categories["description"]])
+
+        # Row index into the shard for every maintenance record (2 to 4 per work order)
+        index = np.repeat(np.arange(len(shard)), rng.integers(2, 5, size=len(shard)))
+        size = index.size
+
+        createdDate = shard.columns["createdDate"][index]
+        total_duration_in_days = (shard.columns["dueDate"][index] - createdDate).astype(np.int64)
+
+        # Start date within the work order timeframe, then a duration of at least 0 days
+        num_days_from_start = rng.integers(0, total_duration_in_days + 1)
+        remaining_days = total_duration_in_days - num_days_from_start
+        maintenance_duration = rng.integers(0, np.maximum(1, remaining_days) + 1)
+        startDate = createdDate + num_days_from_start.astype("timedelta64[D]")
+        endDate = startDate + maintenance_duration.astype("timedelta64[D]")
+
+        desc_codes = shard_desc_codes[shard.columns["description"]][index]
+        option_index = option_offsets[desc_codes] + (rng.random(size) * num_options[desc_codes]).astype(np.int64)
+
+        # Drawn in this order to keep the streams of the earlier versions of this generator
+        maintenance_type_codes = rng.integers(0, len(maintenance_types), size=size).astype(_code_dtype(len(maintenance_types)))
+        supplier_codes = rng.integers(0, len(suppliers), size=size).astype(_code_dtype(len(suppliers)))
+        technician_codes = rng.integers(0, len(technicians), size=size).astype(_code_dtype(len(technicians)))
+
+        return ColumnBatch({
+            "aircraft": shard.columns["aircraft"][index],
+            "maintenanceType": maintenance_type_codes,
+            "startDate": startDate,
+            "endDate": endDate,
+            "description": option_index.astype(_code_dtype(len(options))),
+            "workOrder": shard.columns["id"][index],
+            "supplierName": supplier_codes,
+            "technician": technician_codes
+        }, categories={"maintenanceType": maintenance_type_table, "description": options,
+                       "supplierName": supplier_table, "technician": technician_table},
+           id_prefixes={"aircraft": "AIRCRAFT-", "workOrder": "WORK-ORDER-"})
+
+    if vectorized:
+        return _generate_maintenance_record_columns()
+
+    return _generate_maintenance_record_objs()
+
+def createMaintenanceRecordData(cls, scale=None, vectorized=False, processes=None, resume=False, diff=False, prune=False, output=None, verify=None,
+                                adaptive=None, start=None, context=None):
+    ''' Generates data for NUM_MAINTENANCE_RECORDS maintenance records '''
+    import numpy as np
+
+    scale = _resolve_scale(scale)
+    # Maintenance Records have no dates of their own, but follow from the Work Orders generated from start_date
+    start_date = _resolve_start(start)
+    manifest = LoadManifest("MaintenanceRecord", scale, start_date, vectorized) if resume else None
+    record_diff = _stage_diff(c3.MaintenanceRecord, "MAINTENANCE-RECORD-", diff, resume)
+    sink = _stage_sink(output, resume, diff, context, adaptive)
+    checksum = _stage_checksum(c3.MaintenanceRecord, "MAINTENANCE-RECORD-", verify, sink)
+    dataset = DatasetState(c3.MaintenanceRecord, "MAINTENANCE-RECORD-", scale, vectorized, start_date) if sink.writes_to_store else None
+
+    if manifest is not None and manifest.is_complete():
+        return "Maintenance Record data was already loaded. Skipping data generation."
+
+    if manifest is None and record_diff is None and dataset is not None and dataset.is_loaded(NUM_MAINTENANCE_RECORDS if scale == 1 and not vectorized else None):
+        return "Maintenance Record data already exists. Skipping data generation."
+
+    published_work_orders = context.subscribe("work_orders") if context is not None else None
+
+    if published_work_orders is None and c3.WorkOrder.fetchCount() == 0:
+        return "Work Order data must be generated before Maintenance Record data. Please generate Work Order data first."
 
-            work_order_objs.append({
-                "id": f"WORK-ORDER-{len(work_order_objs) + 1}",
-                "aircraft": row.aircraft.id,
-                "description": _get_alert_work_order_description(alert),
-                "priority": _get_alert_priority(alert),
-                "status": status,
-                "createdDate": startDate,
-                "dueDate": dueDate
-            })
+    def _get_work_orders():
+        if published_work_orders is not None:
+            return published_work_orders
 
-    _upsert_helper(work_order_objs, c3.WorkOrder)
+        # Same order as the in-memory path (by work order number), so both paths shard the work orders identically
+        stored_work_orders = _read_generated_records(c3.WorkOrder, "WORK-ORDER-", ["aircraft", "description", "createdDate", "dueDate"])
+        return ((work_order.id, work_order.aircraft.id, work_order.description, work_order.createdDate, work_order.dueDate)
+                for work_order in stored_work_orders)
 
-    post_upsert_ct = c3.WorkOrder.fetchCount()
+    def _maintenance_record_shards():
+        work_orders = _get_work_orders()
 
-    if post_upsert_ct != NUM_WORK_ORDERS:
-        return f"Warning: Expected to generate {NUM_WORK_ORDERS} Work Orders, but generated {post_upsert_ct}."
+        if vectorized and published_work_orders is not None:
+            chunks = _column_batch_chunks(work_orders, MAINTENANCE_RECORD_SHARD_SIZE)
+        else:
+            chunks = _chunks(work_orders, MAINTENANCE_RECORD_SHARD_SIZE)
 
-    return f"Generated {post_upsert_ct} Work Orders"
+        for shard_index, shard_work_orders in enumerate(chunks):
+            yield shard_index, shard_work_orders, vectorized
 
-def createMaintenanceRecordData(cls):
-    ''' Generates data for NUM_WORK_ORDERS work orders '''
-    if c3.MaintenanceRecord.fetchCount() == NUM_MAINTENANCE_RECORDS:
-        return "Work Order data already exists. Skipping data generation."
-    
-    if c3.WorkOrder.fetchCount() != NUM_WORK_ORDERS:
-        return "Work Order data must be generated before Maintenance Record data. Please generate Work Order data first."
+    def _generate_maintenance_record_objs():
+        num_maintenance_records = 0
 
-    def _generate_random_maintenance_type():
-        return _random.choice(["SCHEDULED", "UNSCHEDULED", "EMERGENCY"])
-
-    def _generate_random_maintenance_record_description(description):
-        work_order_desc_to_maintenance_record_desc = {
-            "Perform engine inspection and maintenance": [
-                "Replaced worn turbine blades",
-                "Cleaned fuel injectors and filters",
-                "Recalibrated engine sensors",
-                "Replaced engine oil and filter",
-                "Inspected combustion chamber for cracks"
-            ],
-            "Refuel aircraft to operational capacity": [
-                "Filled main fuel tanks to capacity",
-                "Inspected fuel lines for leaks",
-                "Verified fuel quality and contamination check",
-                "Topped off auxiliary fuel tanks",
-                "Calibrated fuel quantity indicators"
-            ],
-            "Repair navigation system components": [
-                "Replaced faulty GPS module",
-                "Recalibrated inertial navigation system",
-                "Updated navigation software to latest version",
-                "Repaired antenna connection",
-                "Replaced navigation display unit"
-            ],
-            "Fix communication equipment and systems": [
-                "Replaced radio transceiver unit",
-                "Repaired antenna cable connection",
-                "Updated communication software",
-                "Cleaned and tested headset jacks",
-                "Replaced intercom system amplifier"
-            ],
-            "Inspect and repair landing gear assembly": [
-                "Replaced worn brake pads",
-                "Serviced and greased landing gear struts",
-                "Replaced damaged tire",
-                "Inspected and adjusted wheel alignment",
-                "Replaced landing gear actuator seal"
-            ],
-            "Service hydraulic systems and check for leaks": [
-                "Replaced leaking hydraulic line",
-                "Topped off hydraulic fluid reservoir",
-                "Replaced worn hydraulic pump seals",
-                "Cleaned hydraulic filter and replaced element",
-                "Tested system pressure and flow rates"
-            ],
-            "Perform weather-related damage inspection": [
-                "Inspected exterior for hail damage",
-                "Checked wing surfaces for lightning strike marks",
-                "Examined control surfaces for wind damage",
-                "Inspected windshield for crack propagation",
-                "Assessed corrosion from moisture exposure"
-            ],
-            "Complete delayed maintenance procedures": [
-                "Completed 100-hour inspection checklist",
-                "Performed overdue avionics system test",
-                "Executed deferred structural inspection",
-                "Completed postponed engine run-up test",
-                "Finished pending electrical system checks"
-            ],
-            "Conduct security inspection and clearance": [
-                "Performed thorough cabin security sweep",
-                "Inspected cargo hold for unauthorized items",
-                "Verified integrity of access panels and doors",
-                "Checked security seals on sensitive equipment",
-                "Conducted pre-flight security screening"
-            ],
-            "Perform scheduled maintenance tasks": [
-                "Completed routine pre-flight inspection",
-                "Performed scheduled lubrication service",
-                "Executed 50-hour maintenance checklist",
-                "Conducted periodic system functional tests",
-                "Performed routine safety equipment inspection"
-            ]
-        }
-        
-        return _random.choice(work_order_desc_to_maintenance_record_desc[description])
+        for shard_output in _run_shards(_generate_maintenance_record_shard, _maintenance_record_shards(), processes):
+            if vectorized:
+                ids = np.arange(num_maintenance_records + 1, num_maintenance_records + len(shard_output) + 1, dtype=np.uint32)
+                num_maintenance_records += ids.size
+                yield from shard_output.with_column("id", ids, first=True, id_prefix="MAINTENANCE-RECORD-").to_records()
+                continue
 
-    def _generate_random_supplier_name():
-        suppliers = ["AeroTech Solutions", "Precision Aviation Services", "SkyMaster Maintenance Corp", 
-            "Apex Aircraft Support", "Horizon Aviation Systems", "TitanAir Logistics",
-            "Premier Flight Services"]
-        return _random.choice(suppliers)
+            for maintenance_record_obj in shard_output:
+                num_maintenance_records += 1
+                maintenance_record_obj["id"] = f"MAINTENANCE-RECORD-{num_maintenance_records}"
+                yield maintenance_record_obj
 
-    def _generate_random_technician_name():
-        technicians = ["James Rodriguez", "Sarah Chen", "Michael Thompson", "Emily Davis",
-            "Robert Martinez", "Jennifer Kim", "David Anderson"]
-        return _random.choice(technicians)
-    
-    work_orders_data = c3.WorkOrder.eval(limit=-1,order="ascending(id)").to_pandas()
+    records = _generate_maintenance_record_objs()
+    if checksum is not None:
+        records = checksum.track(records)
+    if record_diff is not None:
+        records = record_diff.changed(records)
 
-    maintenance_record_objs = []
+    upsert_result = sink.write(records, c3.MaintenanceRecord, manifest)
+
+    return _finish_stage(upsert_result, manifest, c3.MaintenanceRecord, "Maintenance Records", record_diff, prune, sink,
+                         checksum, dataset)
+
+'''
+    Weather Observations
+    Synthetic weather history for every Base, as WeatherObservation records (the Type is defined in pkg9rel).
+
+    Every Base gets one observation every resolutionMinutes over the horizon. The temperature follows curves that
+    depend on the Base's location: an annual mean that falls with latitude, a seasonal cycle whose amplitude grows
+    with latitude (inverted south of the equator), a diurnal cycle peaking at 15:00 local solar time (from the
+    longitude), and multi-day weather systems drawn per Base. The condition follows a separate cloudiness signal,
+    with precipitation falling as snow below freezing and as thunderstorms on hot afternoons.
+
+    The series is generated with NumPy one partition at a time: WEATHER_PARTITION_DAYS of one Base, aligned to the
+    epoch, so the same Base and minute always get the same observation whatever the horizon, and every partition is
+    an independent shard that can run on a process pool. Ids are "WEATHER-<Base id>-<minute since the epoch>", so
+    rerunning a horizon upserts the same records. The partitions are written in time order, every Base's partition
+    of a window before the next window, in batched upserts.
+'''
+WEATHER_DAYS = 365
+WEATHER_RESOLUTION_MINUTES = 60
+WEATHER_PARTITION_DAYS = 7
+WEATHER_CONDITIONS = ("Clear", "Cloudy", "Fog", "Rain", "Snow", "Thunderstorm")
+
+def _generate_weather_shard(partition, base, resolution_minutes, first_minute, last_minute):
+    '''
+        Generates the observations of one Base in one partition, clipped to [first_minute, last_minute).
+
+        base is a (Base id, name, latitude, longitude) tuple. Returns a ColumnBatch.
+    '''
+    import numpy as np
+
+    base_id, name, latitude, longitude = base
+    partition_minutes = WEATHER_PARTITION_DAYS * 24 * 60
+
+    # The curves of a Base come from its own stream, the noise from a stream per partition
+    curve_rng = _numpy_rng(f"WeatherObservation:{base_id}", 0)
+    noise_rng = _numpy_rng(f"WeatherObservation:{base_id}", partition + 1)
+
+    minutes = np.arange(partition * partition_minutes, (partition + 1) * partition_minutes, resolution_minutes, dtype=np.int64)
+    days = minutes / (24 * 60)
+
+    temp_noise = noise_rng.normal(0.0, 0.4, minutes.size)
+    cloud_noise = noise_rng.normal(0.0, 0.25, minutes.size)
+
+    # Drawing over the whole partition and clipping afterwards keeps the draws independent of the horizon
+    in_horizon = (minutes >= first_minute) & (minutes < last_minute)
+    minutes, days, temp_noise, cloud_noise = minutes[in_horizon], days[in_horizon], temp_noise[in_horizon], cloud_noise[in_horizon]
+
+    abs_latitude = abs(latitude)
+    hemisphere = 1.0 if latitude >= 0 else -1.0
+
+    mean_temp = 38.0 - 0.7 * abs_latitude
+    seasonal_amplitude = max(2.0, 0.45 * abs_latitude - 7.0)
+    diurnal_amplitude = 4.0 + curve_rng.uniform(0.0, 3.0)
+
+    # Warmest around July 20th (day 201) in the northern hemisphere
+    seasonal = hemisphere * seasonal_amplitude * np.cos(2 * np.pi * (days - 201) / 365.25)
+
+    local_hours = (minutes % (24 * 60)) / 60 + longitude / 15
+    diurnal_phase = np.cos(2 * np.pi * (local_hours - 15) / 24)
+
+    def _weather_systems(num_systems, min_days, max_days, amplitude):
+        periods = curve_rng.uniform(min_days, max_days, num_systems)
+        phases = curve_rng.uniform(0.0, 2 * np.pi, num_systems)
+        amplitudes = curve_rng.uniform(0.5, 1.0, num_systems) * amplitude / num_systems
+        return sum(a * np.sin(2 * np.pi * days / p + f) for a, p, f in zip(amplitudes, periods, phases))
+
+    temp = np.round(mean_temp + seasonal + diurnal_amplitude * diurnal_phase + _weather_systems(3, 3.0, 12.0, 6.0) + temp_noise, 1)
+    cloudiness = _weather_systems(2, 2.0, 6.0, 1.5) + cloud_noise
+
+    local_hour_of_day = local_hours % 24
+    condition = np.select(
+        [
+            cloudiness < 0.0,
+            (cloudiness < 0.45) & (cloudiness >= 0.2) & (local_hour_of_day >= 4) & (local_hour_of_day < 8),
+            cloudiness < 0.45,
+            temp <= 0.0,
+            (temp >= 24.0) & (diurnal_phase > 0.3)
+        ],
+        [WEATHER_CONDITIONS.index(label) for label in ("Clear", "Fog", "Cloudy", "Snow", "Thunderstorm")],
+        default=WEATHER_CONDITIONS.index("Rain")
+    ).astype(np.uint8)
+
+    return ColumnBatch({
+        "id": minutes.astype(np.uint32),
+        "location": np.zeros(minutes.size, dtype=np.uint8),
+        "lat": np.full(minutes.size, latitude),
+        "long": np.full(minutes.size, longitude),
+        "temp": temp,
+        "condition": condition,
+        "timestamp": (minutes * 60000).astype(np.float64)
+    }, categories={
+        "location": np.array([name], dtype=object),
+        "condition": np.array(WEATHER_CONDITIONS, dtype=object)
+    }, id_prefixes={"id": f"WEATHER-{base_id}-"})
+
+def createWeatherData(cls, days=None, resolutionMinutes=None, start=None, processes=None, output=None, adaptive=None):
+    ''' Generates WeatherObservation series for every Base over days days from start '''
+    WeatherObservation = getattr(c3, "WeatherObservation", None)
+    if WeatherObservation is None:
+        return "The WeatherObservation Type is not available. Please deploy it (see pkg9rel) before generating Weather data."
+
+    days = days or WEATHER_DAYS
+    resolution_minutes = resolutionMinutes or WEATHER_RESOLUTION_MINUTES
+    if resolution_minutes <= 0 or (24 * 60) % resolution_minutes:
+        raise ValueError(f"resolutionMinutes must divide a day evenly, got {resolution_minutes}.")
+
+    # By default, the history up to today
+    start_date = _to_date(start) if start else START_DATE - timedelta(days=days)
+    first_minute = (start_date - date(1970, 1, 1)).days * 24 * 60
+    last_minute = first_minute + days * 24 * 60
+
+    bases = sorted(((base.id, base.name, base.latitude, base.longitude)
+                    for base in _read_records(c3.Base, ["name", "latitude", "longitude"])), key=lambda base: _id_number(base[0]))
+    if not bases:
+        return "Base data must be generated before Weather data. Please generate Base data first."
+
+    sink = _stage_sink(output, adaptive=adaptive)
+    num_expected = len(bases) * (last_minute - first_minute) // resolution_minutes
+    horizon_filter = (f"timestamp >= {first_minute * 60000} && timestamp < {last_minute * 60000} && "
+                      f"{_in_filter('location', [base[1] for base in bases])}")
+
+    if sink.writes_to_store and WeatherObservation.fetchCount({"filter": horizon_filter}) == num_expected:
+        return "Weather data already exists. Skipping data generation."
+
+    def _weather_shards():
+        partition_minutes = WEATHER_PARTITION_DAYS * 24 * 60
+        for partition in range(first_minute // partition_minutes, -(-last_minute // partition_minutes)):
+            for base in bases:
+                yield partition, base, resolution_minutes, first_minute, last_minute
+
+    records = _records_from_column_batches(_run_shards(_generate_weather_shard, _weather_shards(), processes))
+    upsert_result = sink.write(records, WeatherObservation)
+
+    if upsert_result.failed_batches:
+        return upsert_result.failure_message()
+
+    label = (f"Weather Observations for {len(bases)} Bases from {start_date} to {start_date + timedelta(days=days - 1)}, "
+             f"every {resolution_minutes} minutes")
+
+    if not sink.writes_to_store:
+        return f"Generated {upsert_result.num_records} {label}, {sink.describe(WeatherObservation, upsert_result)}"
+
+    post_upsert_ct = WeatherObservation.fetchCount({"filter": horizon_filter})
+    if post_upsert_ct != num_expected:
+        return f"Warning: Expected to generate {num_expected} {label}, but generated {post_upsert_ct}."
+
+    return upsert_result.annotate(f"Generated {post_upsert_ct} {label}")
+
+'''
+    Advance Simulation
+    Extends an existing dataset by whole days instead of regenerating it.
+
+    The simulation frontier is the day after the latest Operation's startDate. The fleet state at the frontier is
+    rebuilt from the Operations still in progress (endDate on or after the frontier), and only the next days are
+    simulated. Work Orders and Maintenance Records are generated for the new Operations only, and the Aircrafts those
+    Operations touched get their location and status updated. Every read is bounded by the in-flight fleet and the new
+    data, so a one-day refresh costs roughly one day of data rather than the whole dataset.
+
+    New records are numbered after the last id generated for their Type (see DatasetState), not after the stored count,
+    so records left after a date-range clear are never overwritten. Every advanced window draws from random
+    streams named after its first day, so advancing the same dataset by the same days is repeatable. Without days,
+    the window runs to the end of the stored dataset's year (see _resolve_start), whatever day it is run on.
+'''
+def _to_date(value):
+    """Converts a date or timestamp read from the store to a date."""
+    import pandas as pd
+
+    return pd.Timestamp(value).date()
+
+def _record_from_obj(obj, fields, **changes):
+    """Builds a full upsert record from a fetched obj, with references flattened to ids and some fields replaced."""
+    record = {"id": obj.id}
+
+    for field in fields:
+        value = getattr(obj, field, None)
+        record[field] = value.id if hasattr(value, "id") else value
+
+    record.update(changes)
+    return record
+
+def _in_filter(field, values):
+    """Returns a filter expression matching records whose field is one of values."""
+    return f"intersects({field}, [{', '.join(json.dumps(value) for value in values)}])"
+
+def advanceSimulation(cls, days=None, vectorized=False, processes=None, adaptive=None):
+    ''' Appends the next days of Operations, Work Orders and Maintenance Records to the existing data '''
+    num_aircrafts = c3.Aircraft.fetchCount()
+
+    if num_aircrafts == 0 or c3.Operation.fetchCount() == 0:
+        return "There is no simulation to advance. Please generate all data first."
+
+    latest_operation = c3.Operation.fetch({"order": "descending(startDate)", "limit": 1, "include": "startDate"}).objs[0]
+    window_start = _to_date(latest_operation.startDate) + timedelta(days=1)
+
+    # By default, fill up to the horizon of the stored dataset, one year from its start date, so the default window
+    # does not depend on the day advanceSimulation runs on
+    window_end = window_start + timedelta(days=days) if days else _end_date(_resolve_start())
+
+    if window_end <= window_start:
+        return f"The simulation already runs to {window_start - timedelta(days=1)}. Nothing to advance."
+
+    stream_suffix = f"@{window_start.isoformat()}"
+
+    # Fleet state at the frontier: the aircraft whose latest operation has not ended yet
+    in_flight = c3.Operation.fetch({
+        "filter": f"endDate >= dateTime('{window_start.isoformat()}')",
+        "include": "aircraft, endDate",
+        "limit": -1
+    }).objs or []
+
+    busy_until = {}
+    for operation in in_flight:
+        aircraft_id = operation.aircraft.id
+        busy_until[aircraft_id] = max(busy_until.get(aircraft_id, window_start), _to_date(operation.endDate))
+
+    def _advance_operation_shards():
+        # The same sub-fleets and daily caps as the full load, starting from the fleet state at the frontier
+        shards = _operation_shards(num_aircrafts / NUM_AIRCRAFTS, window_start, window_end)
+        for shard_index, first_aircraft_number, num_shard_aircrafts, max_daily_operations, _, _ in shards:
+            shard_busy = sorted(((aircraft_id, end_date) for aircraft_id, end_date in busy_until.items()
+                                 if first_aircraft_number <= _id_number(aircraft_id) < first_aircraft_number + num_shard_aircrafts),
+                                key=lambda busy: (busy[1], _id_number(busy[0])))
+
+            yield (shard_index, first_aircraft_number, num_shard_aircrafts, max_daily_operations,
+                   window_start, window_end, shard_busy, "Operation" + stream_suffix)
+
+    operation_dataset = DatasetState(c3.Operation, "OPERATION-")
+    first_operation_number = operation_dataset.last_number() + 1
+    operation_objs = []
+    for shard_operation_objs in _run_shards(_generate_operation_shard, _advance_operation_shards(), processes):
+        for operation_obj in shard_operation_objs:
+            operation_obj["id"] = f"OPERATION-{first_operation_number + len(operation_objs)}"
+            operation_objs.append(operation_obj)
 
-    for row in work_orders_data.itertuples():
-        num_maintenance_records = _random.randint(2,4)
-        for _ in range(num_maintenance_records):
-            aircraft_id, work_order_id= row.aircraft, row.id
-            createdDate, dueDate = row.createdDate, row.dueDate
-            description = row.description
-    
-            total_duration_in_days = (dueDate - createdDate).days
-
-            # Generate start date within the work order timeframe
-            num_days_from_start = _random.randint(0, total_duration_in_days)
-            startDate = createdDate + relativedelta(days=num_days_from_start)
-
-            # Generate maintenance duration (how many days the work takes)
-            remaining_days = total_duration_in_days - num_days_from_start
-            maintenance_duration = _random.randint(0, max(1, remaining_days))  # At least 0 days
-            endDate = startDate + relativedelta(days=maintenance_duration)
-            
-            maintenance_record_objs.append({
-                "aircraft": aircraft_id,
-                "maintenanceType": _generate_random_maintenance_type(),
-                "startDate": startDate,
-                "endDate": endDate,
-                "description": _generate_random_maintenance_record_description(description),
-                "workOrder": work_order_id,
-                "supplierName": _generate_random_supplier_name(),
-                "technician": _generate_random_technician_name()
-            })
-
-    _upsert_helper(maintenance_record_objs, c3.MaintenanceRecord)
-
-    post_upsert_ct = c3.MaintenanceRecord.fetchCount()
-    
-    if post_upsert_ct != NUM_MAINTENANCE_RECORDS:
-        return f"Warning: Expected to generate {NUM_MAINTENANCE_RECORDS} Maintenance Records, but generated {post_upsert_ct}."
-
-    return f"Generated {post_upsert_ct} Maintenance Records"
-
-def clearAllData(cls):
-    ''' Clears data from all Types in the data model '''
     res = []
+    upsert_results = []
 
-    Types_to_clear = [c3.Aircraft, c3.Base, c3.Operation, c3.WorkOrder, c3.MaintenanceRecord]
+    upsert_results.append(_upsert_helper(operation_objs, c3.Operation, adaptive=adaptive))
+    operation_dataset.advance(upsert_results[-1].num_upserted, first_operation_number + len(operation_objs) - 1)
+    res.append(f"Generated {len(operation_objs)} Operations from {window_start} to {window_end - timedelta(days=1)}")
 
-    for Type in Types_to_clear:
-        num_pre_clear = Type.fetchCount()
+    if not upsert_results[-1].failed_batches:
+        operation_rollup = StatusRollup.operations()
+        for operation_obj in operation_objs:
+            operation_rollup.add(operation_obj["startDate"], operation_obj["status"])
+
+        upsert_results.append(operation_rollup.apply())
+
+    # Work Orders for the new operations, closed when due within the simulated window
+    operation_alerts = [(obj["aircraft"], obj["alerts"], obj["startDate"]) for obj in operation_objs if obj["alerts"]]
+
+    def _advance_work_order_shards():
+        for shard_index, shard_alerts in enumerate(_chunks(operation_alerts, WORK_ORDER_SHARD_SIZE)):
+            yield shard_index, shard_alerts, vectorized, window_end, "WorkOrder" + stream_suffix
+
+    work_order_dataset = DatasetState(c3.WorkOrder, "WORK-ORDER-")
+    first_work_order_number = work_order_dataset.last_number() + 1
+    work_order_objs = []
+    for shard_output in _run_shards(_generate_work_order_shard, _advance_work_order_shards(), processes):
+        work_order_objs.extend(_records_from_column_batches([shard_output]) if vectorized else shard_output)
+
+    for offset, work_order_obj in enumerate(work_order_objs):
+        work_order_obj["id"] = f"WORK-ORDER-{first_work_order_number + offset}"
+
+    upsert_results.append(_upsert_helper(work_order_objs, c3.WorkOrder, adaptive=adaptive))
+    work_order_dataset.advance(upsert_results[-1].num_upserted, first_work_order_number + len(work_order_objs) - 1)
+    res.append(f"Generated {len(work_order_objs)} Work Orders")
+
+    # Maintenance Records for the new work orders
+    work_orders = [(obj["id"], obj["aircraft"], obj["description"], obj["createdDate"], obj["dueDate"]) for obj in work_order_objs]
+
+    def _advance_maintenance_record_shards():
+        for shard_index, shard_work_orders in enumerate(_chunks(work_orders, MAINTENANCE_RECORD_SHARD_SIZE)):
+            yield shard_index, shard_work_orders, vectorized, "MaintenanceRecord" + stream_suffix
+
+    maintenance_record_dataset = DatasetState(c3.MaintenanceRecord, "MAINTENANCE-RECORD-")
+    first_maintenance_record_number = maintenance_record_dataset.last_number() + 1
+    maintenance_record_objs = []
+    for shard_output in _run_shards(_generate_maintenance_record_shard, _advance_maintenance_record_shards(), processes):
+        maintenance_record_objs.extend(_records_from_column_batches([shard_output]) if vectorized else shard_output)
+
+    for offset, maintenance_record_obj in enumerate(maintenance_record_objs):
+        maintenance_record_obj["id"] = f"MAINTENANCE-RECORD-{first_maintenance_record_number + offset}"
+
+    upsert_results.append(_upsert_helper(maintenance_record_objs, c3.MaintenanceRecord, adaptive=adaptive))
+    maintenance_record_dataset.advance(upsert_results[-1].num_upserted,
+                                       first_maintenance_record_number + len(maintenance_record_objs) - 1)
+    res.append(f"Generated {len(maintenance_record_objs)} Maintenance Records")
+
+    # Work Orders of earlier days that fell due within the window are closed now
+    due_work_orders = c3.WorkOrder.fetch({
+        "filter": f"status == 'OPEN' && dueDate < dateTime('{window_end.isoformat()}')",
+        "limit": -1
+    }).objs or []
+
+    closed_work_orders = [
+        _record_from_obj(work_order, ["aircraft", "description", "priority", "createdDate", "dueDate"], status="CLOSED")
+        for work_order in due_work_orders
+    ]
+
+    upsert_results.append(_upsert_helper(closed_work_orders, c3.WorkOrder, adaptive=adaptive))
+    res.append(f"Closed {len(closed_work_orders)} Work Orders that fell due")
+
+    # Aircrafts end up at the destination of their latest operation, and are deployed while an operation runs
+    last_destinations = {}
+    for operation_obj in operation_objs:
+        aircraft_id = operation_obj["aircraft"]
+        last_destinations[aircraft_id] = operation_obj["destination"]
+        busy_until[aircraft_id] = max(busy_until.get(aircraft_id, window_start), operation_obj["endDate"])
+
+    touched_aircraft_ids = sorted(set(last_destinations) | set(busy_until), key=_id_number)
+    aircraft_objs = []
+    for ids in _chunks(touched_aircraft_ids, UPSERT_BATCH_SIZE):
+        aircraft_objs.extend(c3.Aircraft.fetch({"filter": _in_filter("id", ids), "limit": -1}).objs or [])
+
+    updated_aircrafts = []
+    aircraft_rollup = StatusRollup.aircraft()
+    for aircraft in aircraft_objs:
+        status = aircraft.status
+        if busy_until.get(aircraft.id, window_start) >= window_end:
+            status = "Deployed"
+        elif status == "Deployed":
+            status = "Ready"
+
+        if status != aircraft.status or aircraft.id in last_destinations:
+            previous_location = aircraft.location.id if aircraft.location else None
+            location = last_destinations.get(aircraft.id, previous_location)
+            updated_aircrafts.append(_record_from_obj(aircraft, ["registrationNumber", "model", "lastInspectionDate"],
+                                                      status=status, location=location))
+
+            # The aircraft moves from its previous (Base, status) count to the new one
+            aircraft_rollup.add(previous_location, aircraft.status, -1)
+            aircraft_rollup.add(location, status)
+
+    upsert_results.append(_upsert_helper(updated_aircrafts, c3.Aircraft, adaptive=adaptive))
+    res.append(f"Updated the location and status of {len(updated_aircrafts)} Aircrafts")
+
+    if not upsert_results[-1].failed_batches:
+        upsert_results.append(aircraft_rollup.apply())
+
+    failures = [upsert_result.failure_message() for upsert_result in upsert_results if upsert_result.failed_batches]
+
+    return "\n".join(failures + res)
+
+'''
+    Teardown Plan
+    clearAllData removes the Types in dependency order: a Type is cleared only once every Type referencing it is
+    cleared, so no record is left pointing at a removed one. Types that do not depend on each other are cleared
+    concurrently, at most CLEAR_MAX_IN_FLIGHT at a time.
+
+    Without a filter or date range, a Type is dropped with clearCollection. Otherwise its matching records are removed
+    in chunks of CLEAR_CHUNK_SIZE, and progress is logged after every chunk. A date range applies to the Types listed
+    in CLEAR_DATE_FIELDS; Maintenance Records are matched by the createdDate of their Work Order so that a range
+    removes a Work Order together with its records.
+
+    When records of a Type with a rollup (ROLLUP_TYPES) are removed but its rollup is not dropped with them, the
+    rollup is rebuilt from the records that are left. The resume checkpoints and the DatasetState of every Type that
+    had records removed are cleared as well, so that a resumed or repeated load regenerates them instead of reporting
+    them as loaded. A filter applies to the fields of the Types it names, so it must come with types.
+'''
+CLEAR_MAX_IN_FLIGHT = 4
+CLEAR_CHUNK_SIZE = 5000
+
+# Type name -> names of the Types that reference it and must be cleared first
+CLEAR_DEPENDENTS = {
+    "Base": ["Aircraft", "Operation", "AircraftStatusRollup"],
+    "Aircraft": ["Operation", "WorkOrder", "MaintenanceRecord"],
+    "Operation": [],
+    "WorkOrder": ["MaintenanceRecord"],
+    "MaintenanceRecord": [],
+    "DataGeneratorBatch": [],
+    "AircraftStatusRollup": [],
+    "OperationStatusRollup": []
+}
+
+# Type name -> the date field a date range is matched against
+CLEAR_DATE_FIELDS = {
+    "Operation": "startDate",
+    "WorkOrder": "createdDate",
+    "MaintenanceRecord": "workOrder.createdDate"
+}
+
+def _clear_filter(type_name, filter, start, end):
+    """
+    Returns the filter selecting the records of a Type to remove: "" for the whole collection, or None when the
+    Type is not affected because it has no date field to match a date range against.
+    """
+    import pandas as pd
+
+    clauses = [f"({filter})"] if filter else []
+
+    if start or end:
+        if type_name not in CLEAR_DATE_FIELDS:
+            return None
+
+        date_field = CLEAR_DATE_FIELDS[type_name]
+        if start:
+            clauses.append(f"{date_field} >= dateTime('{pd.Timestamp(start).isoformat()}')")
+        if end:
+            clauses.append(f"{date_field} < dateTime('{pd.Timestamp(end).isoformat()}')")
+
+    return " && ".join(clauses)
+
+def _clear_type(Type, filter_expr, chunk_size, verify=None):
+    """
+    Removes the records of a Type matching filter_expr ("" for all of them) and returns the timings of the run.
+
+    In the "count" verify mode the matching records are counted before and after. Otherwise they are not counted:
+    the removed records are tallied from the chunks (unknown for a dropped collection) and a fetch of a single id
+    checks that none are left.
+    """
+    start_time = time.perf_counter()
+    spec = {"filter": filter_expr} if filter_expr else None
+    count = verify is None or verify == "count"
+    num_pre_clear = Type.fetchCount(spec) if count else None
+    num_chunks = 0
+    num_removed = None
+
+    if not filter_expr:
         Type.clearCollection(None, True)
-        num_after_clear = Type.fetchCount()
+        num_chunks = 1
+    else:
+        num_removed = 0
+
+        while True:
+            objs = Type.fetch({"filter": filter_expr, "include": "id", "limit": chunk_size}).objs or []
+            if not objs:
+                break
+
+            Type.removeBatch([{"id": obj.id} for obj in objs])
+            num_chunks += 1
+            num_removed += len(objs)
+
+            if count:
+                _logger.info("Cleared %s of %s %ss", num_removed, num_pre_clear, Type.name())
+            else:
+                _logger.info("Cleared %s %ss so far", num_removed, Type.name())
+
+    if count:
+        num_after_clear = Type.fetchCount(spec)
+        num_removed = num_pre_clear - num_after_clear
+    else:
+        probe = {"filter": filter_expr, "include": "id", "limit": 1} if filter_expr else {"include": "id", "limit": 1}
+        num_after_clear = len(Type.fetch(probe).objs or [])
+
+    _logger.info("Cleared %s %ss in %.2fs", "all" if num_removed is None else num_removed, Type.name(),
+                 time.perf_counter() - start_time)
+
+    return {
+        "type": Type.name(),
+        "filter": filter_expr,
+        "removed": num_removed,
+        "remaining": num_after_clear,
+        "chunks": num_chunks,
+        "seconds": round(time.perf_counter() - start_time, 3)
+    }
+
+def _invalidate_load_state(type_name, whole):
+    """
+    Removes the resume checkpoints (LoadManifest) of a Type that had records cleared, and its DatasetState: dropped with
+    the whole collection, or marked as no longer loaded when only some records were removed.
+    """
+    dataset = DatasetState(getattr(c3, type_name))
+    entries = c3.DataGeneratorBatch.fetch({"filter": f"stage == '{type_name}'", "include": "id", "limit": -1}).objs or []
+    manifest_ids = [entry.id for entry in entries if entry.id != dataset.id]
+
+    for chunk in _chunks(manifest_ids, READ_PAGE_SIZE):
+        c3.DataGeneratorBatch.removeBatch([{"id": entry_id} for entry_id in chunk])
+
+    if whole and (dataset.recorded_key is not None or dataset.last_id):
+        c3.DataGeneratorBatch.removeBatch([{"id": dataset.id}])
+    else:
+        dataset.invalidate()
+
+def clearAllData(cls, types=None, filter=None, start=None, end=None, chunkSize=None, verify=None):
+    '''
+        Clears data from the Types in the data model, children before parents
+
+        Args:
+            types: Names of the Types to clear. Defaults to every Type in CLEAR_DEPENDENTS.
+            filter: A filter expression; only matching records are removed. Requires types, since the filter is applied
+                to every Type cleared.
+            start, end: A date range (start inclusive, end exclusive); only records dated within it are removed.
+            chunkSize: Records removed per call when clearing by filter or date range. Defaults to CLEAR_CHUNK_SIZE.
+            verify: "count" (the default) counts the records of every Type before and after; "sample" and "full"
+                only check that no matching record is left.
+
+        Returns:
+            A dict with a message per Type, the timings of every Type and the total time.
+    '''
+    if verify is not None and verify not in VERIFY_MODES:
+        raise ValueError(f"Unknown verify mode {verify}. Use one of {', '.join(VERIFY_MODES)}.")
+
+    if filter and not types:
+        raise ValueError("A filter is matched against the fields of the Types it is meant for. Pass those Types as types.")
+
+    start_time = time.perf_counter()
+    type_names = [name for name in CLEAR_DEPENDENTS if types is None or name in types]
+    chunk_size = chunkSize or CLEAR_CHUNK_SIZE
+
+    filters = {name: _clear_filter(name, filter, start, end) for name in type_names}
+    pending = [name for name in type_names if filters[name] is not None]
+    cleared = set(name for name in type_names if filters[name] is None)
+    timings = {}
+
+    with ThreadPoolExecutor(max_workers=CLEAR_MAX_IN_FLIGHT) as executor:
+        in_flight = {}
+
+        while pending or in_flight:
+            # Start every Type whose dependents are cleared (or are not part of this teardown)
+            for name in list(pending):
+                if all(dependent in cleared or dependent not in type_names for dependent in CLEAR_DEPENDENTS[name]):
+                    pending.remove(name)
+                    in_flight[executor.submit(_clear_type, getattr(c3, name), filters[name], chunk_size, verify)] = name
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = in_flight.pop(future)
+                timings[name] = future.result()
+                cleared.add(name)
+
+    res = []
+    for name in type_names:
+        if name not in timings:
+            res.append(f"Skipped {name}s, which have no date to match the date range against")
+            continue
 
-        res.append(f"Cleared {num_pre_clear - num_after_clear} {Type.name()}s")
+        timing = timings[name]
+        if timing["removed"] is None:
+            res.append(f"Cleared all {name}s in {timing['seconds']:.2f}s")
+        else:
+            res.append(f"Cleared {timing['removed']} {name}s in {timing['seconds']:.2f}s")
 
-        if num_after_clear != 0:
-            res.append(f"Warning: Not all {Type.name()} data was cleared. There are still {num_after_clear} records remaining.")
+        if timing["remaining"] != 0 and timing["removed"] is None:
+            res.append(f"Warning: Not all {name} data was cleared. There are still records remaining.")
+        elif timing["remaining"] != 0:
+            res.append(f"Warning: Not all {name} data was cleared. There are still {timing['remaining']} records remaining.")
+
+    # Rollups of partly cleared Types are recounted from the records that are left
+    for name, rollup_name in ROLLUP_TYPES.items():
+        if name not in timings or timings[name]["removed"] == 0:
+            continue
+
+        if rollup_name in timings and not filters[rollup_name]:
+            continue
+
+        upsert_result = _rebuild_rollup(name)
+        res.append(upsert_result.failure_message() or f"Rebuilt {upsert_result.num_records} {rollup_name}s")
+
+    # A rerun must regenerate what was removed, so resume checkpoints and dataset states stop vouching for it
+    if "DataGeneratorBatch" not in timings or filters["DataGeneratorBatch"]:
+        for name in type_names:
+            if name != "DataGeneratorBatch" and name in timings and timings[name]["removed"] != 0:
+                _invalidate_load_state(name, whole=not filters[name])
+
+    return {
+        "message": "\n".join(res),
+        "types": [timings[name] for name in type_names if name in timings],
+        "seconds": round(time.perf_counter() - start_time, 3)
+    }
+
+'''
+    Read Workload Replay
+    Replays the reads the UI issues against the generated data, to measure how the store holds up under them.
+
+    A ReadWorkload plans a seeded mix of queries shaped like the ones of the UI:
+
+        operationPage       a page of the Operations table: a filter on startDate, endDate, origin and destination,
+                            ordered by startDate then endDate (fetchOperationsWithPagination)
+        operationTotals     the daily OperationStatusRollups on or after a start date, limit -1, that the table sums
+                            into its status counts when only startDate is filtered (fetchOperationStatusTotals)
+        operationCountBy    FleetMetrics.countBy of the Operations by status, for a filter on endDate, origin or
+                            destination that the rollups cannot answer (fetchGroupedCounts)
+        earliestOperation   the first Operation by ascending(startDate), limit 1 (getEarliestOperationDate)
+        latestOperation     the last Operation by descending(endDate), limit 1 (getLatestEndDate)
+        baseStatusRollup    the AircraftStatusRollup of a Base, its Aircraft counts by status (fetchAircraftStatusRollup)
+        baseAircraftPage    a page of the Aircraft of a Base (fetchAircraftWithPagination)
+
+    The Base ids and the date range come from the stored data, and dates, Bases and pages are drawn from a
+    random.Random seeded like the generation stages, so the same seed and data replay the same queries. Early pages
+    are the most likely, like users paging through a table.
+
+    The queries are started open loop at the target rate, each at its scheduled time, on up to concurrency threads.
+    The report gives the latency percentiles per query shape, along with the lag between the scheduled and the actual
+    start of the queries: a growing lag means the store (or the concurrency) could not keep up with the rate.
+'''
+READ_WORKLOAD_QUERIES = 1000
+READ_WORKLOAD_RATE = 50.0           # queries per second
+READ_WORKLOAD_CONCURRENCY = 8
+READ_WORKLOAD_PAGE_SIZE = 10        # PAGE_SIZE of the UI tables
+READ_WORKLOAD_MAX_PAGE = 50
+READ_WORKLOAD_MIX = {
+    "operationPage": 0.35,
+    "operationTotals": 0.1,
+    "operationCountBy": 0.1,
+    "earliestOperation": 0.1,
+    "latestOperation": 0.1,
+    "baseStatusRollup": 0.1,
+    "baseAircraftPage": 0.15
+}
+
+class ReadWorkload:
+    OPERATION_ORDER = "ascending(startDate), ascending(endDate)"
+
+    def __init__(self, num_queries=None, mix=None, seed=None):
+        self.num_queries = num_queries or READ_WORKLOAD_QUERIES
+        self.mix = dict(mix or READ_WORKLOAD_MIX)
+        unknown = [shape for shape in self.mix if shape not in READ_WORKLOAD_MIX]
+        if unknown:
+            raise ValueError(f"Unknown query shapes {', '.join(unknown)}. Use some of {', '.join(READ_WORKLOAD_MIX)}.")
+
+        self.rng = _shard_rng("ReadWorkload", seed or 0)
+        self.queries = []
+
+    def plan(self):
+        """Draws the queries from the stored data. Returns False when there is no Operation data to query."""
+        earliest = c3.Operation.fetch({"limit": 1, "order": "ascending(startDate)"}).objs
+        latest = c3.Operation.fetch({"limit": 1, "order": "descending(endDate)"}).objs
+        base_ids = sorted((base.id for base in _read_records(c3.Base, [])), key=_id_number)
+        if not earliest or not latest or not base_ids:
+            return False
+
+        first_day = _to_date(earliest[0].startDate)
+        num_days = max(1, (_to_date(latest[0].endDate) - first_day).days)
+        num_operation_pages = max(1, c3.Operation.fetchCount() // READ_WORKLOAD_PAGE_SIZE)
+        num_aircraft_pages = max(1, c3.Aircraft.fetchCount() // (len(base_ids) * READ_WORKLOAD_PAGE_SIZE))
+
+        def _day():
+            return first_day + timedelta(days=self.rng.randrange(num_days))
+
+        def _page(num_pages):
+            # Mostly the first pages, with a long tail
+            return min(int(self.rng.expovariate(0.3)), num_pages - 1, READ_WORKLOAD_MAX_PAGE)
+
+        def _start():
+            return _day() if self.rng.random() < 0.5 else None
+
+        def _operation_filter(narrowed=False):
+            # Built clause by clause like OperationsPaginatedTable. A narrowed filter has an endDate, origin or
+            # destination clause, the filters whose status counts the rollups cannot answer
+            start = _start()
+            clauses = [f"startDate >= '{start}'"] if start else []
+            narrowing = [self.rng.random() < 0.3, self.rng.random() < 0.25, self.rng.random() < 0.25]
+            if narrowed and not any(narrowing):
+                narrowing[self.rng.randrange(len(narrowing))] = True
+
+            if narrowing[0]:
+                end = start + timedelta(days=self.rng.randint(7, 90)) if start else _day()
+                clauses.append(f"endDate <= '{end}'")
+            if narrowing[1]:
+                clauses.append(f"origin == '{self.rng.choice(base_ids)}'")
+            if narrowing[2]:
+                clauses.append(f"destination == '{self.rng.choice(base_ids)}'")
+            return " && ".join(clauses) or None
+
+        def _query(shape):
+            if shape == "operationPage":
+                filter_expr = _operation_filter()
+                # Filtered tables have fewer pages to go through
+                offset = _page(num_operation_pages if filter_expr is None else 5) * READ_WORKLOAD_PAGE_SIZE
+                return c3.Operation.fetch, {"filter": filter_expr, "limit": READ_WORKLOAD_PAGE_SIZE, "offset": offset,
+                                            "order": self.OPERATION_ORDER}
+            if shape == "operationTotals":
+                start = _start()
+                return c3.OperationStatusRollup.fetch, {"filter": f"date >= '{start}'" if start else None,
+                                                        "include": "planned, inProgress, completed", "limit": -1}
+            if shape == "operationCountBy":
+                return self._count_by, {"typeName": "Operation", "filter": _operation_filter(narrowed=True),
+                                        "groupBy": "status"}
+            if shape == "earliestOperation":
+                return c3.Operation.fetch, {"limit": 1, "order": "ascending(startDate)"}
+            if shape == "latestOperation":
+                return c3.Operation.fetch, {"limit": 1, "order": "descending(endDate)"}
+            if shape == "baseStatusRollup":
+                return c3.AircraftStatusRollup.fetch, {"filter": f"id == \"{self.rng.choice(base_ids)}\""}
+            return c3.Aircraft.fetch, {"filter": f"location.id == \"{self.rng.choice(base_ids)}\"",
+                                       "limit": READ_WORKLOAD_PAGE_SIZE,
+                                       "offset": _page(num_aircraft_pages) * READ_WORKLOAD_PAGE_SIZE}
+
+        shapes = self.rng.choices(list(self.mix), weights=list(self.mix.values()), k=self.num_queries)
+        self.queries = [(shape, *_query(shape)) for shape in shapes]
+        return True
+
+    def run(self, rate=None, concurrency=None):
+        """Runs the planned queries at rate queries per second (as fast as possible with a rate of 0). Returns the report."""
+        rate = READ_WORKLOAD_RATE if rate is None else rate
+        concurrency = max(1, concurrency or READ_WORKLOAD_CONCURRENCY)
+        stats = {shape: {"latencies": [], "errors": 0} for shape in self.mix}
+        lags = []
+        lock = threading.Lock()
+
+        def _execute(shape, method, spec, scheduled):
+            start = time.perf_counter()
+            error = False
+            try:
+                method({key: value for key, value in spec.items() if value is not None})
+            except Exception as e:
+                _logger.warning(f"{shape} query {spec} failed: {e}")
+                error = True
+
+            latency = time.perf_counter() - start
+            with lock:
+                stats[shape]["latencies"].append(latency)
+                stats[shape]["errors"] += error
+                lags.append(start - scheduled)
+
+        start_time = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            in_flight = set()
+
+            for index, (shape, method, spec) in enumerate(self.queries):
+                scheduled = start_time + index / rate if rate else time.perf_counter()
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+                if len(in_flight) >= concurrency:
+                    _, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+
+                in_flight.add(executor.submit(_execute, shape, method, spec, scheduled))
+
+            wait(in_flight)
+
+        seconds = time.perf_counter() - start_time
+        lags.sort()
+
+        return {
+            "queries": len(self.queries),
+            "seconds": round(seconds, 3),
+            "target_rate": rate or None,
+            "achieved_rate": round(len(self.queries) / seconds, 1) if seconds else None,
+            "concurrency": concurrency,
+            "lag": {"p50": _percentile(lags, 0.5), "p95": _percentile(lags, 0.95), "max": round(lags[-1], 4) if lags else None},
+            "shapes": [self._shape_stats(shape, stats[shape]) for shape in self.mix if stats[shape]["latencies"]]
+        }
+
+    @staticmethod
+    def _count_by(spec):
+        # Called with a spec like the Type methods, the filter left out when there is none
+        return c3.FleetMetrics.countBy(spec["typeName"], spec.get("filter"), spec["groupBy"])
+
+    @staticmethod
+    def _shape_stats(shape, stats):
+        latencies = sorted(stats["latencies"])
+        return {
+            "shape": shape,
+            "queries": len(latencies),
+            "errors": stats["errors"],
+            "mean": round(sum(latencies) / len(latencies), 4),
+            "p50": _percentile(latencies, 0.5),
+            "p95": _percentile(latencies, 0.95),
+            "p99": _percentile(latencies, 0.99),
+            "max": round(latencies[-1], 4)
+        }
 
-    return "\n".join(res)
\ No newline at end of file
+def replayReadWorkload(cls, numQueries=None, rate=None, concurrency=None, seed=None, mix=None, log=False):
+    '''
+        Replays a seeded mix of the UI's read queries against the generated data
+
+        Args:
+            numQueries: Queries to run. Defaults to READ_WORKLOAD_QUERIES.
+            rate: Target queries per second; 0 runs them as fast as concurrency allows. Defaults to READ_WORKLOAD_RATE.
+            concurrency: Queries in flight at most. Defaults to READ_WORKLOAD_CONCURRENCY.
+            seed: Seeds the query mix; the same seed replays the same queries against the same data.
+            mix: Relative weights by query shape, e.g. {"operationPage": 3, "operationCountBy": 1}.
+                Defaults to READ_WORKLOAD_MIX.
+            log: Also writes the report to the log, one line per query shape.
+
+        Returns:
+            A dict with a message, the achieved rate, the start lag and the latency percentiles per query shape.
+    '''
+    workload = ReadWorkload(numQueries, mix, seed)
+    if not workload.plan():
+        return {"message": "Base and Operation data must be generated before replaying the read workload. Please generate them first."}
+
+    report = workload.run(rate, concurrency)
+    report["message"] = (f"Ran {report['queries']} queries in {report['seconds']:.2f}s "
+                         f"({report['achieved_rate']}/s, p95 start lag {report['lag']['p95']}s)")
+
+    if log:
+        _logger.info(report["message"])
+        for shape in report["shapes"]:
+            _logger.info(f"{shape['shape']}: {shape['queries']} queries, {shape['errors']} errors, "
+                         f"p50={shape['p50']}s p95={shape['p95']}s p99={shape['p99']}s max={shape['max']}s")
+
+    return report
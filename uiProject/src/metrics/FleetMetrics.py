@@ -0,0 +1,111 @@
+from datetime import timedelta
+
+
+'''
+    Grouped Counts
+
+    Counts by a field are grouped on the server: a single evaluate call projects the field and count(), grouped by the
+    field, so only one row per group comes back however many records match.
+
+    Counts by date bucket cannot be grouped that way, since the bucket is computed from the date. The records are read
+    as a projection on id and the date field instead, one page of SCAN_PAGE_SIZE records at a time with an id cursor,
+    so the counts take one pass over the matching records and hold one page in memory.
+'''
+SCAN_PAGE_SIZE = 5000
+
+# Fields of an evaluate result cell, one of which holds its value depending on its type
+CELL_FIELDS = ("str", "long", "int", "dbl", "double", "bool", "date")
+
+COUNTABLE_TYPES = ("Base", "Aircraft", "Operation", "WorkOrder", "MaintenanceRecord")
+
+DATE_BUCKETS = ("day", "week", "month", "year")
+
+def _scan(Type, field, filter_expr=None, page_size=None):
+    """Yields the value of field for every record of Type matching filter_expr, in pages read by id cursor."""
+    page_size = page_size or SCAN_PAGE_SIZE
+    cursor = None
+
+    while True:
+        filters = [expr for expr in (filter_expr, f"id > '{cursor}'" if cursor is not None else None) if expr]
+        spec = {"include": f"id, {field}", "order": "ascending(id)", "limit": page_size}
+        if filters:
+            spec["filter"] = " && ".join(f"({expr})" for expr in filters)
+
+        objs = Type.fetch(spec).objs or []
+        for obj in objs:
+            yield getattr(obj, field, None)
+
+        if len(objs) < page_size:
+            return
+
+        cursor = objs[-1].id
+
+def _cell_value(cell):
+    """Returns the value of an evaluate result cell, or None for a null."""
+    for field in CELL_FIELDS:
+        value = getattr(cell, field, None)
+        if value is not None:
+            return value
+
+    return None
+
+def _grouped_counts(Type, field, filter_expr=None):
+    """Returns {value of field: count} of the records of Type matching filter_expr, grouped by a single evaluate call."""
+    spec = {"projection": f"{field}, count()", "group": field, "limit": -1}
+    if filter_expr:
+        spec["filter"] = filter_expr
+
+    counts = {}
+    for row in Type.evaluate(spec).tuples or []:
+        value, count = (_cell_value(cell) for cell in row.cells)
+        key = _group_key(value)
+        counts[key] = counts.get(key, 0) + int(count)
+
+    return counts
+
+def _group_key(value, date_bucket=None):
+    """Returns the group of a field value: the id of a reference, the start of its bucket for a date, or the value."""
+    if value is None:
+        return "null"
+
+    if hasattr(value, "id"):
+        return value.id
+
+    if date_bucket is None:
+        return str(value)
+
+    import pandas as pd
+
+    day = pd.Timestamp(value).date()
+    if date_bucket == "week":
+        day -= timedelta(days=day.weekday())
+    elif date_bucket == "month":
+        day = day.replace(day=1)
+    elif date_bucket == "year":
+        day = day.replace(month=1, day=1)
+
+    return day.isoformat()
+
+def countBy(cls, typeName, filter=None, groupBy="status", dateBucket=None):
+    ''' Counts the records of a Type matching a filter by the values of one field, grouped on the server '''
+    if typeName not in COUNTABLE_TYPES:
+        raise ValueError(f"Cannot count {typeName} records. Countable Types are {', '.join(COUNTABLE_TYPES)}.")
+
+    if dateBucket is not None and dateBucket not in DATE_BUCKETS:
+        raise ValueError(f"Unknown date bucket {dateBucket}. Use one of {', '.join(DATE_BUCKETS)}.")
+
+    Type = getattr(c3, typeName)
+
+    if dateBucket is None:
+        counts = _grouped_counts(Type, groupBy, filter)
+    else:
+        counts = {}
+        for value in _scan(Type, groupBy, filter):
+            key = _group_key(value, dateBucket)
+            counts[key] = counts.get(key, 0) + 1
+
+    return {
+        "groupBy": groupBy,
+        "counts": dict(sorted(counts.items())),
+        "total": sum(counts.values())
+    }
@@ -0,0 +1,98 @@
+"""
+Tests of src/loader/DataGenerator.py against the in-memory fake of the c3 Type API (benchmark/fake_c3.py).
+
+Usage:
+    python -m pytest test/py
+"""
+import importlib.util
+import os
+import sys
+import threading
+
+import pytest
+
+BENCHMARK_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "benchmark")
+DATA_GENERATOR_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "src", "loader", "DataGenerator.py")
+
+sys.path.insert(0, BENCHMARK_DIR)
+from fake_c3 import FakeC3  # noqa: E402
+
+@pytest.fixture
+def data_generator():
+    spec = importlib.util.spec_from_file_location("DataGenerator", DATA_GENERATOR_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.c3 = FakeC3()
+    return module
+
+def _finishes(fn, timeout=60):
+    """Runs fn on a daemon thread and returns whether it returned within timeout seconds."""
+    thread = threading.Thread(target=fn, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return not thread.is_alive()
+
+def test_publish_after_detach_discards_appends(data_generator):
+    data_generator.STAGE_STREAM_MAX_RECORDS = 10
+    context = data_generator.GenerationContext(pipelined=True)
+
+    # The reading stage returns before its upstream stage publishes
+    context.detach(("operation_alerts",))
+    stream = context.publish("operation_alerts", [])
+
+    assert _finishes(lambda: [stream.append(index) for index in range(100)], timeout=5)
+    assert list(stream) == []
+
+def test_pipelined_run_when_work_orders_already_exist(data_generator):
+    data_generator.createAllData(None, 0.1, sequential=True)
+    data_generator.clearAllData(None, types=["Operation"])
+
+    data_generator.STAGE_STREAM_MAX_RECORDS = 10
+    # Slows down the Operation stage so that the Work Order stage returns ("already exists") before it publishes
+    data_generator.c3.Operation.latency = 0.1
+    messages = []
+
+    assert _finishes(lambda: messages.append(data_generator.createAllData(None, 0.1)))
+    assert "Generated 750 Operations" in messages[0]
+    assert "Work Order data already exists" in messages[0]
+
+def test_sequential_fields_are_spilled(data_generator):
+    data_generator.SPILL_CHUNK_RECORDS = 3
+    context = data_generator.GenerationContext()
+
+    stream = context.publish("operation_alerts", [])
+    for index in range(10):
+        stream.append(index)
+    context.finish("operation_alerts")
+
+    assert isinstance(stream, data_generator.SpillStream)
+    assert list(context.subscribe("operation_alerts")) == list(range(10))
+
+    context.detach(("operation_alerts",))
+    assert list(stream) == []
+
+def test_diff_compares_page_by_page(data_generator):
+    data_generator.DIFF_PAGE_SIZE = 50
+    data_generator.createAllData(None, 0.05, sequential=True)
+    work_orders = data_generator.c3.WorkOrder.data
+    num_work_orders = len(work_orders)
+
+    work_orders["WORK-ORDER-5"]["description"] = "Changed"
+    data_generator.c3.WorkOrder.upsertBatch([dict(work_orders["WORK-ORDER-7"], id=f"WORK-ORDER-{num_work_orders + 100}"),
+                                             dict(work_orders["WORK-ORDER-8"], id="WORK-ORDER-ORPHAN")])
+
+    message = data_generator.createAllData(None, 0.05, diff=True, prune=True, sequential=True)
+
+    assert f"Generated {num_work_orders} Work Orders (diff: 0 new, 1 changed" in message
+    assert "2 orphans removed" in message
+    assert len(work_orders) == num_work_orders
+
+def test_aircraft_without_location_are_not_rolled_up(data_generator):
+    rollup = data_generator.StatusRollup.aircraft()
+    rollup.add(None, "Ready")
+    rollup.add("BASE-1", "Ready")
+
+    records = list(rollup.to_records())
+
+    assert "None" not in [record["id"] for record in records]
+    assert sum(record["total"] for record in records) == 1
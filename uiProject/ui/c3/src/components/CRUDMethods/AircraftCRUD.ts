@@ -28,6 +28,26 @@ export const fetchAircraftCountWithFilter = async (baseId: string, filter: strin
   return typeof data === 'number' ? data : (data.count || 0);
 };
 
+export const fetchAircraftStatusRollup = async (baseId: string): Promise<any> => {
+  // The Aircraft counts of a Base by status, kept up to date by the DataGenerator (null when not generated)
+  const response = await fetch('api/8/AircraftStatusRollup/fetch', {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify({
+      filter: `id == "${baseId}"`,
+    }),
+  });
+
+  if (!response.ok) {
+    throw new Error('Network response was not ok');
+  }
+
+  const data = await response.json();
+  return data.objs ? data.objs[0] : null;
+};
+
 export const fetchAircraftWithPagination = async (baseId: string, pageSize: number, offset: number): Promise<any> => {
   /*
     TODO 5.1: Implement the fetchAircraftWithPagination function to retrieve a paginated list of Aircraft Types
@@ -88,3 +88,39 @@ export const fetchCountWithFilter = async (filter: string): Promise<number> => {
   const data = await response.json();
   return data || 0;
 };
+
+export const fetchOperationStatusTotals = async (startDate?: string): Promise<any> => {
+  /*
+    Sums the daily Operation counts by status kept by the DataGenerator, for the Operations starting on or after
+    startDate (all of them by default). Returns null when there are no rollups to sum.
+  */
+  const response = await fetch('api/8/OperationStatusRollup/fetch', {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify({
+      filter: startDate ? `date >= '${startDate}'` : undefined,
+      include: 'planned, inProgress, completed',
+      limit: -1,
+    }),
+  });
+
+  if (!response.ok) {
+    throw new Error('Network response was not ok');
+  }
+
+  const data = await response.json();
+  if (!data.objs || data.objs.length === 0) {
+    return null;
+  }
+
+  return data.objs.reduce(
+    (totals: any, day: any) => ({
+      planned: totals.planned + (day.planned || 0),
+      inProgress: totals.inProgress + (day.inProgress || 0),
+      completed: totals.completed + (day.completed || 0),
+    }),
+    { planned: 0, inProgress: 0, completed: 0 }
+  );
+};
@@ -11,7 +11,8 @@ import { type ImmutableReduxState } from '@c3/app/ui/src/types/types';
 import { Base } from '@c3/types';
 import { useSelectedState } from '@c3/ui/UiSdlUseData';
 import { fetchBaseById } from '@c3/app/ui/src/components/CRUDMethods/BaseCRUD';
-import { fetchAircraftCountWithFilter } from '@c3/app/ui/src/components/CRUDMethods/AircraftCRUD';
+import { fetchAircraftStatusRollup } from '@c3/app/ui/src/components/CRUDMethods/AircraftCRUD';
+import { fetchGroupedCounts } from '@c3/app/ui/src/components/CRUDMethods/MetricsCRUD';
 import KPIStatsContainer from '@c3/app/ui/src/components/stats/KPIStatsContainer';
 import KPIStatsTile from '@c3/app/ui/src/components/stats/KPIStatsTile';
 import AircraftPaginatedTable from '@c3/app/ui/src/components/table/AircraftPaginatedTable';
@@ -55,15 +56,22 @@ const AircraftBaseDetailsPage = () => {
                 'Ready', 'In Maintenance', 'Grounded', and 'Deployed'. Update the
                 component state with these counts.
         */
-        const readyCount = await fetchAircraftCountWithFilter(selectedBaseIdFromState, "status == 'Ready'");
-        const maintenanceCount = await fetchAircraftCountWithFilter(selectedBaseIdFromState, "status == 'In Maintenance'");
-        const groundedCount = await fetchAircraftCountWithFilter(selectedBaseIdFromState, "status == 'Grounded'");
-        const deployedCount = await fetchAircraftCountWithFilter(selectedBaseIdFromState, "status == 'Deployed'");
-
-        setNumReadyAircraft(readyCount);
-        setNumInMaintenanceAircraft(maintenanceCount);
-        setNumGroundedAircraft(groundedCount);
-        setNumDeployedAircraft(deployedCount);
+        // One lookup of the Base's rollup; without a rollup, the counts by status come from one grouped count
+        const rollup = await fetchAircraftStatusRollup(selectedBaseIdFromState);
+
+        if (rollup) {
+          setNumReadyAircraft(rollup.ready || 0);
+          setNumInMaintenanceAircraft(rollup.inMaintenance || 0);
+          setNumGroundedAircraft(rollup.grounded || 0);
+          setNumDeployedAircraft(rollup.deployed || 0);
+        } else {
+          const counts = await fetchGroupedCounts('Aircraft', `location.id == "${selectedBaseIdFromState}"`, 'status');
+
+          setNumReadyAircraft(counts['Ready'] || 0);
+          setNumInMaintenanceAircraft(counts['In Maintenance'] || 0);
+          setNumGroundedAircraft(counts['Grounded'] || 0);
+          setNumDeployedAircraft(counts['Deployed'] || 0);
+        }
       } catch (error) {
         console.error('An error occurred: ', error);
         setError(error.message);
@@ -9,8 +9,9 @@ import ContentSection from '@c3/app/ui/src/components/container/ContentSection';
 import {
   getEarliestOperationDate,
   getLatestEndDate,
-  fetchCountWithFilter,
+  fetchOperationStatusTotals,
 } from '@c3/app/ui/src/components/CRUDMethods/OperationCRUD';
+import { fetchGroupedCounts } from '@c3/app/ui/src/components/CRUDMethods/MetricsCRUD';
 import { getUniqueBaseIds } from '@c3/app/ui/src/components/CRUDMethods/BaseCRUD';
 import LoadingAnimation from '@c3/app/ui/src/components/misc/LoadingAnimation';
 import ErrorModal from '@c3/app/ui/src/components/misc/ErrorModal';
@@ -337,22 +338,24 @@ const AircraftOperationsPage = () => {
             : `destination == '${selectedDestinationId}'`;
         }
 
-        // Fetch all three counts in parallel for efficiency
-        const completedFilter = baseFilter ? `${baseFilter} && status == 'Completed'` : "status == 'Completed'";
+        // The daily rollups answer the unfiltered and start date filtered counts in a single fetch
+        if (!endDate && !selectedOriginId && !selectedDestinationId) {
+          const totals = await fetchOperationStatusTotals(startDate ? startDate.toISOString().split('T')[0] : undefined);
 
-        const inProgressFilter = baseFilter ? `${baseFilter} && status == 'In Progress'` : "status == 'In Progress'";
-
-        const plannedFilter = baseFilter ? `${baseFilter} && status == 'Planned'` : "status == 'Planned'";
+          if (totals) {
+            setCompletedCount(totals.completed);
+            setInProgressCount(totals.inProgress);
+            setPlannedCount(totals.planned);
+            return;
+          }
+        }
 
-        const [completed, inProgress, planned] = await Promise.all([
-          fetchCountWithFilter(completedFilter),
-          fetchCountWithFilter(inProgressFilter),
-          fetchCountWithFilter(plannedFilter),
-        ]);
+        // Otherwise all three counts come from one grouped count by status
+        const counts = await fetchGroupedCounts('Operation', baseFilter, 'status');
 
-        setCompletedCount(completed);
-        setInProgressCount(inProgress);
-        setPlannedCount(planned);
+        setCompletedCount(counts['Completed'] || 0);
+        setInProgressCount(counts['In Progress'] || 0);
+        setPlannedCount(counts['Planned'] || 0);
       } catch (error) {
         console.error('Error loading operation counts: ', error);
       }